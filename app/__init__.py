@@ -4,12 +4,24 @@ from app.extensions import db, migrate, bcrypt, jwt, ma, scheduler, mail
 from app.blueprints.blueprint import register_blueprints
 from instance.config import app_config
 from app.hooks import register_request_hooks
+from app.commands import register_commands
+from app.instrumentation import register_sql_instrumentation
+from app.metrics import register_metrics
+from app.profiling import register_request_profiler
 from utils.token_helpers import init_scheduler
+from utils.event_bus import register_event_bus
+from utils.alert_helpers import register_alert_evaluator
+from utils.counter_helpers import register_counter_listeners
+from utils.lifecycle_helpers import register_lifecycle_listeners
+from utils.cache_helpers import register_reference_cache
+from utils.audit_helpers import register_audit_log
 
 
-def create_app(config_name):
+def create_app(config_name, config_overrides=None):
     app = Flask(__name__, instance_relative_config=True)
     app.config.from_object(app_config[config_name])
+    if config_overrides:
+        app.config.update(config_overrides)
 
     CORS(app, resources={
         r"/*": {"origins": "http://localhost:3000"}},
@@ -17,6 +29,11 @@ def create_app(config_name):
 
     register_blueprints(app)
     register_request_hooks(app)
+    register_commands(app)
+    register_event_bus(app)
+    register_alert_evaluator()
+    register_counter_listeners()
+    register_lifecycle_listeners()
 
     db.init_app(app)
     migrate.init_app(app, db)
@@ -24,6 +41,11 @@ def create_app(config_name):
     jwt.init_app(app)
     ma.init_app(app)
     mail.init_app(app)
+    register_sql_instrumentation(app)
+    register_metrics(app)
+    register_request_profiler(app)
+    register_reference_cache(app)
+    register_audit_log(app)
 
     @jwt.invalid_token_loader
     def invalid_token_callback(reason):
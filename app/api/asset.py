@@ -1,14 +1,22 @@
 from flask import Blueprint, jsonify, request
 import traceback
 from flask_jwt_extended import jwt_required
-from sqlalchemy import and_
+from sqlalchemy import and_, insert, update
+from sqlalchemy.orm import joinedload
 from flask_jwt_extended import get_jwt_identity
 from marshmallow import ValidationError
-from app.models.v1 import (Asset, User, Location, Department, Status, Category,
-                           Consumables, Software)
+from app.models.v1 import (
+    Asset, AssetLifecycle, User, Location, Department, Status, Category)
 from app.extensions import db
-from utils.validations.asset_validate import RegAssetSchema, UpdateAssetSchema
-from sqlalchemy import func
+from utils.validations.asset_validate import (
+    RegAssetSchema, UpdateAssetSchema, BulkUpdateAssetSchema)
+from utils.asset_helpers import (
+    asset_name_base, allocate_asset_names, asset_timeline,
+    encode_timeline_cursor, decode_timeline_cursor)
+from utils.lifecycle_helpers import asset_change_events
+from utils.audit_helpers import audit_entries, audit_writer
+from utils.counter_helpers import (
+    read_counters, ASSETS, CONSUMABLE_UNITS, SOFTWARE)
 
 
 asset_bp = Blueprint("asset_bp", __name__)
@@ -264,6 +272,170 @@ def update_asset(asset_id):
             "error": f"An unexpected error occurred: {str(e)}"
         }), 500
 
+@asset_bp.route("/update/assets", methods=["PATCH"])
+@jwt_required()
+def bulk_update_assets():
+    """
+    Apply the same field changes to many assets at once.
+
+    Assets are selected by `asset_ids` or by `filters` (the same keys as
+    asset search), and `changes` may set status_id, location_id,
+    department_id and assigned_to. All selected assets are updated with a
+    single UPDATE ... WHERE id IN (...). Names are regenerated only for
+    assets whose location or department actually changes, using one
+    batched allocation; asset tags depend on the category alone and are
+    left untouched. A lifecycle event per changed attribute is written
+    with one batched insert, and audited fields are handed to the audit
+    writer after the commit, both from the values read before the update.
+
+    Returns:
+        - 200: Assets updated, with updated and renamed counts.
+        - 400: Validation error.
+        - 404: No matching assets found.
+        - 415: Unsupported Media Type.
+        - 500: Internal server error.
+    """
+    try:
+        if not request.is_json:
+            return jsonify({
+                "error":
+                "Unsupported Media Type: Content-Type must be application/json"
+            }), 415
+
+        current_user = db.session.get(User, get_jwt_identity())
+        update_info = BulkUpdateAssetSchema().load(request.get_json())
+        changes = update_info["changes"]
+
+        query = db.session.query(
+            Asset.id, Asset.category_id, Asset.location_id,
+            Asset.department_id, Asset.status_id, Asset.assigned_to
+        ).filter(Asset.domain_id == current_user.domain_id)
+
+        if "asset_ids" in update_info:
+            query = query.filter(Asset.id.in_(update_info["asset_ids"]))
+        else:
+            query = (
+                query
+                .join(User, Asset.assigned_to == User.id, isouter=True)
+                .join(Category, Asset.category_id == Category.id, isouter=True)
+                .join(Location, Asset.location_id == Location.id, isouter=True)
+                .join(
+                    Department,
+                    Asset.department_id == Department.id, isouter=True)
+            )
+            mapping = {
+                "name": Asset.name,
+                "asset_tag": Asset.asset_tag,
+                "serial_number": Asset.serial_number,
+                "model_number": Asset.model_number,
+                "category": Category.name,
+                "assigned_to": User.fullname,
+                "location": Location.name,
+                "department": Department.name,
+            }
+            query = query.filter(and_(*[
+                mapping[key].ilike(f"%{value}%")
+                for key, value in update_info["filters"].items()
+            ]))
+
+        assets = query.all()
+        if not assets:
+            return jsonify({
+                "error": "No matching assets found for update"}), 404
+
+        db.session.execute(
+            update(Asset)
+            .where(Asset.id.in_([asset.id for asset in assets]))
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
+        lifecycle_rows = [
+            row for asset in assets for row in asset_change_events(
+                asset.id, current_user.domain_id, {
+                    field: (getattr(asset, field), value)
+                    for field, value in changes.items()
+                })
+        ]
+        if lifecycle_rows:
+            db.session.execute(insert(AssetLifecycle), lifecycle_rows)
+        audited = [
+            entry for asset in assets for entry in audit_entries(
+                Asset, asset.id, current_user.domain_id, {
+                    field: (getattr(asset, field), value)
+                    for field, value in changes.items()
+                })
+        ]
+
+        to_rename = [
+            asset for asset in assets
+            if any(
+                field in changes and changes[field] != getattr(asset, field)
+                for field in ("location_id", "department_id")
+            )
+        ]
+        renamed_ids, base_names = [], []
+        if to_rename:
+            location_ids = {
+                changes.get("location_id", asset.location_id)
+                for asset in to_rename
+            }
+            department_ids = {
+                changes.get("department_id", asset.department_id)
+                for asset in to_rename
+            }
+            category_ids = {asset.category_id for asset in to_rename}
+            locations = {
+                location.id: location for location in
+                Location.query.filter(Location.id.in_(location_ids)).all()
+            }
+            departments = {
+                department.id: department for department in
+                Department.query.filter(
+                    Department.id.in_(department_ids)).all()
+            }
+            categories = {
+                category.id: category for category in
+                Category.query.filter(Category.id.in_(category_ids)).all()
+            }
+            for asset in to_rename:
+                location = locations.get(
+                    changes.get("location_id", asset.location_id))
+                department = departments.get(
+                    changes.get("department_id", asset.department_id))
+                category = categories.get(asset.category_id)
+                if not (location and department and category):
+                    continue
+                base_name = asset_name_base(location, department, category)
+                if base_name:
+                    renamed_ids.append(asset.id)
+                    base_names.append(base_name)
+
+        if renamed_ids:
+            names = allocate_asset_names(
+                base_names, current_user.domain_id)
+            db.session.execute(update(Asset), [
+                {"id": asset_id, "name": name}
+                for asset_id, name in zip(renamed_ids, names)
+            ])
+
+        db.session.commit()
+        if audited:
+            audit_writer().submit(audited)
+        return jsonify({
+            "message": "Assets updated successfully",
+            "updated": len(assets),
+            "renamed": len(renamed_ids)
+        }), 200
+
+    except ValidationError as err:
+        return jsonify({"error": err.messages}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"
+        }), 500
+
+
 @asset_bp.route("/assets", methods=["GET"])
 @jwt_required()
 def get_all_asset():
@@ -275,7 +447,11 @@ def get_all_asset():
     """
     try:
         current_user = db.session.get(User, get_jwt_identity())
-        assets = Asset.query.filter_by(domain_id=current_user.domain_id).all()
+        assets = Asset.query.options(
+            joinedload(Asset.category), joinedload(Asset.user),
+            joinedload(Asset.location), joinedload(Asset.department),
+            joinedload(Asset.status)
+        ).filter_by(domain_id=current_user.domain_id).all()
         return jsonify({
             "assets": [a.to_dict() for a in assets],
             "total": len(assets)
@@ -356,6 +532,10 @@ def get_inventory_counts():
     Retrieve total counts of assets, consumables, and software
     filtered by the current user's domain.
 
+    The totals come from the domain's counters, which are maintained in
+    the same transaction as every change to the counted rows, so the
+    dashboard never scans the underlying tables.
+
     Returns:
         - 200 OK: JSON with domain-specific totals.
         - 401 Unauthorized: If user not found.
@@ -367,21 +547,59 @@ def get_inventory_counts():
 
         if not current_user:
             return jsonify({"error": "User not found"}), 401
-        total_assets = Asset.query.filter_by(
-            domain_id=current_user.domain_id).count()
-        total_consumables = (
-            db.session.query(func.sum(Consumables.quantity))
-            .filter(Consumables.domain_id == current_user.domain_id)
-            .scalar()
-        ) or 0
-        
-        total_software = Software.query.filter_by(
-            domain_id=current_user.domain_id).count()
+        counters = read_counters(current_user.domain_id)
+
+        return jsonify({
+            "totalAssets": counters[ASSETS],
+            "totalConsumables": counters[CONSUMABLE_UNITS],
+            "totalSoftware": counters[SOFTWARE]
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"
+        }), 500
+
+
+@asset_bp.route("/assets/<int:asset_id>/timeline", methods=["GET"])
+@jwt_required()
+def get_asset_timeline(asset_id):
+    """
+    Retrieve an asset's lifecycle, transfer, loan, maintenance and ticket
+    events as one timeline, newest first.
+
+    Query Parameters:
+        - limit (int, optional): Events per page, 1 to 100 (default 20).
+        - cursor (str, optional): `next_cursor` of the previous page.
+
+    Returns:
+        - 200 OK: JSON with the events and the cursor of the next page,
+          null on the last page.
+        - 400 Bad Request: Invalid cursor.
+        - 404 Not Found: Asset not found in the user's domain.
+        - 500 Internal Server Error: On unexpected failure.
+    """
+    try:
+        current_user = db.session.get(User, get_jwt_identity())
+        asset = Asset.query.filter_by(
+            domain_id=current_user.domain_id, id=asset_id).first()
+        if not asset:
+            return jsonify({"error": "Asset not found or unauthorized"}), 404
+
+        limit = min(max(request.args.get("limit", 20, type=int), 1), 100)
+        cursor = request.args.get("cursor")
+        try:
+            cursor = decode_timeline_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
+        events, has_more = asset_timeline(asset.id, limit, cursor)
         return jsonify({
-            "totalAssets": total_assets,
-            "totalConsumables": total_consumables,
-            "totalSoftware": total_software
+            "asset_id": asset.id,
+            "events": events,
+            "next_cursor":
+                encode_timeline_cursor(events[-1]) if has_more else None,
         }), 200
 
     except Exception as e:
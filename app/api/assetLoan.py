@@ -3,9 +3,10 @@ import traceback
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import ValidationError
 from datetime import datetime
+from sqlalchemy.orm import joinedload
 from app.extensions import db
-from app.models.v1 import (AssetLoan, Asset, User, ExternalMaintenance,
-                           AssetLifecycle)
+from app.models.v1 import AssetLoan, Asset, User, ExternalMaintenance
+from utils.loan_helpers import ACTIVE_LOAN_STATUSES
 from utils.validations.asset_loan_validate import (
     AssetLoanCreateSchema, AssetLoanUpdateSchema)
 
@@ -25,8 +26,9 @@ def create_asset_loan():
         if not asset or asset.domain_id != current_user.domain_id:
             return jsonify({"error": "Asset not found or unauthorized."}), 404
         
-        active_loan = AssetLoan.query.filter_by(
-            asset_id=asset.id, status="BORROWED"
+        active_loan = AssetLoan.query.filter(
+            AssetLoan.asset_id == asset.id,
+            AssetLoan.status.in_(ACTIVE_LOAN_STATUSES)
         ).first()
         if active_loan:
             return jsonify({
@@ -51,15 +53,8 @@ def create_asset_loan():
             remarks=validated.get("remarks"),
             domain_id=current_user.domain_id
         )
-        
-        new_alc = AssetLifecycle(
-            asset_id=validated["asset_id"],
-            event="Asset loan",
-            notes=validated["condition_before"],
-            domain_id=current_user.domain_id
-        )
 
-        db.session.add_all([new_loan, new_alc])
+        db.session.add(new_loan)
         db.session.commit()
         return jsonify({
             "message": "Asset loan created successfully.",
@@ -79,8 +74,9 @@ def get_asset_loans():
     """Retrieve all asset loans for the current user's domain."""
     try:
         current_user = db.session.get(User, get_jwt_identity())
-        loans = AssetLoan.query.filter_by(
-            domain_id=current_user.domain_id).all()
+        loans = AssetLoan.query.options(
+            joinedload(AssetLoan.asset), joinedload(AssetLoan.borrower)
+        ).filter_by(domain_id=current_user.domain_id).all()
         return jsonify({
             "asset_loans": [loan.to_dict() for loan in loans]
         }), 200
@@ -162,13 +158,16 @@ def list_asset_loans():
     Retrieve asset loans with optional filters:
         - borrower_id: int
         - asset_id: int
-        - status: SENT/RETURNED/OVERDUE
-        - overdue: bool (true/false)
+        - status: BORROWED/RETURNED/OVERDUE
+        - overdue: bool (true/false), loans flagged OVERDUE by the
+          scheduled sweep
         - start_date, end_date: filter loans created between dates (YYYY-MM-DD)
     """
     try:
         current_user = db.session.get(User, get_jwt_identity())
-        query = AssetLoan.query.filter_by(domain_id=current_user.domain_id)
+        query = AssetLoan.query.options(
+            joinedload(AssetLoan.asset), joinedload(AssetLoan.borrower)
+        ).filter_by(domain_id=current_user.domain_id)
 
         # Filters
         borrower_id = request.args.get("borrower_id", type=int)
@@ -185,10 +184,7 @@ def list_asset_loans():
         if status:
             query = query.filter_by(status=status.upper())
         if overdue and overdue.lower() == "true":
-            query = query.filter(
-                AssetLoan.expected_return_date < datetime.utcnow(),
-                AssetLoan.actual_return_date.is_(None)
-            )
+            query = query.filter(AssetLoan.status == "OVERDUE")
         if start_date:
             query = query.filter(
                 AssetLoan.loan_date >= datetime.strptime(start_date, "%Y-%m-%d"))
@@ -202,8 +198,8 @@ def list_asset_loans():
         result = []
         for loan in loans:
             loan_dict = loan.to_dict()  
-            asset = db.session.get(Asset, loan.asset_id)
-            borrower = db.session.get(User, loan.borrower_id)
+            asset = loan.asset
+            borrower = loan.borrower
             loan_dict["asset"] = {
                 "name": asset.name if asset else None,
                 "serial_no": asset.serial_number if asset else None,
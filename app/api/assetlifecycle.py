@@ -1,9 +1,11 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import ValidationError
+from sqlalchemy.orm import joinedload
 from app.extensions import db
 from app.models.v1 import AssetLifecycle, Asset, User
 from utils.validations.alc_validate import RegAlcSchema, UpdateAlcSchema
+from utils.archive_helpers import with_archive
 
 alc_bp = Blueprint("als_bp", __name__)
 
@@ -48,8 +50,9 @@ def create_alc():
 def get_all_asset_lifecycles():
     try:
         current_user = get_current_user()
-        events = AssetLifecycle.query.filter_by(
-            domain_id=current_user.domain_id).all()
+        events = AssetLifecycle.query.options(
+            joinedload(AssetLifecycle.asset)
+        ).filter_by(domain_id=current_user.domain_id).all()
         return jsonify([event.to_dict() for event in events]), 200
     except Exception as e:
         return jsonify({
@@ -75,14 +78,21 @@ def get_asset_lifecycle(event_id):
 @alc_bp.route("/assets/<int:asset_id>/lifecycles", methods=["GET"])
 @jwt_required()
 def get_asset_lifecycles_by_asset(asset_id):
+    """
+    Full lifecycle history of one asset, archived events included; both
+    tables are read through their (asset_id, created_at) index.
+    """
     try:
         current_user = get_current_user()
         asset = Asset.query.get(asset_id)
         if not asset:
             return jsonify({"error": f"Asset with id {asset_id} not found."}), 404
 
-        events = AssetLifecycle.query.filter_by(
-            asset_id=asset_id, domain_id=current_user.domain_id).all()
+        history = with_archive(AssetLifecycle)
+        events = db.session.query(history).filter(
+            history.asset_id == asset_id,
+            history.domain_id == current_user.domain_id
+        ).order_by(history.created_at, history.id).all()
         return jsonify([event.to_dict() for event in events]), 200
     except Exception as e:
         return jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500
@@ -1,10 +1,14 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, current_app
 import traceback
 from marshmallow import ValidationError
+from sqlalchemy import insert, update
+from sqlalchemy.orm import joinedload
 from app.extensions import db
 from app.models.v1 import AssetTransfer, Asset, User, AssetLifecycle
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from utils.validations.at_validate import RegATSchema, UpdateATSchema
+from utils.validations.at_validate import (
+    RegATSchema, UpdateATSchema, BulkATSchema)
+from utils.audit_helpers import audit_entries, audit_writer
 
 at_bp = Blueprint("at_bp", __name__)
 
@@ -67,19 +71,13 @@ def create_assettransfer():
             notes=assettransfer_info["notes"],
             domain_id = current_user.domain_id
         )
-        new_alc = AssetLifecycle(
-            asset_id=assettransfer_info["asset_id"],
-            event="Asset transfer",
-            notes=assettransfer_info["notes"],
-            domain_id = current_user.domain_id
-        )
         new_user = db.session.get(User, assettransfer_info["transferred_to"])
         if not new_user:
             return jsonify({"error": "Receiving user not found."}), 404
         asset.assigned_to = assettransfer_info["transferred_to"]
         asset.location_id = assettransfer_info["to_location_id"]
         asset.department_id = new_user.department_id
-        db.session.add_all([new_assettransfer, new_alc])
+        db.session.add(new_assettransfer)
         db.session.commit()
         return jsonify({
             "message": "AssetTransfer registered successfully!",
@@ -98,6 +96,143 @@ def create_assettransfer():
         }), 500
 
 
+@at_bp.route('/assettransfer/bulk', methods=['POST'])
+@jwt_required()
+def bulk_assettransfer():
+    """
+    Bulk AssetTransfer
+    POST /assettransfer/bulk
+    Moves every asset matched by a selector to a destination, e.g. when a
+    whole room or department relocates. Assets are updated with one
+    set-based UPDATE per chunk, and the matching AssetTransfer and
+    AssetLifecycle rows are batch-inserted here, as Core statements bypass
+    the ORM lifecycle and audit hooks; reassignments are handed to the
+    audit writer once their chunk commits. Each chunk commits on its own
+    so row locks stay short.
+
+    Request Body (JSON):
+      - asset_ids (list[int]) | location_id (int) | assigned_to (int):
+        exactly one selector.
+      - to_location_id (int, required): Destination location.
+      - transferred_to (int, optional): Receiving user. Assets keep their
+        current assignee when omitted.
+      - notes (str, required): Transfer details.
+
+    Responses:
+      201: Summary of transferred and skipped assets.
+      400: Validation errors in the request.
+      404: No matching assets found.
+      415: Content-Type must be application/json.
+      500: Internal server error.
+
+    Security:
+      JWT required.
+    """
+    transferred = 0
+    try:
+        if not request.is_json:
+            return jsonify({
+                "error":
+                "Unsupported Media Type. Content-Type" +
+                    " must be application/json."
+            }), 415
+        current_user = db.session.get(User, get_jwt_identity())
+        transfer_info = BulkATSchema().load(request.get_json())
+
+        query = db.session.query(
+            Asset.id, Asset.location_id, Asset.assigned_to
+        ).filter(Asset.domain_id == current_user.domain_id)
+        if transfer_info.get("asset_ids"):
+            query = query.filter(Asset.id.in_(transfer_info["asset_ids"]))
+        elif transfer_info.get("location_id") is not None:
+            query = query.filter(
+                Asset.location_id == transfer_info["location_id"])
+        else:
+            query = query.filter(
+                Asset.assigned_to == transfer_info["assigned_to"])
+        assets = query.order_by(Asset.id).all()
+        if not assets:
+            return jsonify({
+                "error": "No matching assets found for transfer"}), 404
+
+        to_location_id = transfer_info["to_location_id"]
+        receiver = None
+        if transfer_info.get("transferred_to") is not None:
+            receiver = db.session.get(User, transfer_info["transferred_to"])
+
+        values = {"location_id": to_location_id}
+        if receiver:
+            values["assigned_to"] = receiver.id
+            values["department_id"] = receiver.department_id
+
+        pending = [
+            asset for asset in assets
+            if asset.location_id != to_location_id
+            or (receiver and asset.assigned_to != receiver.id)
+        ]
+        chunk_size = current_app.config.get("BULK_TRANSFER_CHUNK_SIZE", 500)
+        chunks = 0
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            db.session.execute(insert(AssetTransfer), [
+                {
+                    "asset_id": asset.id,
+                    "from_location_id": asset.location_id,
+                    "to_location_id": to_location_id,
+                    "transferred_from": asset.assigned_to,
+                    "transferred_to":
+                        receiver.id if receiver else asset.assigned_to,
+                    "notes": transfer_info["notes"],
+                    "domain_id": current_user.domain_id
+                } for asset in chunk
+            ])
+            db.session.execute(insert(AssetLifecycle), [
+                {
+                    "asset_id": asset.id,
+                    "event": "Asset transfer",
+                    "notes": transfer_info["notes"],
+                    "domain_id": current_user.domain_id
+                } for asset in chunk
+            ])
+            db.session.execute(
+                update(Asset)
+                .where(Asset.id.in_([asset.id for asset in chunk]))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            if receiver:
+                audited = [
+                    entry for asset in chunk for entry in audit_entries(
+                        Asset, asset.id, current_user.domain_id,
+                        {"assigned_to": (asset.assigned_to, receiver.id)})
+                ]
+                if audited:
+                    audit_writer().submit(audited)
+            transferred += len(chunk)
+            chunks += 1
+
+        return jsonify({
+            "message": "Bulk asset transfer completed successfully!",
+            "matched": len(assets),
+            "transferred": transferred,
+            "skipped": len(assets) - len(pending),
+            "chunks": chunks
+        }), 201
+    except ValidationError as err:
+        return jsonify({
+            "errors": err.messages
+        }), 400
+    except Exception as e:
+        db.session.rollback()
+        print("Exception occurred:")
+        traceback.print_exc()
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}",
+            "transferred": transferred
+        }), 500
+
+
 @at_bp.route('/assettransfers', methods=['GET'])
 @jwt_required()
 def get_all_asset_transfers():
@@ -113,8 +248,14 @@ def get_all_asset_transfers():
     try:
         current_user = db.session.get(User, get_jwt_identity())
         
-        asset_transfers = AssetTransfer.query.filter_by(
-            domain_id=current_user.domain_id).all()
+        asset_transfers = AssetTransfer.query.options(
+            joinedload(AssetTransfer.asset),
+            joinedload(AssetTransfer.from_location),
+            joinedload(AssetTransfer.to_location),
+            joinedload(AssetTransfer.sender),
+            joinedload(AssetTransfer.receiver),
+            joinedload(AssetTransfer.domain)
+        ).filter_by(domain_id=current_user.domain_id).all()
         asset_transfer_list = [
             transfer.to_dict() for transfer in asset_transfers
         ]
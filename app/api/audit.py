@@ -0,0 +1,87 @@
+from datetime import datetime
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.extensions import db
+from app.models.v1 import AuditLog, User
+from utils.token_helpers import admin_required
+
+audit_bp = Blueprint("audit_bp", __name__)
+
+
+def _parse_moment(value, end_of_day=False):
+    """Parse an ISO date or datetime; a bare end date covers the day."""
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value)
+    if end_of_day and len(value) == 10:
+        moment = moment.replace(
+            hour=23, minute=59, second=59, microsecond=999999)
+    return moment
+
+
+@audit_bp.route("/audit-log", methods=["GET"])
+@jwt_required()
+@admin_required
+def list_audit_log():
+    """
+    List audited field changes in the admin's domain, newest first.
+
+    Query Parameters:
+        - entity (str, optional): Table name, e.g. "assets" or "software".
+        - entity_id (int, optional): Row of that entity.
+        - user_id (int, optional): User who made the change.
+        - start (str, optional): ISO date or datetime, inclusive.
+        - end (str, optional): ISO date or datetime, inclusive.
+        - page (int, optional): Page number (default 1).
+        - per_page (int, optional): Entries per page (default 50).
+
+    Returns:
+        - 200 OK: Paginated audit entries.
+        - 400 Bad Request: Invalid start or end.
+        - 403 Forbidden: Caller is not an admin.
+        - 500 Internal Server Error: On unexpected failure.
+    """
+    try:
+        current_user = db.session.get(User, get_jwt_identity())
+        page = request.args.get("page", 1, type=int)
+        per_page = min(request.args.get("per_page", 50, type=int), 200)
+        entity = request.args.get("entity")
+        entity_id = request.args.get("entity_id", type=int)
+        user_id = request.args.get("user_id", type=int)
+
+        query = AuditLog.query.filter(
+            AuditLog.domain_id == current_user.domain_id)
+        if entity:
+            query = query.filter(AuditLog.entity == entity)
+        if entity_id is not None:
+            query = query.filter(AuditLog.entity_id == entity_id)
+        if user_id is not None:
+            query = query.filter(AuditLog.user_id == user_id)
+        try:
+            start = _parse_moment(request.args.get("start"))
+            end = _parse_moment(request.args.get("end"), end_of_day=True)
+        except ValueError:
+            return jsonify({
+                "error": "Invalid start or end. Use an ISO date or datetime."
+            }), 400
+        if start:
+            query = query.filter(AuditLog.changed_at >= start)
+        if end:
+            query = query.filter(AuditLog.changed_at <= end)
+
+        entries = query.order_by(
+            AuditLog.changed_at.desc(), AuditLog.id.desc()
+        ).paginate(page=page, per_page=per_page, error_out=False)
+        return jsonify({
+            "entries": [entry.to_dict() for entry in entries.items],
+            "total": entries.total,
+            "page": entries.page,
+            "per_page": entries.per_page,
+            "pages": entries.pages,
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"
+        }), 500
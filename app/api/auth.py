@@ -3,10 +3,14 @@ from flask_jwt_extended import (create_access_token, create_refresh_token,
                                 jwt_required, get_jwt, get_jwt_identity,
                                 set_refresh_cookies, set_access_cookies,
                                 unset_jwt_cookies,)
+import csv
+import io
 import secrets
 import traceback
 import redis
 import string
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload
 from flask_mail import Message
 from datetime import datetime, timezone
 from app.models.v1 import User, Department, Role, Domain, RevokedToken
@@ -15,10 +19,13 @@ from marshmallow import ValidationError
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from utils.validations.auth_validate import (
-    RegUserSchema,
+    RegUserSchema, BulkUserSchema,
     LoginSchema, UpdateUserSchema, UpdatePasswordSchema)
 from utils.token_helpers import is_token_revoked, admin_required
-from utils.email_helper import send_welcome_email, send_password_changed_email
+from utils.metrics import instrument_redis
+from utils.email_helper import (send_welcome_email, send_password_changed_email,
+                                send_bulk_welcome_emails)
+from utils.password_helpers import generate_raw_password, hash_passwords
 
 
 auth_bp = Blueprint("auth", __name__)
@@ -27,11 +34,11 @@ BLACKLIST_PREFIX = "jwt_blacklist_"
 limiter = Limiter(
     get_remote_address, app=app, default_limits=["200 per day", "50 per hour"])
 
-redis_client = redis.Redis(
+redis_client = instrument_redis(redis.Redis(
                 host='127.0.0.1',
                 port=6379,
                 decode_responses=True
-        )
+        ))
 
 @auth_bp.route('/auth/register', methods=['POST'])
 @jwt_required()
@@ -97,6 +104,169 @@ def create_user():
         }), 500
 
 
+@auth_bp.route('/auth/register/bulk', methods=['POST'])
+@jwt_required()
+@admin_required
+def bulk_create_users():
+    """
+    Provision many users at once from a JSON list or a CSV upload.
+
+    Accepts either a JSON list (or {"users": [...]}) or CSV with the columns
+    fullname, email, payroll_no, role_id, department_id and optionally
+    is_active, sent as a `file` upload or a text/csv body. Email and payroll
+    uniqueness are checked with one query each, passwords are hashed in a
+    process pool, users are inserted in batches and welcome emails are
+    queued over a single SMTP connection. Nothing is created if any row is
+    invalid.
+
+    Returns:
+        - 201: Users created.
+        - 400: Validation errors, keyed by row index.
+        - 415: Unsupported Media Type.
+        - 500: Internal server error.
+    """
+    try:
+        if request.is_json:
+            payload = request.get_json()
+            rows = payload.get("users") if isinstance(payload, dict) \
+                else payload
+        elif "file" in request.files or request.mimetype == "text/csv":
+            raw = request.files["file"].read() if "file" in request.files \
+                else request.get_data()
+            reader = csv.DictReader(io.StringIO(raw.decode("utf-8-sig")))
+            rows = [
+                {
+                    key.strip(): value.strip()
+                    for key, value in row.items()
+                    if key and value and value.strip()
+                } for row in reader
+            ]
+        else:
+            return jsonify({
+                "error":
+                    "Unsupported Media Type. Content-Type must be " +
+                    "application/json or text/csv."
+            }), 415
+
+        if not isinstance(rows, list) or not rows:
+            return jsonify({"error": "Provide at least one user."}), 400
+        max_rows = app.config.get("BULK_USER_MAX_ROWS", 1000)
+        if len(rows) > max_rows:
+            return jsonify({
+                "error": f"A maximum of {max_rows} users can be imported " +
+                         "per request."
+            }), 400
+
+        users = BulkUserSchema(many=True).load(rows)
+
+        errors = {}
+
+        def add_error(index, field, message):
+            errors.setdefault(str(index), {}).setdefault(
+                field, []).append(message)
+
+        emails, payroll_numbers = {}, {}
+        for index, user in enumerate(users):
+            if user["email"] in emails:
+                add_error(index, "email", "Duplicate email in request payload.")
+            if user["payroll_no"] in payroll_numbers:
+                add_error(
+                    index, "payroll_no",
+                    "Duplicate payroll no in request payload.")
+            emails.setdefault(user["email"], index)
+            payroll_numbers.setdefault(user["payroll_no"], index)
+
+        existing_emails = {
+            row.email for row in db.session.query(User.email).filter(
+                User.email.in_(emails.keys()))
+        }
+        existing_payroll = {
+            row.payroll_no for row in db.session.query(User.payroll_no).filter(
+                User.payroll_no.in_(payroll_numbers.keys()))
+        }
+        known_roles = {
+            row.id for row in db.session.query(Role.id).filter(
+                Role.id.in_({user["role_id"] for user in users}))
+        }
+        known_departments = {
+            row.id for row in db.session.query(Department.id).filter(
+                Department.id.in_({user["department_id"] for user in users}))
+        }
+        for index, user in enumerate(users):
+            if user["email"] in existing_emails:
+                add_error(index, "email", "Email already registered.")
+            if user["payroll_no"] in existing_payroll:
+                add_error(index, "payroll_no", "Invalid payroll no")
+            if user["role_id"] not in known_roles:
+                add_error(
+                    index, "role_id",
+                    f"Role with id {user['role_id']} does not exist.")
+            if user["department_id"] not in known_departments:
+                add_error(
+                    index, "department_id",
+                    f"Department with id {user['department_id']} " +
+                    "does not exist.")
+        if errors:
+            return jsonify({"errors": errors}), 400
+
+        current_user_id = get_jwt_identity()
+        current_user = db.session.get(User, current_user_id)
+        raw_passwords = [generate_raw_password() for _ in users]
+        hashed_passwords = hash_passwords(
+            raw_passwords,
+            rounds=app.config.get("BCRYPT_LOG_ROUNDS", 12),
+            workers=app.config.get("BULK_HASH_WORKERS"))
+        changed_at = datetime.now(timezone.utc)
+        new_users = [
+            {
+                "email": user["email"],
+                "password": hashed_password,
+                "fullname": user["fullname"],
+                "department_id": user["department_id"],
+                "payroll_no": user["payroll_no"],
+                "role_id": user["role_id"],
+                "domain_id": current_user.domain_id,
+                "is_active": bool(user.get("is_active", 1)),
+                "must_change_password": True,
+                "password_changed_by": current_user.id,
+                "password_changed_at": changed_at
+            } for user, hashed_password in zip(users, hashed_passwords)
+        ]
+        chunk_size = app.config.get("BULK_INSERT_CHUNK_SIZE", 500)
+        for start in range(0, len(new_users), chunk_size):
+            db.session.execute(
+                insert(User), new_users[start:start + chunk_size])
+        db.session.commit()
+
+        send_bulk_welcome_emails([
+            (user["fullname"], user["email"], raw_password)
+            for user, raw_password in zip(users, raw_passwords)
+        ])
+
+        return jsonify({
+            "message": f"{len(new_users)} users registered successfully! " +
+                       "Login credentials are being sent by email.",
+            "created": len(new_users),
+            "users": [
+                {
+                    "name": user["fullname"],
+                    "email": user["email"],
+                    "payroll_no": user["payroll_no"]
+                } for user in users
+            ]
+        }), 201
+
+    except ValidationError as err:
+        return jsonify({"errors": err.messages}), 400
+    except Exception as e:
+        print("Exception occurred:")
+        traceback.print_exc()
+        db.session.rollback()
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"
+        }), 500
+
+
 @auth_bp.route('/auth/login', methods=['POST'])
 @limiter.limit("5 per minute")
 def login():
@@ -423,12 +593,13 @@ def get_all_users():
     """
     try:
         current_user = db.session.get(User, get_jwt_identity())
-        users = User.query.filter_by(domain_id=current_user.domain_id).all()
+        users = User.query.options(
+            joinedload(User.department), joinedload(User.role)
+        ).filter_by(domain_id=current_user.domain_id).all()
         user_list = []
         for user in users:
-            department = db.session.get(
-                Department, user.department_id) if user.department_id else None
-            role = db.session.get(Role, user.role_id) if user.role_id else None
+            department = user.department
+            role = user.role
             user_list.append({
                 "id": user.id,
                 "fullname": user.fullname,
@@ -4,6 +4,7 @@ from app.extensions import db
 from app.models.v1 import Category, User
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.validations.cat_validate import RegCatSchema, UpdateCatSchema
+from utils.cache_helpers import cached_reference
 
 
 cat_bp = Blueprint("cat_bp", __name__)
@@ -145,6 +146,7 @@ def get_category(category_id):
 
 @cat_bp.route('/categories', methods=['GET'])
 @jwt_required()
+@cached_reference("categories")
 def get_all_categories():
     """
     Retrieve all categories.
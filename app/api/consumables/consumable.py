@@ -1,10 +1,16 @@
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
+from datetime import datetime, time, timedelta
+import numpy as np
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import select, func
 from app.extensions import db, ma
 from app.models.v1 import Consumables, User
 from utils.validations.consumables.con_validate import (
     RegConSchema, UpdateConSchema)
+from utils.stock_helpers import stock_as_of
+from utils.forecast_helpers import (
+    load_out_history, burn_rates, forecast_stockouts)
 
 
 consumables_bp = Blueprint("consumables_bp", __name__)
@@ -196,6 +202,145 @@ def get_all_consumable(location_id):
         }), 500
 
 
+@consumables_bp.route('/consumables/stock/as-of', methods=['GET'])
+@jwt_required()
+def get_stock_as_of():
+    """
+    Reports the stock of each consumable at the end of a given day.
+    Quantities are read from the nearest stock snapshot and only the
+    ledger rows recorded after it are applied, so the cost does not grow
+    with the full transaction history.
+    Query Parameters:
+        date (str): The day to report, in YYYY-MM-DD format.
+        location_id (int, optional): Restrict to one location.
+    Returns:
+        Response (JSON):
+            - 200 OK: Quantities per consumable as of the date.
+            - 400 Bad Request: Missing or invalid date.
+            - 500 Internal Server Error: For unexpected errors
+                during processing.
+    """
+    try:
+        date_arg = request.args.get('date', type=str)
+        if not date_arg:
+            return jsonify({"error": "The 'date' parameter is required."}), 400
+        try:
+            as_of = datetime.combine(
+                datetime.strptime(date_arg, "%Y-%m-%d").date(), time.max)
+        except ValueError:
+            return jsonify({
+                "error": "Invalid date format. Use YYYY-MM-DD."}), 400
+
+        current_user = db.session.get(User, get_jwt_identity())
+        query = Consumables.query.filter_by(domain_id=current_user.domain_id)
+        location_id = request.args.get('location_id', type=int)
+        if location_id:
+            query = query.filter_by(location_id=location_id)
+        consumables = query.order_by(Consumables.name).all()
+
+        quantities = stock_as_of(
+            as_of, [consumable.id for consumable in consumables])
+        return jsonify({
+            "as_of": date_arg,
+            "consumables": [
+                {
+                    "id": consumable.id,
+                    "name": consumable.name,
+                    "unit_of_measure": consumable.unit_of_measure,
+                    "quantity": quantities.get(consumable.id, 0)
+                } for consumable in consumables
+            ]
+        }), 200
+    except Exception as e:
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"}), 500
+
+
+@consumables_bp.route('/consumables/forecast', methods=['GET'])
+@jwt_required()
+def forecast_consumables():
+    """
+    Forecasts stockout dates and reorder quantities for every consumable.
+    The domain's daily OUT history is loaded from the consumption rollups
+    in one query and burn rates are computed for all consumables at once
+    with NumPy.
+    Query Parameters:
+        method (str, optional): "ewma" (default) or "sma".
+        history_days (int, optional): Days of history to use (default 90).
+        lead_time_days (int, optional): Replenishment lead time (default 7).
+        coverage_days (int, optional): Days an order should cover
+            (default 30).
+    Returns:
+        Response (JSON):
+            - 200 OK: Forecast per consumable, soonest stockout first.
+            - 400 Bad Request: Invalid parameters.
+            - 500 Internal Server Error: For unexpected errors
+                during processing.
+    """
+    try:
+        method = request.args.get('method', 'ewma', type=str)
+        if method not in ("ewma", "sma"):
+            return jsonify({
+                "error": "Invalid method. Use 'ewma' or 'sma'."}), 400
+        history_days = request.args.get('history_days', 90, type=int)
+        lead_time_days = request.args.get('lead_time_days', 7, type=int)
+        coverage_days = request.args.get('coverage_days', 30, type=int)
+        if not 1 <= history_days <= 730:
+            return jsonify({
+                "error": "history_days must be between 1 and 730."}), 400
+        if lead_time_days < 0 or coverage_days < 0:
+            return jsonify({
+                "error":
+                "lead_time_days and coverage_days cannot be negative."
+            }), 400
+
+        current_user = db.session.get(User, get_jwt_identity())
+        # The rollups are keyed by the database's date, not the app's.
+        today = db.session.scalar(select(func.current_date()))
+        start = today - timedelta(days=history_days - 1)
+        consumables, history = load_out_history(
+            current_user.domain_id, start, history_days)
+        quantities = np.array(
+            [row.quantity for row in consumables], dtype=float)
+        reorder_levels = np.array(
+            [row.reorder_level for row in consumables], dtype=float)
+        rates = burn_rates(history, method=method)
+        days_to_stockout, days_to_reorder, suggested = forecast_stockouts(
+            quantities, reorder_levels, rates, lead_time_days, coverage_days)
+
+        def _date_after(days):
+            if not np.isfinite(days):
+                return None
+            return (today + timedelta(days=int(days))).isoformat()
+
+        forecast = [
+            {
+                "id": row.id,
+                "name": row.name,
+                "quantity": row.quantity,
+                "reorder_level": row.reorder_level,
+                "daily_burn_rate": round(float(rates[i]), 3),
+                "days_until_stockout": round(float(days_to_stockout[i]), 1)
+                if np.isfinite(days_to_stockout[i]) else None,
+                "predicted_stockout_date": _date_after(days_to_stockout[i]),
+                "reorder_by": _date_after(days_to_reorder[i]),
+                "suggested_reorder_quantity": int(suggested[i])
+            }
+            for i, row in enumerate(consumables)
+        ]
+        forecast.sort(key=lambda item: (
+            item["days_until_stockout"] is None,
+            item["days_until_stockout"] or 0))
+        return jsonify({
+            "method": method,
+            "history_days": history_days,
+            "forecast": forecast
+        }), 200
+    except Exception as e:
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"}), 500
+
+
 @consumables_bp.route('/consumable/<int:id>', methods=['DELETE'])
 @jwt_required()
 def delete_consumable(id):
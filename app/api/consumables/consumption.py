@@ -0,0 +1,103 @@
+from flask import Blueprint, request, jsonify
+from datetime import datetime
+from sqlalchemy import func
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.extensions import db
+from app.models.v1 import ConsumptionRollup, Consumables, Department, User
+from utils.db_helpers import month_bucket
+
+
+consumption_bp = Blueprint("consumption_bp", __name__)
+
+GRANULARITIES = ("day", "month")
+
+
+@consumption_bp.route('/consumption/trends', methods=['GET'])
+@jwt_required()
+def get_consumption_trends():
+    """
+    Reports consumption per period, department and consumable.
+    Totals are read only from the daily consumption rollups, so the cost
+    depends on the number of days reported rather than the size of the
+    stock transaction ledger.
+    Query Parameters:
+        granularity (str, optional): "day" or "month" (default "month").
+        start_date (str, optional): First day to include, YYYY-MM-DD.
+        end_date (str, optional): Last day to include, YYYY-MM-DD.
+        department_id (int, optional): Restrict to one department.
+        consumable_id (int, optional): Restrict to one consumable.
+    Returns:
+        Response (JSON):
+            - 200 OK: Consumption totals per period.
+            - 400 Bad Request: Invalid granularity or date.
+            - 500 Internal Server Error: For unexpected errors
+                during processing.
+    """
+    try:
+        granularity = request.args.get('granularity', 'month', type=str)
+        if granularity not in GRANULARITIES:
+            return jsonify({
+                "error": "Invalid granularity. Use 'day' or 'month'."}), 400
+        try:
+            start_date, end_date = (
+                datetime.strptime(value, "%Y-%m-%d").date() if value else None
+                for value in (request.args.get('start_date'),
+                              request.args.get('end_date'))
+            )
+        except ValueError:
+            return jsonify({
+                "error": "Invalid date format. Use YYYY-MM-DD."}), 400
+
+        current_user = db.session.get(User, get_jwt_identity())
+        period = ConsumptionRollup.day if granularity == "day" \
+            else month_bucket(ConsumptionRollup.day)
+        query = db.session.query(
+            period.label("period"),
+            ConsumptionRollup.department_id,
+            ConsumptionRollup.consumable_id,
+            func.sum(ConsumptionRollup.quantity_in).label("quantity_in"),
+            func.sum(ConsumptionRollup.quantity_out).label("quantity_out")
+        ).filter(ConsumptionRollup.domain_id == current_user.domain_id)
+        if start_date:
+            query = query.filter(ConsumptionRollup.day >= start_date)
+        if end_date:
+            query = query.filter(ConsumptionRollup.day <= end_date)
+        department_id = request.args.get('department_id', type=int)
+        if department_id:
+            query = query.filter(
+                ConsumptionRollup.department_id == department_id)
+        consumable_id = request.args.get('consumable_id', type=int)
+        if consumable_id:
+            query = query.filter(
+                ConsumptionRollup.consumable_id == consumable_id)
+        rows = query.group_by(
+            period,
+            ConsumptionRollup.department_id,
+            ConsumptionRollup.consumable_id
+        ).order_by(period).all()
+
+        department_names = dict(db.session.query(
+            Department.id, Department.name).filter(
+                Department.id.in_({row.department_id for row in rows})))
+        consumable_names = dict(db.session.query(
+            Consumables.id, Consumables.name).filter(
+                Consumables.id.in_({row.consumable_id for row in rows})))
+
+        return jsonify({
+            "granularity": granularity,
+            "trends": [
+                {
+                    "period": row.period.isoformat()
+                    if hasattr(row.period, "isoformat") else row.period,
+                    "department_id": row.department_id,
+                    "department": department_names.get(row.department_id),
+                    "consumable_id": row.consumable_id,
+                    "consumable": consumable_names.get(row.consumable_id),
+                    "quantity_in": row.quantity_in or 0,
+                    "quantity_out": row.quantity_out or 0
+                } for row in rows
+            ]
+        }), 200
+    except Exception as e:
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"}), 500
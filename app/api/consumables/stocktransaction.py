@@ -1,13 +1,18 @@
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
-from datetime import datetime
-from sqlalchemy import and_
+from collections import defaultdict
+from datetime import datetime, time
+from sqlalchemy import and_, insert
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.extensions import db
 from app.models.v1 import (Consumables, StockTransaction,
                            Alert, User, Department)
 from utils.validations.consumables.stock_transaction_validate import (
-    StockTransactionSchema)
+    StockTransactionSchema, BulkStockTransactionSchema)
+from utils.stock_helpers import adjust_stock, record_consumption
+from utils.archive_helpers import with_archive
+from utils.alert_helpers import evaluate_alerts
+from utils.token_helpers import admin_required
 
 
 stocktrans_bp = Blueprint("stocktrans", __name__)
@@ -19,8 +24,10 @@ def reg_stocktransaction():
     """
     Registers a new stock transaction (either "IN" or "OUT") for a consumable.
     Validates the incoming request data, checks if the consumable exists,
-    processes the transaction (adjusting stock quantity and creating alerts if
-    necessary), and stores the transaction in the database.
+    processes the transaction (adjusting stock quantity), and stores the
+    transaction in the database. The stock check and the quantity change
+    are a single conditional UPDATE, so concurrent "OUT" transactions can
+    never drive stock negative. Low-stock alerts are evaluated after commit.
     Returns:
         - 201: Stock transaction successfully registered.
         - 400: Invalid or missing data, or insufficient stock for "OUT"
@@ -47,30 +54,18 @@ def reg_stocktransaction():
             return jsonify({"error": "Consumable not found."}), 404
         transaction_type = validated_data["transaction_type"]
         quantity = validated_data["quantity"]
-        if transaction_type == "IN":
-            consumable.quantity += quantity
-            alert = Alert.query.filter_by(  
-                consumable_id=consumable.id, status="PENDING").first()
-            if alert and consumable.quantity >= consumable.reorder_level:
-                alert.status = "RESOLVED"
-
-        elif transaction_type == "OUT":
-            if consumable.quantity < quantity:
-                return jsonify({
-                    "error": "Insufficient stock for this transaction."}), 400
-            consumable.quantity -= quantity
-            if consumable.quantity < consumable.reorder_level:
-                existing_alert = Alert.query.filter_by(
-                    consumable_id=consumable.id, status="PENDING").first()
-                if not existing_alert:
-                    new_alert = Alert(
-                        consumable_id=consumable.id,
-                        message=f"Stock for {consumable.name}" +
-                        " is below reorder level.",
-                        status="PENDING",
-                        domain_id=user.domain_id
-                    )
-                    db.session.add(new_alert)
+        delta = quantity if transaction_type == "IN" else -quantity
+        new_quantity = adjust_stock(consumable.id, delta)
+        if new_quantity is None:
+            return jsonify({
+                "error": "Insufficient stock for this transaction."}), 400
+        record_consumption([{
+            "consumable_id": consumable.id,
+            "department_id": validated_data["department_id"],
+            "domain_id": consumable.domain_id,
+            "quantity_in": quantity if transaction_type == "IN" else 0,
+            "quantity_out": quantity if transaction_type == "OUT" else 0
+        }])
         new_transaction = StockTransaction(
             consumable_id=validated_data["consumable_id"],
             department_id=validated_data["department_id"],
@@ -97,6 +92,122 @@ def reg_stocktransaction():
         }), 500
         
 
+@stocktrans_bp.route("/stocktransactions/bulk", methods=["POST"])
+@jwt_required()
+def bulk_stocktransactions():
+    """
+    Registers many stock transactions ("IN" or "OUT") in one request.
+    Lines are aggregated into a net delta per consumable, which is applied
+    with one conditional UPDATE per consumable. All ledger rows are inserted
+    in a single batch and low-stock alerts are evaluated after commit for
+    every affected consumable. The batch is all-or-nothing: if any
+    consumable would drop below zero, nothing is written.
+    Request Body (JSON):
+        - transactions (list): Each with consumable_id, department_id,
+            transaction_type and quantity.
+    Returns:
+        - 201: All stock transactions registered.
+        - 400: Invalid data, unknown department, or insufficient stock.
+        - 404: User or consumable not found.
+        - 415: Unsupported Media Type if the request is not JSON.
+        - 500: Internal server error if an unexpected error occurs.
+    """
+    try:
+        if not request.is_json:
+            return jsonify({
+                "error":
+                "Unsupported Media Type: Content-Type must be application/json"
+            }), 415
+        validated_data = BulkStockTransactionSchema().load(request.get_json())
+        lines = validated_data["transactions"]
+        user = db.session.get(User, int(get_jwt_identity()))
+        if not user:
+            return jsonify({"error": "user not found."}), 404
+
+        deltas = defaultdict(int)
+        movements = defaultdict(lambda: {"IN": 0, "OUT": 0})
+        for line in lines:
+            sign = 1 if line["transaction_type"] == "IN" else -1
+            deltas[line["consumable_id"]] += sign * line["quantity"]
+            movements[(line["consumable_id"], line["department_id"])][
+                line["transaction_type"]] += line["quantity"]
+
+        consumables = {
+            consumable.id: consumable
+            for consumable in Consumables.query.filter(
+                Consumables.domain_id == user.domain_id,
+                Consumables.id.in_(deltas.keys())
+            ).all()
+        }
+        missing = sorted(set(deltas) - set(consumables))
+        if missing:
+            return jsonify({
+                "error": f"Consumables not found: {missing}"}), 404
+
+        department_ids = {line["department_id"] for line in lines}
+        known_departments = {
+            row.id for row in db.session.query(Department.id).filter(
+                Department.id.in_(department_ids))
+        }
+        unknown = sorted(department_ids - known_departments)
+        if unknown:
+            return jsonify({
+                "error": f"Departments not found: {unknown}"}), 400
+
+        new_quantities = {}
+        for consumable_id in sorted(deltas):
+            quantity = adjust_stock(consumable_id, deltas[consumable_id])
+            if quantity is None:
+                db.session.rollback()
+                return jsonify({
+                    "error":
+                    "Insufficient stock for " +
+                    f"{consumables[consumable_id].name}."
+                }), 400
+            new_quantities[consumable_id] = quantity
+
+        db.session.execute(insert(StockTransaction), [
+            {
+                "consumable_id": line["consumable_id"],
+                "department_id": line["department_id"],
+                "transaction_type": line["transaction_type"],
+                "quantity": line["quantity"],
+                "user_id": user.id,
+                "domain_id": user.domain_id
+            } for line in lines
+        ])
+        record_consumption([
+            {
+                "consumable_id": consumable_id,
+                "department_id": department_id,
+                "domain_id": consumables[consumable_id].domain_id,
+                "quantity_in": totals["IN"],
+                "quantity_out": totals["OUT"]
+            } for (consumable_id, department_id), totals in movements.items()
+        ])
+        db.session.commit()
+
+        return jsonify({
+            "message": "Stock transactions registered successfully.",
+            "transactions": len(lines),
+            "consumables": [
+                {
+                    "id": consumable_id,
+                    "name": consumables[consumable_id].name,
+                    "quantity": quantity
+                } for consumable_id, quantity in new_quantities.items()
+            ]
+        }), 201
+
+    except ValidationError as err:
+        return jsonify({"error": err.messages}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"
+        }), 500
+
+
 @stocktrans_bp.route("/stocktransactions/<int:location_id>", methods=["GET"])
 @jwt_required()
 def get_all_transactions(location_id):
@@ -174,6 +285,7 @@ def search_transaction(location_id):
     """
     Searches stock transactions for a specific location within the user's domain.
     Supports filters by user name, department, consumable, transaction type, and date range.
+    Date ranges starting before the archive horizon include archived transactions.
     """
     try:
         fullname = request.args.get("fullname", None, type=str)
@@ -185,15 +297,35 @@ def search_transaction(location_id):
         page = request.args.get("page", type=int, default=1)
         per_page = request.args.get("per_page", type=int, default=10)
 
+        try:
+            start_date_obj = datetime.strptime(
+                start_date, "%Y-%m-%d").date() if start_date else None
+        except ValueError:
+            return jsonify({"error": "Invalid start_date format. Use YYYY-MM-DD."}), 400
+        try:
+            end_date_obj = datetime.strptime(
+                end_date, "%Y-%m-%d").date() if end_date else None
+        except ValueError:
+            return jsonify({"error": "Invalid end_date format. Use YYYY-MM-DD."}), 400
+
         current_user = db.session.get(User, get_jwt_identity())
 
+        # A date range reaching past the archive horizon reads the
+        # archived transactions too; other searches stay on the live table.
+        ledger = StockTransaction
+        if start_date or end_date:
+            ledger = with_archive(
+                StockTransaction,
+                datetime.combine(start_date_obj, time.min)
+                if start_date_obj else None)
+
         query = (
-            db.session.query(StockTransaction)
-            .join(User, StockTransaction.user_id == User.id)
-            .join(Consumables, StockTransaction.consumable_id == Consumables.id)
-            .join(Department, StockTransaction.department_id == Department.id)
+            db.session.query(ledger)
+            .join(User, ledger.user_id == User.id)
+            .join(Consumables, ledger.consumable_id == Consumables.id)
+            .join(Department, ledger.department_id == Department.id)
             .filter(
-                StockTransaction.domain_id == current_user.domain_id,
+                ledger.domain_id == current_user.domain_id,
                 Consumables.location_id == location_id
             )
         )
@@ -205,21 +337,13 @@ def search_transaction(location_id):
         if department_name:
             filters.append(Department.name.ilike(f"%{department_name}%"))
         if transaction_type:
-            filters.append(StockTransaction.transaction_type == transaction_type)
+            filters.append(ledger.transaction_type == transaction_type)
         if consumable_name:
             filters.append(Consumables.name.ilike(f"%{consumable_name}%"))
-        if start_date:
-            try:
-                start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-                filters.append(StockTransaction.created_at >= start_date_obj)
-            except ValueError:
-                return jsonify({"error": "Invalid start_date format. Use YYYY-MM-DD."}), 400
-        if end_date:
-            try:
-                end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-                filters.append(StockTransaction.created_at <= end_date_obj)
-            except ValueError:
-                return jsonify({"error": "Invalid end_date format. Use YYYY-MM-DD."}), 400
+        if start_date_obj:
+            filters.append(ledger.created_at >= start_date_obj)
+        if end_date_obj:
+            filters.append(ledger.created_at <= end_date_obj)
 
         if filters:
             query = query.filter(and_(*filters))
@@ -249,14 +373,16 @@ def search_transaction(location_id):
 def delete_transaction(transaction_id):
     """
     Deletes a specific stock transaction by its ID and updates the consumable
-    stock and alert status accordingly.
-    It checks if the transaction exists, updates the consumable's quantity,
-    and adjusts any relevant alert status.
+    stock accordingly; alert status is re-evaluated after commit.
+    It checks if the transaction exists and updates the consumable's quantity
+    atomically. Deleting an "IN"
+    transaction whose stock has already been issued is refused.
     Args:
         transaction_id (int): The ID of the stock transaction to delete.
     Returns:
         - 200: Transaction successfully deleted, consumable stock updated,
             and alert resolved if necessary.
+        - 400: Deleting the transaction would make the stock negative.
         - 404: Transaction not found.
         - 500: Internal server error if an unexpected error occurs.
     """
@@ -270,20 +396,25 @@ def delete_transaction(transaction_id):
         if not consumable:
             return jsonify({"error": "Consumable not found."}), 404
         if transaction.transaction_type == "IN":
-            consumable.quantity -= transaction.quantity
-        elif transaction.transaction_type == "OUT":
-            consumable.quantity += transaction.quantity
-        alert = Alert.query.filter_by(
-            consumable_id=consumable.id, status="PENDING").first()
-        if consumable.quantity >= consumable.reorder_level and alert:
-            alert.status = "RESOLVED"
-        elif consumable.quantity < consumable.reorder_level and not alert:
-            new_alert = Alert(
-                consumable_id=consumable.id,
-                message=f"Stock for {consumable.name} is below reorder level.",
-                status="PENDING"
-            )
-            db.session.add(new_alert)
+            delta = -transaction.quantity
+        else:
+            delta = transaction.quantity
+        new_quantity = adjust_stock(consumable.id, delta)
+        if new_quantity is None:
+            return jsonify({
+                "error":
+                "Cannot delete transaction: the stock it added has " +
+                "already been issued."
+            }), 400
+        record_consumption([{
+            "consumable_id": consumable.id,
+            "department_id": transaction.department_id,
+            "domain_id": consumable.domain_id,
+            "quantity_in": -transaction.quantity
+            if transaction.transaction_type == "IN" else 0,
+            "quantity_out": -transaction.quantity
+            if transaction.transaction_type == "OUT" else 0
+        }], day=transaction.created_at.date())
         db.session.delete(transaction)
         db.session.commit()
 
@@ -332,3 +463,33 @@ def get_pending_alerts():
         return jsonify({
             "error": f"An unexpected error occurred: {str(e)}"
         }), 500
+
+
+@stocktrans_bp.route('/alerts/evaluate', methods=['POST'])
+@jwt_required()
+@admin_required
+def evaluate_domain_alerts():
+    """
+    Re-evaluates low-stock alerts for every consumable in the domain.
+    Resolves pending alerts whose stock has recovered and raises alerts
+    for consumables below their reorder level, in two set-based
+    statements.
+    Returns:
+        - 200: Counts of created and resolved alerts.
+        - 500: Internal server error if an unexpected error occurs.
+    """
+    try:
+        current_user = db.session.get(User, get_jwt_identity())
+        created, resolved = evaluate_alerts(
+            db.session.connection(), domain_id=current_user.domain_id)
+        db.session.commit()
+        return jsonify({
+            "message": "Alerts re-evaluated successfully.",
+            "created": created,
+            "resolved": resolved
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "error": f"An unexpected error occurred: {str(e)}"
+        }), 500
@@ -6,6 +6,7 @@ from app.models.v1 import Department, User
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.validations.dep_validate import RegDepSchema, UpdateDepSchema
 from utils.token_helpers import smart_title
+from utils.cache_helpers import cached_reference
 
 
 dep_bp = Blueprint("dep_bp", __name__)
@@ -156,6 +157,7 @@ def get_department(department_id):
 
 @dep_bp.route('/departments', methods=['GET'])
 @jwt_required()
+@cached_reference("departments")
 def get_all_departments():
     """
     Retrieve all departments.
@@ -6,8 +6,7 @@ from marshmallow import ValidationError
 from datetime import datetime
 from sqlalchemy import and_
 from app.extensions import db
-from app.models.v1 import (ExternalMaintenance, Asset, Provider, User,
-                           AssetLifecycle)
+from app.models.v1 import ExternalMaintenance, Asset, Provider, User
 from utils.validations.external_validate import (
     ExternalMaintenanceCreateSchema,
     ExternalMaintenanceUpdateSchema)
@@ -49,13 +48,7 @@ def create_maintenance():
             current_user.domain.name)
 
         maintenance = ExternalMaintenance(**validated)
-        new_alc = AssetLifecycle(
-            asset_id = validated["asset_id"],
-            event="External Maintenance",
-            notes=validated["description"],
-            domain_id=current_user.domain_id
-        )
-        db.session.add_all([maintenance, new_alc])
+        db.session.add(maintenance)
         db.session.commit()
 
         return jsonify({
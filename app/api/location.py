@@ -5,6 +5,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import ValidationError 
 from utils.validations.loc_validate import RegLocSchema, UpdateLocSchema
 from utils.token_helpers import smart_title
+from utils.cache_helpers import cached_reference
 
 
 loc_bp = Blueprint("loc_bp", __name__)
@@ -147,6 +148,7 @@ def get_location(location_id):
 
 @loc_bp.route('/locations', methods=['GET'])
 @jwt_required()
+@cached_reference("locations")
 def get_all_locations():
     """
     Retrieve all locations.
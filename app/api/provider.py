@@ -5,6 +5,7 @@ from marshmallow import ValidationError
 from app.models.v1 import Provider, User
 from utils.validations.pro_validate import (ProviderCreateSchema,
                                             ProviderUpdateSchema)
+from utils.cache_helpers import cached_reference
 
 
 provider_bp = Blueprint("providers", __name__)
@@ -43,6 +44,7 @@ def create_provider():
 
 @provider_bp.route("/providers", methods=["GET"])
 @jwt_required()
+@cached_reference("providers")
 def get_all_providers():
     """
     Retrieve all providers in the user's domain.
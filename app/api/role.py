@@ -4,6 +4,7 @@ from app.extensions import db
 from app.models.v1 import Role, User
 from flask_jwt_extended import jwt_required, get_jwt_identity 
 from utils.validations.role_validate import RegRoleSchema, UpdateRoleSchema
+from utils.cache_helpers import cached_reference
 
 
 role_bp = Blueprint("role_bp", __name__)
@@ -143,6 +144,7 @@ def get_role(role_id):
 
 @role_bp.route('/roles', methods=['GET'])
 @jwt_required()
+@cached_reference("roles")
 def get_all_roles():
     """
     Retrieve all roles.
@@ -261,6 +261,7 @@ def bulk_register_software():
                     " Content-Type must be application/json."
             }), 415
 
+        current_user = db.session.get(User, get_jwt_identity())
         software_data_list = request.get_json()
         software_schema = RegSoftwareSchema(many=True)
         software_list = software_schema.load(software_data_list)
@@ -288,9 +289,12 @@ def bulk_register_software():
                 version=software.get("version"),
                 license_key=software.get("license_key"),
                 expiry_date=software.get("expiry_date"),
+                domain_id=current_user.domain_id,
                 )
             )
-        db.session.bulk_save_objects(new_software_objects)
+        # add_all rather than bulk_save_objects: the domain counters and
+        # the event bus are kept up by ORM insert events.
+        db.session.add_all(new_software_objects)
         db.session.commit()
 
         return jsonify({
@@ -5,6 +5,7 @@ from app.models.v1 import Status, User
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.validations.status_validate import (
     RegStatusSchema, UpdatestatusSchema)
+from utils.cache_helpers import cached_reference
 
 status_bp = Blueprint("status_bp", __name__)
 
@@ -153,6 +154,7 @@ def get_status(status_id):
 
 @status_bp.route('/statuses', methods=['GET'])
 @jwt_required()
+@cached_reference("statuses")
 def get_all_statuses():
     """
     Retrieve all statuses.
@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required 
 from marshmallow import ValidationError 
+from sqlalchemy.orm import joinedload
 from app.extensions import db
 from app.models.v1 import Ticket, User, Asset
 from utils.validations.ticket_validate import RegTicSchema, UpdateTicSchema
@@ -190,11 +191,12 @@ def get_asset_tickets(asset_id):
                 f"Asset with id {asset_id} not found."
             }), 404
         asset_name = asset.name if asset else 'unknown asset'
-        tickets = db.session.query(Ticket).filter_by(asset_id=asset_id).all()
+        tickets = db.session.query(Ticket).options(
+            joinedload(Ticket.user)).filter_by(asset_id=asset_id).all()
         ticket_list = [
             {
                 "asset name": asset_name,
-                "user name": (db.session.get(User, ticket.user_id)).fullname,
+                "user name": ticket.user.fullname,
                 "status": ticket.status,
                 "description": ticket.description,
                 "resolution_notes": ticket.resolution_notes
@@ -222,11 +224,12 @@ def get_all_tickets():
         - 500: Unexpected server error.
     """
     try:
-        tickets = Ticket.query.all()
+        tickets = Ticket.query.options(
+            joinedload(Ticket.asset), joinedload(Ticket.user)).all()
         ticket_list = [
             {
-                "asset name": (db.session.get(Asset, ticket.asset_id)).name,
-                "user name": (db.session.get(User, ticket.user_id)).fullname,
+                "asset name": ticket.asset.name,
+                "user name": ticket.user.fullname,
                 "status": ticket.status,
                 "description": ticket.description,
                 "resolution_notes": ticket.resolution_notes
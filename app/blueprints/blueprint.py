@@ -11,9 +11,11 @@ from app.api.assettransfer import at_bp
 from app.api.assetlifecycle import alc_bp
 from app.api.consumables.consumable import consumables_bp
 from app.api.consumables.stocktransaction import stocktrans_bp
+from app.api.consumables.consumption import consumption_bp
 from app.api.assetLoan import asset_loan_bp
 from app.api.extProvider import maintenance_bp
 from app.api.provider import provider_bp
+from app.api.audit import audit_bp
 
 def register_blueprints(app):
     """
@@ -21,6 +23,7 @@ def register_blueprints(app):
     """
     blueprints = [auth_bp, dep_bp, role_bp, asset_bp, tic_bp, status_bp,
                   sofware_bp, loc_bp, cat_bp, at_bp, alc_bp, consumables_bp,
-                  stocktrans_bp, asset_loan_bp, maintenance_bp, provider_bp]
+                  stocktrans_bp, asset_loan_bp, maintenance_bp, provider_bp,
+                  consumption_bp, audit_bp]
     for blueprint in blueprints:
         app.register_blueprint(blueprint)
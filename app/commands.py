@@ -0,0 +1,132 @@
+import click
+from flask.cli import AppGroup
+from app.extensions import db
+from utils.stock_helpers import backfill_consumption_rollups
+from utils.synthetic_data import generate_synthetic_data
+from utils.counter_helpers import reconcile_domain_counters
+from utils.archive_helpers import archive_old_rows
+from utils.audit_helpers import audit_writer
+from utils.loan_helpers import mark_overdue_loans
+from utils.alert_helpers import dedupe_pending_alerts
+
+
+consumption_cli = AppGroup(
+    "consumption", help="Maintain the consumption rollup tables.")
+
+
+@consumption_cli.command("backfill")
+def backfill_consumption():
+    """Rebuild consumption rollups from the stock transaction ledger."""
+    rows = backfill_consumption_rollups()
+    click.echo(f"Rebuilt {rows} consumption rollup rows.")
+
+
+alerts_cli = AppGroup("alerts", help="Maintain the low-stock alerts.")
+
+
+@alerts_cli.command("dedupe")
+def dedupe_alerts():
+    """Resolve duplicate pending alerts and build their unique index."""
+    with db.engine.begin() as connection:
+        resolved = dedupe_pending_alerts(connection)
+    click.echo(f"Resolved {resolved} duplicate pending alerts.")
+
+
+counters_cli = AppGroup(
+    "counters", help="Maintain the per-domain dashboard counters.")
+
+
+@counters_cli.command("reconcile")
+def reconcile_counters():
+    """Recompute the per-domain dashboard counters."""
+    corrected = reconcile_domain_counters()
+    click.echo(f"Corrected {corrected} domain counters.")
+
+
+archive_cli = AppGroup(
+    "archive", help="Move old history rows into the archive tables.")
+
+
+@archive_cli.command("run")
+@click.option("--horizon-days", type=int, default=None,
+              help="Archive rows older than this many days "
+                   "(default ARCHIVE_HORIZON_DAYS).")
+@click.option("--chunk-size", type=int, default=None,
+              help="Rows moved per transaction.")
+def run_archive(horizon_days, chunk_size):
+    """Archive lifecycle events and stock transactions past the horizon."""
+    result = archive_old_rows(horizon_days, chunk_size)
+    for table, rows in result["moved"].items():
+        click.echo(f"{table}: {rows}")
+    if not result["ran"]:
+        click.echo("Stopped: another worker is archiving.")
+
+
+audit_cli = AppGroup("audit", help="Maintain the audit log.")
+
+
+@audit_cli.command("replay")
+def replay_audit():
+    """Load audit entries spilled to the fallback file into the table."""
+    restored = audit_writer().replay()
+    click.echo(f"Restored {restored} audit entries.")
+
+
+loans_cli = AppGroup("loans", help="Maintain asset loans.")
+
+
+@loans_cli.command("mark-overdue")
+def mark_overdue():
+    """Flag borrowed loans past their expected return date as OVERDUE."""
+    result = mark_overdue_loans()
+    if not result["ran"]:
+        click.echo("Skipped: another worker is sweeping.")
+        return
+    click.echo(f"Marked {result['marked']} loans overdue.")
+
+
+seed_cli = AppGroup("seed", help="Populate the database with test data.")
+
+
+@seed_cli.command("synthetic")
+@click.option("--domains", default=5, show_default=True)
+@click.option("--assets", default=10000, show_default=True,
+              help="Total assets, spread evenly over the domains.")
+@click.option("--transactions", default=100000, show_default=True,
+              help="Total stock transactions.")
+@click.option("--seed", type=int, default=None,
+              help="Seed for reproducible data.")
+@click.option("--chunk-size", default=10000, show_default=True,
+              help="Rows per bulk insert.")
+@click.option("--anchor-date", type=click.DateTime(formats=["%Y-%m-%d"]),
+              default=None,
+              help="Date the data is generated around (default: a fixed "
+                   "date with --seed, otherwise today).")
+@click.option("--reset", is_flag=True,
+              help="Drop and recreate every table first.")
+def seed_synthetic(domains, assets, transactions, seed, chunk_size,
+                   anchor_date, reset):
+    """Generate a proportional synthetic dataset for load testing."""
+    if reset:
+        click.confirm(
+            f"Drop every table in {db.engine.url.render_as_string()}?",
+            abort=True)
+        db.drop_all()
+        db.create_all()
+    counts = generate_synthetic_data(
+        domains=domains, assets=assets, transactions=transactions,
+        seed=seed, chunk_size=chunk_size, anchor=anchor_date)
+    for table, rows in counts.items():
+        click.echo(f"{table}: {rows}")
+    click.echo(f"Seeded {sum(counts.values())} rows.")
+
+
+def register_commands(app):
+    """Attach the custom CLI command groups to the application."""
+    app.cli.add_command(consumption_cli)
+    app.cli.add_command(alerts_cli)
+    app.cli.add_command(counters_cli)
+    app.cli.add_command(archive_cli)
+    app.cli.add_command(audit_cli)
+    app.cli.add_command(loans_cli)
+    app.cli.add_command(seed_cli)
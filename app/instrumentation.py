@@ -0,0 +1,121 @@
+import json
+import logging
+import time
+from flask import g, request, has_app_context
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import event
+from app.extensions import db
+from app.models.v1 import User
+
+slow_query_logger = logging.getLogger("app.instrumentation.slow_queries")
+
+
+class SqlStats:
+    """Statement count, DB time and slowest statement of one request."""
+    __slots__ = ("count", "total_ms", "slowest_ms", "slowest", "slow")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest = None
+        self.slow = []
+
+    def record(self, statement, elapsed_ms, threshold_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest = statement
+        if elapsed_ms >= threshold_ms:
+            self.slow.append((statement, elapsed_ms))
+
+    def server_timing(self):
+        """Render the stats as a Server-Timing header value."""
+        return (
+            f'db;dur={self.total_ms:.2f};desc="{self.count} statements", '
+            f'db-slowest;dur={self.slowest_ms:.2f}'
+        )
+
+
+def _domain_label():
+    """Domain of the authenticated user, if the request carried a JWT."""
+    try:
+        identity = get_jwt_identity()
+    except Exception:
+        return None
+    if identity is None:
+        return None
+    user = db.session.get(User, identity)
+    return user.domain_id if user else None
+
+
+def _log_slow_query(statement, elapsed_ms, **labels):
+    slow_query_logger.warning(json.dumps({
+        "event": "slow_query",
+        "duration_ms": round(elapsed_ms, 2),
+        **labels,
+        "statement": statement,
+    }, default=str))
+
+
+def register_sql_instrumentation(app):
+    """
+    Record per-request SQL statistics when SQL_INSTRUMENTATION is enabled.
+
+    Each request gets a Server-Timing header with the number of statements,
+    the total DB time and the slowest statement's time. Statements taking
+    at least SLOW_QUERY_THRESHOLD_MS (default 200) are written to the
+    slow-query log as JSON, labelled with route and domain. When the
+    feature is disabled no engine or request hooks are installed at all.
+    """
+    if not app.config.get("SQL_INSTRUMENTATION", False):
+        return
+    threshold_ms = app.config.get("SLOW_QUERY_THRESHOLD_MS", 200)
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context,
+                     executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop_timer(conn, cursor, statement, parameters, context,
+                    executemany):
+        elapsed_ms = (
+            time.perf_counter() - conn.info["query_start"].pop()) * 1000
+        stats = g.get("sql_stats") if has_app_context() else None
+        if stats is not None:
+            stats.record(statement, elapsed_ms, threshold_ms)
+        elif elapsed_ms >= threshold_ms:
+            _log_slow_query(statement, elapsed_ms, route=None, domain_id=None)
+
+    @event.listens_for(engine, "handle_error")
+    def _discard_timer(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start"):
+            connection.info["query_start"].pop()
+
+    @app.before_request
+    def _start_sql_stats():
+        g.sql_stats = SqlStats()
+
+    @app.after_request
+    def _emit_sql_stats(response):
+        stats = g.pop("sql_stats", None)
+        if stats is None:
+            return response
+        response.headers.add("Server-Timing", stats.server_timing())
+        if stats.slow:
+            labels = {
+                "route": request.url_rule.rule if request.url_rule
+                else request.path,
+                "endpoint": request.endpoint,
+                "method": request.method,
+                "status": response.status_code,
+                "domain_id": _domain_label(),
+            }
+            for statement, elapsed_ms in stats.slow:
+                _log_slow_query(statement, elapsed_ms, **labels)
+        return response
@@ -0,0 +1,59 @@
+import time
+from flask import g, request, Response
+from app.extensions import db
+from utils.metrics import metrics
+
+
+def _pool_gauges(engine):
+    """Sample the connection pool; pools without a size report nothing."""
+    def sample():
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return []
+        return [
+            ("db_pool_checked_out", None, pool.checkedout()),
+            ("db_pool_overflow", None, max(pool.overflow(), 0)),
+        ]
+    return sample
+
+
+def register_metrics(app):
+    """
+    Record request metrics and expose them at /metrics.
+
+    Set METRICS_DIR to a directory shared by all worker processes to
+    aggregate their metrics; METRICS_FLUSH_INTERVAL (seconds, default 1)
+    bounds how often each process rewrites its snapshot there.
+    """
+    metrics.configure(
+        directory=app.config.get("METRICS_DIR"),
+        flush_interval=app.config.get("METRICS_FLUSH_INTERVAL", 1.0))
+    with app.app_context():
+        metrics.set_gauge_callback("db_pool", _pool_gauges(db.engine))
+
+    @app.before_request
+    def _start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response):
+        started = g.pop("request_started", None)
+        if started is None:
+            return response
+        endpoint = request.endpoint or "unmatched"
+        status = str(response.status_code)
+        metrics.inc("http_requests_total", {
+            "endpoint": endpoint, "method": request.method, "status": status})
+        metrics.observe(
+            "http_request_duration_seconds",
+            time.perf_counter() - started,
+            {"endpoint": endpoint, "status": status})
+        metrics.flush()
+        return response
+
+    def metrics_view():
+        return Response(
+            metrics.render(),
+            mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+    app.add_url_rule("/metrics", "metrics", metrics_view, methods=["GET"])
@@ -79,9 +79,10 @@ class BaseModel(TimestampMixin, db.Model):
 
     @declared_attr
     def domain_id(cls):
-        """Every model inherits a domain_id foreign key."""
+        """Every model inherits an indexed domain_id foreign key."""
         return db.Column(
-            db.Integer, db.ForeignKey("domains.id"), nullable=True)
+            db.Integer, db.ForeignKey("domains.id"), nullable=True,
+            index=True)
 
     def save(self):
         """Save model with current user's domain automatically assigned."""
@@ -173,6 +174,9 @@ class Location(BaseModel):
 
 class User(BaseModel):
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_domain_department', 'domain_id', 'department_id'),
+    )
     fullname = db.Column(db.String(255), nullable=False)
     email = db.Column(db.String(255), nullable=False, unique=True)
     password = db.Column(db.String(255), nullable=False)
@@ -226,12 +230,19 @@ software_asset_association = db.Table(
         'asset_id', 
         db.Integer, 
         db.ForeignKey('assets.id', ondelete="CASCADE"), 
-        primary_key=True)
+        primary_key=True),
+    db.Index('ix_software_asset_association_asset', 'asset_id')
 )
 
 
 class Asset(BaseModel):
     __tablename__ = 'assets'
+    __table_args__ = (
+        db.Index('ix_assets_domain_location', 'domain_id', 'location_id'),
+        db.Index('ix_assets_domain_assigned', 'domain_id', 'assigned_to'),
+        db.Index('ix_assets_domain_status', 'domain_id', 'status_id'),
+        db.Index('ix_assets_domain_department', 'domain_id', 'department_id'),
+    )
     asset_tag = db.Column(db.String(100), nullable=False, unique=True)
     fresha_tag = db.Column(db.String(100), nullable=False, unique=True)
     name = db.Column(db.String(255), nullable=False)
@@ -302,6 +313,12 @@ class Software(BaseModel):
 class AssetLifecycle(BaseModel): 
     """ Tracks lifecycle events of assets. """ 
     __tablename__ = 'asset_lifecycles' 
+    __table_args__ = (
+        db.Index(
+            'ix_asset_lifecycles_domain_created', 'domain_id', 'created_at'),
+        db.Index(
+            'ix_asset_lifecycles_asset_created', 'asset_id', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True) 
     asset_id = db.Column(
         db.Integer, 
@@ -313,7 +330,8 @@ class AssetLifecycle(BaseModel):
     domain_id = db.Column(
         db.Integer, 
         db.ForeignKey('domains.id', ondelete="SET NULL"), 
-        nullable=True 
+        nullable=True,
+        index=True
     ) 
     asset = db.relationship(
         'Asset', 
@@ -337,9 +355,40 @@ class AssetLifecycle(BaseModel):
                 }
     
     
+class AssetLifecycleArchive(BaseModel):
+    """
+    Lifecycle events older than the archive horizon, moved out of
+    asset_lifecycles by the archival job with their ids preserved.
+    """
+    __tablename__ = 'asset_lifecycles_archive'
+    __table_args__ = (
+        db.Index(
+            'ix_asset_lifecycles_archive_domain_created',
+            'domain_id', 'created_at'),
+        db.Index(
+            'ix_asset_lifecycles_archive_asset_created',
+            'asset_id', 'created_at'),
+        db.Index('ix_asset_lifecycles_archive_created', 'created_at'),
+    )
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    asset_id = db.Column(
+        db.Integer,
+        db.ForeignKey('assets.id', ondelete="CASCADE"),
+        nullable=False
+    )
+    event = db.Column(db.String(255), nullable=False)
+    notes = db.Column(db.Text)
+
+
 class AssetTransfer(BaseModel): 
     """ Represents transfer records for assets. """ 
     __tablename__ = 'asset_transfers' 
+    __table_args__ = (
+        db.Index(
+            'ix_asset_transfers_domain_created', 'domain_id', 'created_at'),
+        db.Index(
+            'ix_asset_transfers_asset_created', 'asset_id', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True) 
     asset_id = db.Column(
         db.Integer, 
@@ -370,7 +419,8 @@ class AssetTransfer(BaseModel):
     domain_id = db.Column(
         db.Integer, 
         db.ForeignKey('domains.id', ondelete="SET NULL"), 
-        nullable=True 
+        nullable=True,
+        index=True
     )
     asset = db.relationship("Asset", backref="transfers")
     sender = db.relationship(
@@ -403,6 +453,10 @@ class AssetTransfer(BaseModel):
 
 class Ticket(BaseModel):
     __tablename__ = 'tickets'
+    __table_args__ = (
+        db.Index('ix_tickets_domain_status', 'domain_id', 'status'),
+        db.Index('ix_tickets_asset_created', 'asset_id', 'created_at'),
+    )
     asset_id = db.Column(
         db.Integer, 
         db.ForeignKey('assets.id', ondelete="CASCADE"), 
@@ -419,6 +473,10 @@ class Ticket(BaseModel):
 
 class Consumables(BaseModel):
     __tablename__ = 'consumables'
+    __table_args__ = (
+        db.Index('ix_consumables_domain_location', 'domain_id', 'location_id'),
+        db.Index('ix_consumables_location', 'location_id'),
+    )
     name = db.Column(db.String(150), nullable=False, unique=True)
     category = db.Column(db.String(100))
     brand = db.Column(db.String(100))
@@ -435,6 +493,14 @@ class Consumables(BaseModel):
 
 class StockTransaction(BaseModel):
     __tablename__ = 'stock_transactions'
+    __table_args__ = (
+        db.Index(
+            'ix_stock_transactions_consumable_created',
+            'consumable_id', 'created_at'),
+        db.Index(
+            'ix_stock_transactions_domain_created',
+            'domain_id', 'created_at'),
+    )
     consumable_id = db.Column(
         db.Integer, 
         db.ForeignKey('consumables.id'), 
@@ -453,8 +519,159 @@ class StockTransaction(BaseModel):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
 
 
+class StockTransactionArchive(BaseModel):
+    """
+    Stock transactions older than the archive horizon, moved out of
+    stock_transactions by the archival job with their ids preserved.
+    """
+    __tablename__ = 'stock_transactions_archive'
+    __table_args__ = (
+        db.Index(
+            'ix_stock_transactions_archive_consumable_created',
+            'consumable_id', 'created_at'),
+        db.Index(
+            'ix_stock_transactions_archive_domain_created',
+            'domain_id', 'created_at'),
+        db.Index('ix_stock_transactions_archive_created', 'created_at'),
+    )
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    consumable_id = db.Column(
+        db.Integer,
+        db.ForeignKey('consumables.id'),
+        nullable=False
+    )
+    department_id = db.Column(
+        db.Integer,
+        db.ForeignKey('departments.id'),
+        nullable=False
+    )
+    transaction_type = db.Column(
+        db.Enum('IN', 'OUT', name="transaction_type"),
+        nullable=False
+    )
+    quantity = db.Column(db.Integer, nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+
+
+class ConsumptionRollup(BaseModel):
+    """
+    Daily IN/OUT totals per consumable and department, maintained alongside
+    the stock ledger so consumption trends never scan the transactions.
+    The consumable determines the domain, so it is not part of the key.
+    """
+    __tablename__ = 'consumption_rollups'
+    __table_args__ = (
+        db.UniqueConstraint(
+            'consumable_id', 'department_id', 'day',
+            name='uq_consumption_rollups_key'),
+        db.Index('ix_consumption_rollups_domain_day', 'domain_id', 'day'),
+    )
+    consumable_id = db.Column(
+        db.Integer,
+        db.ForeignKey('consumables.id', ondelete="CASCADE"),
+        nullable=False
+    )
+    department_id = db.Column(
+        db.Integer,
+        db.ForeignKey('departments.id', ondelete="CASCADE"),
+        nullable=False
+    )
+    day = db.Column(db.Date, nullable=False)
+    quantity_in = db.Column(db.Integer, nullable=False, default=0)
+    quantity_out = db.Column(db.Integer, nullable=False, default=0)
+
+
+class DomainCounter(db.Model):
+    """
+    Running per-domain totals for the dashboard, adjusted in the same
+    transaction as the rows they count. Rows without a domain are counted
+    under domain_key 0, so the key never needs to be NULL.
+    """
+    __tablename__ = 'domain_counters'
+
+    domain_key = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(
+        db.DateTime,
+        server_default=db.func.now(),
+        server_onupdate=db.func.now()
+    )
+
+
+class AuditLog(db.Model):
+    """
+    Append-only record of a change to an audited field, written in
+    batches by the audit writer after the change commits. Secret values
+    such as license keys are stored masked. There are no foreign keys, so
+    entries outlive the users and domains they mention.
+    """
+    __tablename__ = 'audit_log'
+    __table_args__ = (
+        db.Index(
+            'ix_audit_log_entity_changed', 'entity', 'entity_id',
+            'changed_at'),
+        db.Index('ix_audit_log_user_changed', 'user_id', 'changed_at'),
+        db.Index('ix_audit_log_domain_changed', 'domain_id', 'changed_at'),
+    )
+
+    id = db.Column(db.BigInteger().with_variant(db.Integer, "sqlite"),
+                   primary_key=True)
+    entity = db.Column(db.String(50), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    field = db.Column(db.String(50), nullable=False)
+    old_value = db.Column(db.Text)
+    new_value = db.Column(db.Text)
+    user_id = db.Column(db.Integer)
+    domain_id = db.Column(db.Integer)
+    changed_at = db.Column(db.DateTime, nullable=False)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "entity": self.entity,
+            "entity_id": self.entity_id,
+            "field": self.field,
+            "old_value": self.old_value,
+            "new_value": self.new_value,
+            "user_id": self.user_id,
+            "changed_at": self.changed_at.isoformat(),
+        }
+
+
+class StockSnapshot(BaseModel):
+    """
+    Quantity of a consumable at a point in time, recorded by a scheduled
+    job so historical stock can be answered without replaying the ledger.
+    """
+    __tablename__ = 'stock_snapshots'
+    __table_args__ = (
+        db.Index(
+            'ix_stock_snapshots_consumable_taken',
+            'consumable_id', 'taken_at'),
+    )
+    consumable_id = db.Column(
+        db.Integer,
+        db.ForeignKey('consumables.id', ondelete="CASCADE"),
+        nullable=False
+    )
+    quantity = db.Column(db.Integer, nullable=False)
+    taken_at = db.Column(
+        db.DateTime, server_default=db.func.now(), nullable=False)
+    # Highest stock_transactions.id reflected in `quantity`; replay starts
+    # after it. NULL on snapshots taken before it was recorded.
+    ledger_high_water = db.Column(db.Integer, nullable=True)
+
+
 class Alert(BaseModel):
     __tablename__ = 'alerts'
+    __table_args__ = (
+        db.Index(
+            'uq_alerts_pending_consumable', 'consumable_id', unique=True,
+            postgresql_where=db.text("status = 'PENDING'"),
+            sqlite_where=db.text("status = 'PENDING'")),
+        db.Index('ix_alerts_domain_status', 'domain_id', 'status'),
+    )
     consumable_id = db.Column(
         db.Integer, 
         db.ForeignKey('consumables.id'), 
@@ -502,6 +719,15 @@ class Provider(BaseModel):
 
 class ExternalMaintenance(BaseModel):
     __tablename__ = 'external_maintenance'
+    __table_args__ = (
+        db.Index(
+            'ix_external_maintenance_domain_status', 'domain_id', 'status'),
+        db.Index(
+            'ix_external_maintenance_asset_status', 'asset_id', 'status'),
+        db.Index(
+            'ix_external_maintenance_asset_created', 'asset_id', 'created_at'),
+        db.Index('ix_external_maintenance_provider', 'provider_id'),
+    )
 
     asset_id = db.Column(
         db.Integer,
@@ -610,6 +836,18 @@ class AssetLoan(BaseModel):
     Tracks who borrowed it, when, and whether it has been returned.
     """
     __tablename__ = 'asset_loans'
+    __table_args__ = (
+        db.Index('ix_asset_loans_domain_status', 'domain_id', 'status'),
+        db.Index(
+            'ix_asset_loans_status_expected_return',
+            'status', 'expected_return_date'),
+        db.Index(
+            'ix_asset_loans_domain_expected_return',
+            'domain_id', 'expected_return_date'),
+        db.Index('ix_asset_loans_asset_status', 'asset_id', 'status'),
+        db.Index('ix_asset_loans_asset_created', 'asset_id', 'created_at'),
+        db.Index('ix_asset_loans_borrower', 'borrower_id'),
+    )
 
     asset_id = db.Column(
         db.Integer,
@@ -0,0 +1,140 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import uuid
+from flask import current_app, jsonify, request
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+from sqlalchemy import event
+from app.extensions import db
+from utils.token_helpers import admin_required
+
+SORT_KEYS = ("cumulative", "tottime", "calls")
+
+
+class _SqlRecorder:
+    """Collects the statements one thread sends while profiling."""
+
+    def __init__(self):
+        self.thread_id = threading.get_ident()
+        self.statements = []
+        self._started = None
+
+    def before(self, conn, cursor, statement, parameters, context,
+               executemany):
+        if threading.get_ident() == self.thread_id:
+            self._started = time.perf_counter()
+
+    def after(self, conn, cursor, statement, parameters, context,
+              executemany):
+        if threading.get_ident() != self.thread_id or self._started is None:
+            return
+        self.statements.append({
+            "statement": statement,
+            "parameters": repr(parameters),
+            "duration_ms": round(
+                (time.perf_counter() - self._started) * 1000, 3),
+        })
+        self._started = None
+
+
+def _rate_limited(state, user_id):
+    """Seconds the user must wait before profiling again, or 0."""
+    interval = current_app.config.get("PROFILE_RATE_LIMIT_SECONDS", 60)
+    now = time.monotonic()
+    with state["lock"]:
+        last = state["last"].get(user_id)
+        if last is not None and now - last < interval:
+            return int(interval - (now - last)) + 1
+        state["last"][user_id] = now
+    return 0
+
+
+def _run_profiled_view():
+    """Dispatch the current request under cProfile and report on it."""
+    app = current_app._get_current_object()
+    sort_key = request.args.get("__profile_sort", "cumulative")
+    if sort_key not in SORT_KEYS:
+        sort_key = "cumulative"
+
+    recorder = _SqlRecorder()
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", recorder.before)
+    event.listen(engine, "after_cursor_execute", recorder.after)
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    try:
+        profiler.enable()
+        try:
+            response = app.make_response(
+                app.view_functions[request.endpoint](**request.view_args))
+        finally:
+            profiler.disable()
+    finally:
+        event.remove(engine, "before_cursor_execute", recorder.before)
+        event.remove(engine, "after_cursor_execute", recorder.after)
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.sort_stats(sort_key).print_stats(
+        app.config.get("PROFILE_TOP_N", 40))
+    report = {
+        "endpoint": request.endpoint,
+        "path": request.full_path,
+        "status": response.status_code,
+        "wall_ms": round(wall_ms, 3),
+        "sql_count": len(recorder.statements),
+        "sql_ms": round(
+            sum(s["duration_ms"] for s in recorder.statements), 3),
+        "sort": sort_key,
+        "stats": output.getvalue(),
+        "sql": recorder.statements,
+    }
+
+    directory = app.config.get("PROFILE_DIR")
+    if directory:
+        profile_id = uuid.uuid4().hex
+        os.makedirs(directory, exist_ok=True)
+        stats.dump_stats(os.path.join(directory, f"{profile_id}.prof"))
+        with open(os.path.join(directory, f"{profile_id}.json"), "w") as f:
+            json.dump(report, f)
+        report["profile_id"] = profile_id
+    return jsonify({"profile": report}), 200
+
+
+def register_request_profiler(app):
+    """
+    Let admins profile a single request by adding `?__profile=1`.
+
+    The view runs under cProfile and the response is replaced by the
+    sorted stats (`__profile_sort`: cumulative, tottime or calls) and the
+    SQL statements the request executed. With PROFILE_DIR set, the raw
+    .prof file and the report are also stored there. Each admin may
+    profile once every PROFILE_RATE_LIMIT_SECONDS (default 60).
+    """
+    state = {"lock": threading.Lock(), "last": {}}
+
+    @app.before_request
+    def _profile_request():
+        if request.args.get("__profile") != "1" or request.endpoint is None:
+            return None
+        try:
+            verify_jwt_in_request()
+        except Exception:
+            return jsonify({"error": "Authentication required"}), 401
+
+        @admin_required
+        def profile():
+            retry_after = _rate_limited(state, get_jwt_identity())
+            if retry_after:
+                response = jsonify({
+                    "error": "Profiling rate limit exceeded."})
+                response.headers["Retry-After"] = str(retry_after)
+                return response, 429
+            return _run_profiled_view()
+
+        return profile()
@@ -0,0 +1,286 @@
+"""
+Concurrent workload simulator for mixed read/write traffic.
+
+Drives the real HTTP surface of a running server from many threads with a
+weighted mix of requests, then reports latency percentiles, throughput and
+error rates per endpoint. Unlike the single-request benchmarks this
+exercises contention: asset tag allocation, stock quantity updates and
+connection pool pressure.
+
+Start a server against a seeded database (see `flask seed synthetic`; the
+first user of every domain is an admin), then run for example:
+
+    python -m tests.load.run_workload --base-url http://127.0.0.1:5000 \\
+        --email <admin email> --password Synthetic123! \\
+        --threads 32 --duration 60 --mix default --output load.json
+
+Each thread sends its requests back to back, so --threads is the number
+of concurrent clients. Only ever run the write-heavy mixes against a
+disposable database.
+"""
+import argparse
+import http.cookiejar
+import json
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+MIXES = {
+    "default": {
+        "asset_search": 60,
+        "transaction_search": 20,
+        "stock_movement": 10,
+        "asset_create": 5,
+        "counts": 5,
+    },
+    "read_heavy": {
+        "asset_search": 50,
+        "transaction_search": 20,
+        "asset_list": 10,
+        "consumable_list": 10,
+        "counts": 10,
+    },
+    "write_heavy": {
+        "stock_movement": 50,
+        "asset_create": 30,
+        "asset_search": 20,
+    },
+}
+SEARCH_TERMS = ("a", "er", "on", "pro", "lap", "st")
+
+
+class Client:
+    """Minimal JSON client sharing one access token across threads."""
+
+    def __init__(self, base_url, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json"}
+
+    def login(self, email, password):
+        jar = http.cookiejar.CookieJar()
+        opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(jar))
+        request = urllib.request.Request(
+            f"{self.base_url}/auth/login",
+            data=json.dumps({"email": email, "password": password}).encode(),
+            headers=self.headers, method="POST")
+        opener.open(request, timeout=self.timeout).read()
+        token = next(
+            (c.value for c in jar if c.name == "access_token_cookie"), None)
+        if token is None:
+            raise SystemExit("Login did not return an access token cookie.")
+        self.headers["Authorization"] = f"Bearer {token}"
+
+    def send(self, method, path, body=None):
+        """Return (status, parsed body); status 0 means no response."""
+        request = urllib.request.Request(
+            f"{self.base_url}{path}",
+            data=json.dumps(body).encode() if body is not None else None,
+            headers=self.headers, method=method)
+        try:
+            with urllib.request.urlopen(
+                    request, timeout=self.timeout) as response:
+                payload = response.read()
+                status = response.status
+        except urllib.error.HTTPError as error:
+            return error.code, None
+        except (urllib.error.URLError, OSError):
+            return 0, None
+        try:
+            return status, json.loads(payload)
+        except ValueError:
+            return status, None
+
+
+def discover(client):
+    """Look up the reference ids the write operations need."""
+    ids = {}
+    for key, path in (("categories", "/categories"),
+                      ("locations", "/locations"),
+                      ("statuses", "/statuses"),
+                      ("departments", "/departments")):
+        status, body = client.send("GET", path)
+        if status != 200 or not body:
+            raise SystemExit(f"GET {path} returned {status}; is the "
+                             "database seeded?")
+        ids[key] = [row["id"] for row in body]
+    ids["consumables"] = []
+    for location_id in ids["locations"]:
+        status, body = client.send("GET", f"/consumables/{location_id}")
+        if status == 200:
+            ids["consumables"].extend(
+                row["id"] for row in body["consumables"])
+    return ids
+
+
+def build_operations(ids, user_id):
+    """Map operation name to a callable producing (method, path, body)."""
+    counter = iter(range(10 ** 12))
+    lock = threading.Lock()
+
+    def unique():
+        with lock:
+            return next(counter)
+
+    def asset_create(rng):
+        return "POST", "/register/asset", {
+            "category_id": rng.choice(ids["categories"]),
+            "assigned_to": user_id,
+            "location_id": rng.choice(ids["locations"]),
+            "status_id": rng.choice(ids["statuses"]),
+            "department_id": rng.choice(ids["departments"]),
+            "fresha_tag": f"LOAD{time.time_ns()}{unique()}",
+        }
+
+    def stock_movement(rng):
+        # A handful of hot consumables makes quantity updates contend.
+        return "POST", "/register/stocktransaction", {
+            "consumable_id": rng.choice(ids["consumables"][:5]),
+            "department_id": rng.choice(ids["departments"]),
+            "transaction_type": "OUT" if rng.random() < 0.6 else "IN",
+            "quantity": rng.randint(1, 3),
+        }
+
+    return {
+        "asset_search": lambda rng: (
+            "GET", f"/assets/search?name={rng.choice(SEARCH_TERMS)}"
+                   f"&page={rng.randint(1, 5)}", None),
+        "asset_list": lambda rng: ("GET", "/assets", None),
+        "transaction_search": lambda rng: (
+            "GET", f"/stocktransactions/{rng.choice(ids['locations'])}"
+                   f"?page={rng.randint(1, 5)}", None),
+        "consumable_list": lambda rng: (
+            "GET", f"/consumables/{rng.choice(ids['locations'])}", None),
+        "counts": lambda rng: ("GET", "/count/assets", None),
+        "stock_movement": stock_movement,
+        "asset_create": asset_create,
+    }
+
+
+def worker(client, operations, mix, deadline, seed, results, lock):
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    samples = defaultdict(list)
+    errors = defaultdict(lambda: defaultdict(int))
+    while time.monotonic() < deadline:
+        name = rng.choices(names, weights)[0]
+        method, path, body = operations[name](rng)
+        started = time.perf_counter()
+        status, _ = client.send(method, path, body)
+        samples[name].append((time.perf_counter() - started) * 1000)
+        # A rejected stock OUT (400, insufficient stock) is expected.
+        if status == 0 or status >= 500 or (
+                status >= 400 and name != "stock_movement"):
+            errors[name][str(status)] += 1
+    with lock:
+        for name, values in samples.items():
+            results["samples"][name].extend(values)
+        for name, codes in errors.items():
+            for code, count in codes.items():
+                results["errors"][name][code] += count
+
+
+def percentile(values, q):
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def summarise(results, elapsed):
+    endpoints = {}
+    for name, values in sorted(results["samples"].items()):
+        values.sort()
+        failed = sum(results["errors"][name].values())
+        endpoints[name] = {
+            "requests": len(values),
+            "throughput_rps": round(len(values) / elapsed, 2),
+            "p50_ms": round(percentile(values, 0.50), 2),
+            "p95_ms": round(percentile(values, 0.95), 2),
+            "p99_ms": round(percentile(values, 0.99), 2),
+            "error_rate": round(failed / len(values), 4),
+            "errors": dict(results["errors"][name]),
+        }
+    total = sum(e["requests"] for e in endpoints.values())
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 2),
+        "endpoints": endpoints,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--mix", choices=sorted(MIXES), default="default")
+    parser.add_argument(
+        "--weights",
+        help='JSON object overriding the mix, e.g. \'{"asset_search": 80, '
+             '"stock_movement": 20}\'.')
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write the JSON report here.")
+    args = parser.parse_args(argv)
+
+    mix = json.loads(args.weights) if args.weights else MIXES[args.mix]
+    client = Client(args.base_url, args.timeout)
+    client.login(args.email, args.password)
+    status, body = client.send("GET", "/verify-token")
+    if status != 200:
+        raise SystemExit(f"GET /verify-token returned {status}.")
+    user_id = body["id"]
+    ids = discover(client)
+    operations = build_operations(ids, user_id)
+    unknown = set(mix) - set(operations)
+    if unknown:
+        raise SystemExit(f"Unknown operations in mix: {sorted(unknown)}")
+
+    results = {
+        "samples": defaultdict(list),
+        "errors": defaultdict(lambda: defaultdict(int)),
+    }
+    lock = threading.Lock()
+    started = time.monotonic()
+    deadline = started + args.duration
+    threads = [
+        threading.Thread(
+            target=worker,
+            args=(client, operations, mix, deadline, args.seed + n,
+                  results, lock))
+        for n in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = {
+        "base_url": args.base_url,
+        "threads": args.threads,
+        "mix": mix,
+        **summarise(results, time.monotonic() - started),
+    }
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+
+    print(f"{'endpoint':<22}{'reqs':>8}{'rps':>9}{'p50':>9}{'p95':>9}"
+          f"{'p99':>9}{'err%':>8}")
+    for name, row in report["endpoints"].items():
+        print(f"{name:<22}{row['requests']:>8}{row['throughput_rps']:>9}"
+              f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}"
+              f"{row['error_rate'] * 100:>8.2f}")
+    print(f"total {report['requests']} requests, "
+          f"{report['throughput_rps']} req/s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
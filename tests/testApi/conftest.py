@@ -1,5 +1,6 @@
 import pytest
 from datetime import datetime
+from sqlalchemy import event
 from flask_jwt_extended import create_access_token, create_refresh_token
 from app import create_app
 from app.extensions import db
@@ -90,6 +91,32 @@ def refresh_client(client, app):
     return client, {"Authorization": f"Bearer {refresh_token}"}
 
 
+@pytest.fixture()
+def capture_queries(app):
+    """
+    Returns a callable that runs a request and records every SQL statement
+    it sends, as (statement, parameters) pairs, using the engine's
+    before_cursor_execute event.
+    """
+    with app.app_context():
+        engine = db.engine
+
+    def capture(send):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = send()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        return response, statements
+
+    return capture
+
+
 def seed_test_data():
     """Helper function to seed test data into the database."""
     dept = Department(name="ICT")
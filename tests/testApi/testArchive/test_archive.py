@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+from sqlalchemy import select, func
+from app.extensions import db
+from app.models.v1 import (
+    Asset, AssetLifecycle, AssetLifecycleArchive, Consumables, Department,
+    Location, StockTransaction, StockTransactionArchive, User)
+from utils.archive_helpers import archive_old_rows
+
+
+def _seed_history(app):
+    """Add one old and one recent row to each archived table."""
+    with app.app_context():
+        asset = Asset.query.first()
+        consumable = Consumables.query.first()
+        consumable.location_id = Location.query.first().id
+        old = datetime.now() - timedelta(days=500)
+        for created_at in (old, datetime.now()):
+            db.session.add(AssetLifecycle(
+                asset_id=asset.id, event="Audit", created_at=created_at))
+            db.session.add(StockTransaction(
+                consumable_id=consumable.id,
+                department_id=Department.query.first().id,
+                user_id=User.query.first().id,
+                transaction_type="IN", quantity=3, created_at=created_at))
+        db.session.commit()
+        return asset.id, consumable.location_id
+
+
+def _count(model):
+    return db.session.execute(
+        select(func.count()).select_from(model)).scalar()
+
+
+def test_archive_moves_rows_past_horizon(app):
+    """Test that only rows older than the horizon are moved, in chunks"""
+    _seed_history(app)
+    with app.app_context():
+        live_lifecycles = _count(AssetLifecycle)
+        live_transactions = _count(StockTransaction)
+        result = archive_old_rows(horizon_days=365, chunk_size=1)
+        assert result == {"ran": True, "moved": {
+            "asset_lifecycles": 1, "stock_transactions": 1}}
+        assert _count(AssetLifecycle) == live_lifecycles - 1
+        assert _count(StockTransaction) == live_transactions - 1
+        assert _count(AssetLifecycleArchive) == 1
+        assert _count(StockTransactionArchive) == 1
+        assert archive_old_rows(horizon_days=365)["moved"] == {
+            "asset_lifecycles": 0, "stock_transactions": 0}
+
+
+def test_asset_history_reads_through_archive(user_client, app):
+    """Test that an asset's lifecycle list still shows archived events"""
+    client, headers = user_client
+    asset_id, _ = _seed_history(app)
+    before = client.get(f"/assets/{asset_id}/lifecycles", headers=headers)
+    with app.app_context():
+        archive_old_rows(horizon_days=365)
+    after = client.get(f"/assets/{asset_id}/lifecycles", headers=headers)
+    assert after.status_code == 200
+    assert sorted(e["id"] for e in after.json) == \
+        sorted(e["id"] for e in before.json)
+
+    timeline = client.get(f"/assets/{asset_id}/timeline?limit=100",
+                          headers=headers).json["events"]
+    assert len([e for e in timeline if e["kind"] == "lifecycle"]) == \
+        len(after.json)
+
+
+def test_transaction_search_crossing_horizon(user_client, app):
+    """Test that only date ranges reaching the archive include it"""
+    client, headers = user_client
+    _, location_id = _seed_history(app)
+    with app.app_context():
+        archive_old_rows(horizon_days=365)
+    old_start = (datetime.now() - timedelta(days=600)).strftime("%Y-%m-%d")
+    recent_start = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+
+    historical = client.get(
+        f"/transaction/search/{location_id}?start_date={old_start}",
+        headers=headers)
+    recent = client.get(
+        f"/transaction/search/{location_id}?start_date={recent_start}",
+        headers=headers)
+    assert historical.status_code == 200
+    assert historical.json["total"] == recent.json["total"] + 1
+
+
+def test_archive_skips_when_lock_is_held(app, mocker):
+    """Test that a run stops cleanly while another worker archives"""
+    _seed_history(app)
+    mocker.patch("utils.archive_helpers.try_advisory_xact_lock",
+                 return_value=False)
+    with app.app_context():
+        live_lifecycles = _count(AssetLifecycle)
+        assert archive_old_rows(horizon_days=365) == {"ran": False, "moved": {
+            "asset_lifecycles": 0, "stock_transactions": 0}}
+        assert _count(AssetLifecycle) == live_lifecycles
+        assert _count(AssetLifecycleArchive) == 0
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+from app.extensions import db
+from app.models.v1 import Asset, AssetLifecycle, Ticket
+
+
+def _seed_events(app):
+    """Add lifecycle and ticket events, several sharing a timestamp."""
+    with app.app_context():
+        asset_id = Asset.query.first().id
+        base = datetime(2024, 1, 1, 9, 0, 0)
+        for n in range(6):
+            db.session.add(AssetLifecycle(
+                asset_id=asset_id, event=f"Event {n}",
+                created_at=base + timedelta(hours=n // 2)))
+            db.session.add(Ticket(
+                asset_id=asset_id, description=f"Ticket {n}",
+                created_at=base + timedelta(hours=n // 2)))
+        db.session.commit()
+        return asset_id
+
+
+def test_timeline_merges_sources_newest_first(asset_user_client, app):
+    """Test that events from every source come back in time order"""
+    client, headers, _, _ = asset_user_client
+    asset_id = _seed_events(app)
+    response = client.get(f"/assets/{asset_id}/timeline?limit=100",
+                          headers=headers)
+    assert response.status_code == 200
+    events = response.json["events"]
+    assert {"lifecycle", "ticket"} <= {event["kind"] for event in events}
+    keys = [(event["occurred_at"], event["kind"], event["id"])
+            for event in events]
+    assert keys == sorted(keys, reverse=True)
+    assert response.json["next_cursor"] is None
+
+
+def test_timeline_cursor_pages_without_gaps(asset_user_client, app):
+    """Test that following next_cursor visits every event exactly once"""
+    client, headers, _, _ = asset_user_client
+    asset_id = _seed_events(app)
+    everything = client.get(f"/assets/{asset_id}/timeline?limit=100",
+                            headers=headers).json["events"]
+
+    seen, cursor = [], None
+    while True:
+        url = f"/assets/{asset_id}/timeline?limit=3"
+        if cursor:
+            url += f"&cursor={cursor}"
+        page = client.get(url, headers=headers).json
+        assert len(page["events"]) <= 3
+        seen.extend(page["events"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == everything
+
+
+def test_timeline_rejects_bad_cursor(asset_user_client, app):
+    """Test that a malformed cursor returns 400"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        asset_id = Asset.query.first().id
+    response = client.get(f"/assets/{asset_id}/timeline?cursor=bogus",
+                          headers=headers)
+    assert response.status_code == 400
+
+
+def test_timeline_unknown_asset(user_client):
+    """Test that an asset outside the domain returns 404"""
+    client, headers = user_client
+    response = client.get("/assets/999999/timeline", headers=headers)
+    assert response.status_code == 404
@@ -0,0 +1,117 @@
+from app.models.v1 import Asset, Location, Status
+from app.extensions import db
+
+
+def test_bulk_update_status_by_ids(asset_user_client, app):
+    """Test changing status for a list of assets without renaming"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        retired = Status(name="retired", description="Out of service")
+        db.session.add(retired)
+        db.session.commit()
+        status_id = retired.id
+        asset = Asset.query.first()
+        asset_id, original_name = asset.id, asset.name
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"asset_ids": [asset_id], "changes": {"status_id": status_id}})
+    assert response.status_code == 200
+    assert response.json["updated"] == 1
+    assert response.json["renamed"] == 0
+    with app.app_context():
+        asset = db.session.get(Asset, asset_id)
+        assert asset.status_id == status_id
+        assert asset.name == original_name
+
+
+def test_bulk_update_location_renames(asset_user_client, app):
+    """Test that a location change regenerates the asset name"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        location_id = Location.query.filter_by(name="society").first().id
+        asset_id = Asset.query.first().id
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"asset_ids": [asset_id],
+              "changes": {"location_id": location_id}})
+    assert response.status_code == 200
+    assert response.json["renamed"] == 1
+    with app.app_context():
+        asset = db.session.get(Asset, asset_id)
+        assert asset.location_id == location_id
+        assert asset.name == "SOCI-ICT-DES01"
+
+
+def test_bulk_update_by_filters(asset_user_client, app):
+    """Test selecting assets with search filters"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        status_id = Status.query.first().id
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"filters": {"location": "Plant"},
+              "changes": {"status_id": status_id}})
+    assert response.status_code == 200
+    assert response.json["updated"] == 1
+
+
+def test_bulk_update_no_matching_assets(asset_user_client, app):
+    """Test bulk update when nothing matches"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        status_id = Status.query.first().id
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"asset_ids": [9999], "changes": {"status_id": status_id}})
+    assert response.status_code == 404
+
+
+def test_bulk_update_invalid_changes(asset_user_client, app):
+    """Test unknown references and empty changes"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        asset_id = Asset.query.first().id
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"asset_ids": [asset_id], "changes": {"status_id": 9999}})
+    assert response.status_code == 400
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"asset_ids": [asset_id], "changes": {}})
+    assert response.status_code == 400
+
+
+def test_bulk_update_disallowed_field(asset_user_client, app):
+    """Test that only whitelisted fields may be changed"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        asset_id = Asset.query.first().id
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"asset_ids": [asset_id], "changes": {"asset_tag": "X"}})
+    assert response.status_code == 400
+
+
+def test_bulk_update_requires_one_selector(asset_user_client):
+    """Test missing selector"""
+    client, headers, _, _ = asset_user_client
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"changes": {"status_id": 1}})
+    assert response.status_code == 400
+
+
+def test_bulk_update_invalid_content_type(asset_user_client):
+    """Test unsupported content type"""
+    client, headers, _, _ = asset_user_client
+    response = client.patch(
+        "/update/assets",
+        headers={**headers, "Content-Type": "text/plain"},
+        data="changes")
+    assert response.status_code == 415
+
+
+def test_bulk_update_unauthorized(client):
+    """Test bulk update without authentication"""
+    response = client.patch("/update/assets", json={})
+    assert response.status_code == 401
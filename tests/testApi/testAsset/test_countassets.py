@@ -0,0 +1,95 @@
+import threading
+import time
+import pytest
+from app.extensions import db
+from app.models.v1 import Asset, Consumables, DomainCounter, Department
+from utils.counter_helpers import reconcile_domain_counters
+
+
+def test_counts_from_counters(user_client, capture_queries):
+    """Test that the totals are read without scanning the tables"""
+    client, headers = user_client
+    response, statements = capture_queries(
+        lambda: client.get("/count/assets", headers=headers))
+    assert response.status_code == 200
+    assert response.json == {
+        "totalAssets": 1, "totalConsumables": 12, "totalSoftware": 2}
+    assert not any(
+        "count(" in statement.lower() or "sum(" in statement.lower()
+        for statement, _ in statements)
+
+
+def test_counts_follow_inserts_deletes_and_stock(asset_user_client, app):
+    """Test that counters move with asset and stock changes"""
+    client, headers, asset_info, _ = asset_user_client
+    payload = {key: value for key, value in asset_info.items()
+               if key not in ("ip_address", "mac_address")}
+    response = client.post(
+        "/register/asset", headers=headers,
+        json={**payload, "fresha_tag": "FT-COUNT-1"})
+    assert response.status_code == 201
+    with app.app_context():
+        consumable_id = Consumables.query.first().id
+        department_id = Department.query.first().id
+    client.post("/register/stocktransaction", headers=headers, json={
+        "consumable_id": consumable_id, "department_id": department_id,
+        "transaction_type": "OUT", "quantity": 5})
+
+    counts = client.get("/count/assets", headers=headers).json
+    assert counts["totalAssets"] == 2
+    assert counts["totalConsumables"] == 7
+
+    with app.app_context():
+        db.session.delete(
+            Asset.query.filter_by(fresha_tag="FT-COUNT-1").first())
+        db.session.commit()
+    assert client.get(
+        "/count/assets", headers=headers).json["totalAssets"] == 1
+
+
+def test_reconcile_corrects_drift(user_client, app):
+    """Test that the reconciliation job repairs wrong counters"""
+    client, headers = user_client
+    with app.app_context():
+        db.session.query(DomainCounter).filter_by(name="assets").update(
+            {"value": 40})
+        db.session.query(DomainCounter).filter_by(name="software").delete()
+        db.session.commit()
+        assert reconcile_domain_counters() == 2
+        assert reconcile_domain_counters() == 0
+    counts = client.get("/count/assets", headers=headers).json
+    assert counts["totalAssets"] == 1
+    assert counts["totalSoftware"] == 2
+
+
+def test_reconcile_keeps_concurrent_write(user_client, app):
+    """Test that a write committing during a reconcile is not overwritten"""
+    client, headers = user_client
+    with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            pytest.skip("SQLite serialises writers; needs row locks")
+        template = Asset.query.first()
+        fields = {
+            column: getattr(template, column) for column in (
+                "category_id", "location_id", "status_id",
+                "department_id", "assigned_to")}
+    flushed = threading.Event()
+
+    def write():
+        with app.app_context():
+            db.session.add(Asset(
+                asset_tag="RECONCILE-1", name="Reconcile race",
+                serial_number="SN-RECONCILE-1", **fields))
+            db.session.flush()
+            flushed.set()
+            time.sleep(0.5)
+            db.session.commit()
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    flushed.wait(5)
+    with app.app_context():
+        reconcile_domain_counters()
+    writer.join()
+    assert client.get(
+        "/count/assets", headers=headers).json["totalAssets"] == 2
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+from app.extensions import db
+from app.models.v1 import Asset, AssetLoan, User
+from utils.loan_helpers import mark_overdue_loans
+
+
+def _seed_loans(app):
+    """One past-due, one returned and one current loan."""
+    with app.app_context():
+        asset_id = Asset.query.first().id
+        borrower_id = User.query.first().id
+        past = datetime.now() - timedelta(days=3)
+        loans = [
+            AssetLoan(asset_id=asset_id, borrower_id=borrower_id,
+                      expected_return_date=past),
+            AssetLoan(asset_id=asset_id, borrower_id=borrower_id,
+                      expected_return_date=past, actual_return_date=past,
+                      status="RETURNED"),
+            AssetLoan(asset_id=asset_id, borrower_id=borrower_id,
+                      expected_return_date=datetime.now() + timedelta(days=3)),
+        ]
+        db.session.add_all(loans)
+        db.session.commit()
+        return asset_id, [loan.id for loan in loans]
+
+
+def test_sweep_flips_only_past_due_loans(app):
+    """Test that the sweep is set-based and idempotent"""
+    _, (overdue_id, returned_id, current_id) = _seed_loans(app)
+    with app.app_context():
+        assert mark_overdue_loans() == {"ran": True, "marked": 1}
+        assert mark_overdue_loans() == {"ran": True, "marked": 0}
+        statuses = {loan.id: loan.status for loan in AssetLoan.query.all()}
+    assert statuses[overdue_id] == "OVERDUE"
+    assert statuses[returned_id] == "RETURNED"
+    assert statuses[current_id] == "BORROWED"
+
+
+def test_overdue_filter_reads_status(user_client, app):
+    """Test that ?overdue=true lists the loans flagged by the sweep"""
+    client, headers = user_client
+    _, (overdue_id, _, _) = _seed_loans(app)
+    response = client.get("/asset-loans?overdue=true", headers=headers)
+    assert response.json["asset_loans"] == []
+    with app.app_context():
+        mark_overdue_loans()
+    response = client.get("/asset-loans?overdue=true", headers=headers)
+    assert response.status_code == 200
+    assert [loan["id"] for loan in response.json["asset_loans"]] == \
+        [overdue_id]
+
+
+def test_overdue_loan_blocks_new_loan(user_client, app):
+    """Test that an asset with an overdue loan cannot be lent again"""
+    client, headers = user_client
+    asset_id, _ = _seed_loans(app)
+    with app.app_context():
+        mark_overdue_loans()
+        AssetLoan.query.filter_by(status="BORROWED").delete()
+        db.session.commit()
+        borrower_id = User.query.first().id
+    response = client.post("/register/asset-loans", headers=headers, json={
+        "asset_id": asset_id, "borrower_id": borrower_id,
+        "expected_return_date": (
+            datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d"),
+        "condition_before": "Good"})
+    assert response.status_code == 400
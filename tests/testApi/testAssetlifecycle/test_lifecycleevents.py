@@ -0,0 +1,76 @@
+from app.extensions import db
+from app.models.v1 import Asset, AssetLifecycle, Status
+
+
+def _events(app, asset_id):
+    with app.app_context():
+        return [
+            event.event for event in db.session.query(AssetLifecycle)
+            .filter_by(asset_id=asset_id).order_by(AssetLifecycle.id)]
+
+
+def test_status_change_is_recorded(user_client, app):
+    """Test that updating an asset's status adds a lifecycle event"""
+    client, headers = user_client
+    with app.app_context():
+        status = Status(name="repair", description="Under repair")
+        db.session.add(status)
+        db.session.commit()
+        status_id = status.id
+        asset_id = Asset.query.first().id
+    response = client.put(f"/update/asset/{asset_id}", headers=headers,
+                          json={"status_id": status_id})
+    assert response.status_code == 200
+    assert _events(app, asset_id)[-1] == "Status change"
+
+
+def test_transfer_records_one_event(asset_user_client, app, capture_queries):
+    """Test that a transfer is recorded once, in one batched insert"""
+    client, headers, _, assettransfer_info = asset_user_client
+    asset_id = assettransfer_info["asset_id"]
+    before = _events(app, asset_id)
+    response, statements = capture_queries(lambda: client.post(
+        "/register/assettransfer", headers=headers,
+        json=assettransfer_info))
+    assert response.status_code == 201
+    assert _events(app, asset_id)[len(before):] == ["Asset transfer"]
+    inserts = [statement for statement, _ in statements
+               if statement.startswith("INSERT INTO asset_lifecycles")]
+    assert len(inserts) == 1
+
+
+def test_registering_asset_is_recorded(asset_user_client, app):
+    """Test that a new asset starts its history with an event"""
+    client, headers, asset_info, _ = asset_user_client
+    payload = {key: value for key, value in asset_info.items()
+               if key not in ("ip_address", "mac_address")}
+    response = client.post("/register/asset", headers=headers,
+                           json={**payload, "fresha_tag": "FT-LC-1"})
+    assert response.status_code == 201
+    with app.app_context():
+        asset_id = Asset.query.filter_by(fresha_tag="FT-LC-1").first().id
+    assert _events(app, asset_id) == ["Asset registered"]
+
+
+def test_bulk_update_records_events(asset_user_client, app, capture_queries):
+    """Test that a bulk update records each changed attribute in one
+    batched insert"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        status = Status(name="retired", description="Out of service")
+        db.session.add(status)
+        db.session.commit()
+        status_id = status.id
+        asset = Asset.query.first()
+        asset_id, department_id = asset.id, asset.department_id
+    before = _events(app, asset_id)
+    response, statements = capture_queries(lambda: client.patch(
+        "/update/assets", headers=headers,
+        json={"asset_ids": [asset_id],
+              "changes": {"status_id": status_id,
+                          "department_id": department_id}}))
+    assert response.status_code == 200
+    assert _events(app, asset_id)[len(before):] == ["Status change"]
+    inserts = [statement for statement, _ in statements
+               if statement.startswith("INSERT INTO asset_lifecycles")]
+    assert len(inserts) == 1
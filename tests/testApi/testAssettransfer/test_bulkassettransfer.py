@@ -0,0 +1,110 @@
+from app.models.v1 import Asset, AssetTransfer, AssetLifecycle, Location
+from app.extensions import db
+
+
+def _bulk_payload(assettransfer_info, **selector):
+    return {
+        **selector,
+        "to_location_id": assettransfer_info["to_location_id"],
+        "transferred_to": assettransfer_info["transferred_to"],
+        "notes": "office move"
+    }
+
+
+def test_bulk_transfer_by_ids(asset_user_client, app):
+    """Test bulk transfer of an explicit list of assets"""
+    client, headers, _, assettransfer_info = asset_user_client
+    with app.app_context():
+        transfer_events = AssetLifecycle.query.filter_by(
+            event="Asset transfer").count()
+    payload = _bulk_payload(
+        assettransfer_info, asset_ids=[assettransfer_info["asset_id"]])
+    response = client.post(
+        "/assettransfer/bulk", headers=headers, json=payload)
+    assert response.status_code == 201
+    assert response.json["transferred"] == 1
+    assert response.json["skipped"] == 0
+    with app.app_context():
+        asset = db.session.get(Asset, assettransfer_info["asset_id"])
+        assert asset.location_id == assettransfer_info["to_location_id"]
+        assert asset.assigned_to == assettransfer_info["transferred_to"]
+        assert AssetTransfer.query.count() == 2
+        assert AssetLifecycle.query.filter_by(
+            event="Asset transfer").count() == transfer_events + 1
+
+
+def test_bulk_transfer_by_location(asset_user_client, app):
+    """Test bulk transfer of every asset in a location"""
+    client, headers, _, assettransfer_info = asset_user_client
+    with app.app_context():
+        location_id = Location.query.filter_by(name="Plant").first().id
+    payload = _bulk_payload(assettransfer_info, location_id=location_id)
+    response = client.post(
+        "/assettransfer/bulk", headers=headers, json=payload)
+    assert response.status_code == 201
+    assert response.json["matched"] == 1
+    assert response.json["chunks"] == 1
+
+
+def test_bulk_transfer_skips_assets_at_destination(asset_user_client):
+    """Test that assets already at the destination are skipped"""
+    client, headers, _, assettransfer_info = asset_user_client
+    payload = _bulk_payload(
+        assettransfer_info, asset_ids=[assettransfer_info["asset_id"]])
+    client.post("/assettransfer/bulk", headers=headers, json=payload)
+    response = client.post(
+        "/assettransfer/bulk", headers=headers, json=payload)
+    assert response.status_code == 201
+    assert response.json["transferred"] == 0
+    assert response.json["skipped"] == 1
+
+
+def test_bulk_transfer_requires_one_selector(asset_user_client):
+    """Test missing and conflicting selectors"""
+    client, headers, _, assettransfer_info = asset_user_client
+    response = client.post(
+        "/assettransfer/bulk", headers=headers,
+        json=_bulk_payload(assettransfer_info))
+    assert response.status_code == 400
+    response = client.post(
+        "/assettransfer/bulk", headers=headers,
+        json=_bulk_payload(
+            assettransfer_info,
+            asset_ids=[assettransfer_info["asset_id"]], location_id=1))
+    assert response.status_code == 400
+
+
+def test_bulk_transfer_no_matching_assets(asset_user_client):
+    """Test bulk transfer when the selector matches nothing"""
+    client, headers, _, assettransfer_info = asset_user_client
+    payload = _bulk_payload(assettransfer_info, asset_ids=[9999])
+    response = client.post(
+        "/assettransfer/bulk", headers=headers, json=payload)
+    assert response.status_code == 404
+
+
+def test_bulk_transfer_invalid_destination(asset_user_client):
+    """Test bulk transfer to a non-existent location"""
+    client, headers, _, assettransfer_info = asset_user_client
+    payload = _bulk_payload(
+        assettransfer_info, asset_ids=[assettransfer_info["asset_id"]])
+    payload["to_location_id"] = 9999
+    response = client.post(
+        "/assettransfer/bulk", headers=headers, json=payload)
+    assert response.status_code == 400
+
+
+def test_bulk_transfer_invalid_content_type(asset_user_client):
+    """Test unsupported content type"""
+    client, headers, _, _ = asset_user_client
+    response = client.post(
+        "/assettransfer/bulk",
+        headers={**headers, "Content-Type": "text/plain"},
+        data="asset_ids=1")
+    assert response.status_code == 415
+
+
+def test_bulk_transfer_unauthorized(client):
+    """Test bulk transfer without authentication"""
+    response = client.post("/assettransfer/bulk", json={})
+    assert response.status_code == 401
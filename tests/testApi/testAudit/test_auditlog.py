@@ -0,0 +1,142 @@
+from datetime import datetime
+from app.extensions import db
+from app.models.v1 import Asset, AuditLog, Software, User
+from utils.audit_helpers import audit_writer, mask
+
+
+def test_asset_reassignment_is_audited(asset_user_client, app):
+    """Test that a reassignment is logged with the acting user"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        asset = Asset.query.first()
+        asset_id, old_user = asset.id, asset.assigned_to
+        new_user = User.query.filter_by(email="vnjenga@gmail.com").first().id
+    response = client.put(f"/update/asset/{asset_id}", headers=headers,
+                          json={"assigned_to": new_user})
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/audit-log?entity=assets&entity_id={asset_id}", headers=headers)
+    assert response.status_code == 200
+    [entry] = response.json["entries"]
+    assert entry["field"] == "assigned_to"
+    assert entry["old_value"] == str(old_user)
+    assert entry["new_value"] == str(new_user)
+    assert entry["user_id"] is not None
+
+
+def test_license_key_is_masked(user_client, app):
+    """Test that license keys never reach the audit log in clear"""
+    client, headers = user_client
+    with app.app_context():
+        software_id = Software.query.first().id
+    response = client.put(f"/software/{software_id}", headers=headers,
+                          json={"license_key": "NEW1-2345-6789-ABCD"})
+    assert response.status_code == 200
+    entries = client.get("/audit-log?entity=software",
+                         headers=headers).json["entries"]
+    assert entries[0]["new_value"] == mask("NEW1-2345-6789-ABCD")
+    assert entries[0]["new_value"].endswith("ABCD")
+    assert "NEW1" not in entries[0]["new_value"]
+    assert entries[0]["old_value"].startswith("*")
+
+
+def test_rolled_back_changes_are_not_audited(app):
+    """Test that only committed changes are logged"""
+    with app.app_context():
+        Asset.query.first().assigned_to = None
+        db.session.flush()
+        db.session.rollback()
+        db.session.commit()
+        assert AuditLog.query.count() == 0
+
+
+def test_async_writer_batches_and_flushes(app):
+    """Test that queued entries are written by the background writer"""
+    app.config["AUDIT_ASYNC"] = True
+    with app.app_context():
+        asset = Asset.query.first()
+        asset.status_id = None
+        db.session.commit()
+        audit_writer().flush()
+        assert AuditLog.query.filter_by(field="status_id").count() == 1
+
+
+def test_fallback_file_is_replayed(app, tmp_path):
+    """Test that spilled entries are restored by replay"""
+    with app.app_context():
+        writer = audit_writer()
+        writer.fallback_path = str(tmp_path / "audit.ndjson")
+        writer._spill([{
+            "entity": "assets", "entity_id": 1, "field": "status_id",
+            "old_value": "1", "new_value": "2", "user_id": None,
+            "domain_id": None, "changed_at": datetime.now(),
+        }])
+        assert writer.replay() == 1
+        assert writer.replay() == 0
+        assert AuditLog.query.count() == 1
+
+
+def test_bulk_update_is_audited(asset_user_client, app):
+    """Test that a bulk status change is logged per asset"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        asset = Asset.query.first()
+        asset_id, old_status = asset.id, asset.status_id
+    response = client.patch(
+        "/update/assets", headers=headers,
+        json={"asset_ids": [asset_id], "changes": {"status_id": None}})
+    assert response.status_code == 200
+    with app.app_context():
+        [entry] = AuditLog.query.filter_by(entity_id=asset_id).all()
+        assert entry.field == "status_id"
+        assert entry.old_value == str(old_status)
+        assert entry.new_value is None
+        assert entry.user_id is not None
+
+
+def test_bulk_transfer_is_audited(asset_user_client, app):
+    """Test that a bulk transfer logs the reassignment of each asset"""
+    client, headers, _, assettransfer_info = asset_user_client
+    asset_id = assettransfer_info["asset_id"]
+    with app.app_context():
+        old_user = db.session.get(Asset, asset_id).assigned_to
+    response = client.post("/assettransfer/bulk", headers=headers, json={
+        "asset_ids": [asset_id],
+        "to_location_id": assettransfer_info["to_location_id"],
+        "transferred_to": assettransfer_info["transferred_to"],
+        "notes": "office move"
+    })
+    assert response.status_code == 201
+    with app.app_context():
+        [entry] = AuditLog.query.filter_by(entity_id=asset_id).all()
+        assert entry.field == "assigned_to"
+        assert entry.old_value == str(old_user)
+        assert entry.new_value == str(assettransfer_info["transferred_to"])
+
+
+def test_replay_leaves_later_spills_for_the_next_replay(
+        app, tmp_path, monkeypatch):
+    """Test that entries spilled while a replay runs are not lost"""
+    entry = {
+        "entity": "assets", "entity_id": 1, "field": "status_id",
+        "old_value": "1", "new_value": "2", "user_id": None,
+        "domain_id": None, "changed_at": datetime.now(),
+    }
+    with app.app_context():
+        writer = audit_writer()
+        writer.fallback_path = str(tmp_path / "audit.ndjson")
+        writer._spill([entry])
+        real_open = open
+
+        def spill_during_load(path, *args, **kwargs):
+            if ".replay-" in str(path):
+                writer._spill([entry])
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", spill_during_load)
+        assert writer.replay() == 1
+        monkeypatch.undo()
+        assert [path.name for path in tmp_path.iterdir()] == ["audit.ndjson"]
+        assert writer.replay() == 1
+        assert AuditLog.query.count() == 2
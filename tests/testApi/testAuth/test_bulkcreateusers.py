@@ -0,0 +1,135 @@
+import io
+from app.models.v1 import User, Role, Department
+from app.extensions import db
+
+
+def _refs(app):
+    with app.app_context():
+        return Role.query.first().id, Department.query.first().id
+
+
+def _user(role_id, dept_id, email, payroll_no):
+    return {
+        "fullname": "new staff",
+        "email": email,
+        "payroll_no": payroll_no,
+        "role_id": role_id,
+        "department_id": dept_id
+    }
+
+
+def test_bulk_register_users_json(user_client, app, mocker):
+    """Test provisioning users from a JSON list"""
+    client, headers = user_client
+    send = mocker.patch("app.api.auth.send_bulk_welcome_emails")
+    role_id, dept_id = _refs(app)
+    payload = [
+        _user(role_id, dept_id, "Staff1@Example.com", "P9001"),
+        _user(role_id, dept_id, "staff2@example.com", "P9002"),
+    ]
+    response = client.post(
+        "/auth/register/bulk", headers=headers, json=payload)
+    assert response.status_code == 201
+    assert response.json["created"] == 2
+    send.assert_called_once()
+    assert len(send.call_args[0][0]) == 2
+    with app.app_context():
+        user = User.query.filter_by(email="staff1@example.com").first()
+        assert user is not None
+        assert user.fullname == "New Staff"
+        assert user.must_change_password is True
+
+
+def test_bulk_register_users_csv(user_client, app, mocker):
+    """Test provisioning users from an uploaded CSV file"""
+    client, headers = user_client
+    mocker.patch("app.api.auth.send_bulk_welcome_emails")
+    role_id, dept_id = _refs(app)
+    csv_body = (
+        "fullname,email,payroll_no,role_id,department_id\n"
+        f"csv one,csv1@example.com,P9101,{role_id},{dept_id}\n"
+        f"csv two,csv2@example.com,P9102,{role_id},{dept_id}\n"
+    )
+    response = client.post(
+        "/auth/register/bulk", headers=headers,
+        data={"file": (io.BytesIO(csv_body.encode()), "users.csv")},
+        content_type="multipart/form-data")
+    assert response.status_code == 201
+    assert response.json["created"] == 2
+
+
+def test_bulk_register_users_existing_email(user_client, app, mocker):
+    """Test that an already registered email rejects the whole batch"""
+    client, headers = user_client
+    send = mocker.patch("app.api.auth.send_bulk_welcome_emails")
+    role_id, dept_id = _refs(app)
+    payload = [
+        _user(role_id, dept_id, "fresh@example.com", "P9201"),
+        _user(role_id, dept_id, "vnjenga@gmail.com", "P9202"),
+    ]
+    response = client.post(
+        "/auth/register/bulk", headers=headers, json=payload)
+    assert response.status_code == 400
+    assert "Email already registered." in response.json["errors"]["1"]["email"]
+    send.assert_not_called()
+    with app.app_context():
+        assert User.query.filter_by(email="fresh@example.com").first() is None
+
+
+def test_bulk_register_users_duplicate_in_payload(user_client, app):
+    """Test duplicate emails and payroll numbers within the payload"""
+    client, headers = user_client
+    role_id, dept_id = _refs(app)
+    payload = [
+        _user(role_id, dept_id, "dup@example.com", "P9301"),
+        _user(role_id, dept_id, "dup@example.com", "P9301"),
+    ]
+    response = client.post(
+        "/auth/register/bulk", headers=headers, json=payload)
+    assert response.status_code == 400
+    assert "email" in response.json["errors"]["1"]
+    assert "payroll_no" in response.json["errors"]["1"]
+
+
+def test_bulk_register_users_invalid_references(user_client, app):
+    """Test unknown role and department ids"""
+    client, headers = user_client
+    payload = [_user(9999, 9999, "ghost@example.com", "P9401")]
+    response = client.post(
+        "/auth/register/bulk", headers=headers, json=payload)
+    assert response.status_code == 400
+    assert "role_id" in response.json["errors"]["0"]
+    assert "department_id" in response.json["errors"]["0"]
+
+
+def test_bulk_register_users_missing_fields(user_client):
+    """Test rows missing required fields"""
+    client, headers = user_client
+    response = client.post(
+        "/auth/register/bulk", headers=headers,
+        json=[{"email": "incomplete@example.com"}])
+    assert response.status_code == 400
+
+
+def test_bulk_register_users_empty(user_client):
+    """Test an empty import"""
+    client, headers = user_client
+    response = client.post(
+        "/auth/register/bulk", headers=headers, json=[])
+    assert response.status_code == 400
+
+
+def test_bulk_register_users_unsupported_media_type(user_client):
+    """Test an unsupported content type"""
+    client, headers = user_client
+    response = client.post(
+        "/auth/register/bulk",
+        headers={**headers, "Content-Type": "text/plain"},
+        data="users")
+    assert response.status_code == 415
+
+
+def test_bulk_register_users_unauthorized(client):
+    """Test bulk provisioning without authentication"""
+    response = client.post("/auth/register/bulk", json=[])
+    assert response.status_code == 401
@@ -0,0 +1,76 @@
+from app.extensions import db
+from app.models.v1 import Category, Domain, User
+
+
+def test_cached_categories_skip_database(user_client, capture_queries):
+    """Test that repeated reads are served without SQL"""
+    client, headers = user_client
+    first = client.get("/categories", headers=headers)
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] in (
+        "private, max-age=60", "max-age=60, private")
+    response, statements = capture_queries(
+        lambda: client.get("/categories", headers=headers))
+    assert response.status_code == 200
+    assert response.get_data() == first.get_data()
+    assert statements == []
+
+
+def test_cached_categories_conditional_request(user_client):
+    """Test that a matching If-None-Match returns 304"""
+    client, headers = user_client
+    etag = client.get("/categories", headers=headers).headers["ETag"]
+    response = client.get(
+        "/categories", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_category_write_invalidates_cache(user_client):
+    """Test that a mutation through the blueprint refreshes the list"""
+    client, headers = user_client
+    before = client.get("/categories", headers=headers).json
+    response = client.post("/register/category", headers=headers, json={
+        "name": "printers", "description": "Printing devices"})
+    assert response.status_code == 201
+    after = client.get("/categories", headers=headers).json
+    assert len(after) == len(before) + 1
+
+
+def test_orm_change_outside_api_invalidates_cache(user_client, app):
+    """Test that any committed change to the table refreshes the list"""
+    client, headers = user_client
+    before = client.get("/categories", headers=headers).json
+    with app.app_context():
+        db.session.add(Category(name="Audio:Speaker"))
+        db.session.commit()
+    assert len(client.get("/categories", headers=headers).json) == \
+        len(before) + 1
+
+
+def test_core_change_waits_for_ttl(user_client, app):
+    """Test that the TTL bounds staleness for writes the bus never sees"""
+    client, headers = user_client
+    before = client.get("/categories", headers=headers).json
+    with app.app_context():
+        db.session.execute(
+            Category.__table__.insert().values(name="Audio:Speaker"))
+        db.session.commit()
+    assert client.get("/categories", headers=headers).json == before
+    app.config["REFERENCE_CACHE_TTL"] = 0
+    assert len(client.get("/categories", headers=headers).json) == \
+        len(before) + 1
+
+
+def test_domain_change_is_seen_on_cache_hits(user_client, app):
+    """Test that a token issued before a domain change reads the user's
+    new domain, not the cached list of the old one"""
+    client, headers = user_client
+    assert client.get("/categories", headers=headers).json
+    with app.app_context():
+        domain = Domain(name="Engineering")
+        db.session.add(domain)
+        db.session.flush()
+        User.query.filter_by(
+            email="bonnyrangi95@gmail.com").first().domain_id = domain.id
+        db.session.commit()
+    assert client.get("/categories", headers=headers).json == []
@@ -0,0 +1,115 @@
+import time
+from datetime import timedelta
+import numpy as np
+from sqlalchemy import select, func
+from app.extensions import db
+from app.models.v1 import Consumables, Department
+from utils.forecast_helpers import burn_rates, forecast_stockouts
+
+
+def _consume(client, headers, app, quantity):
+    with app.app_context():
+        con_id = Consumables.query.first().id
+        dept_id = Department.query.first().id
+    client.post("/register/stocktransaction", headers=headers, json={
+        "consumable_id": con_id,
+        "department_id": dept_id,
+        "transaction_type": "OUT",
+        "quantity": quantity
+    })
+
+
+def test_forecast_with_consumption(user_client, app):
+    """Test that recent consumption produces a stockout date"""
+    client, headers = user_client
+    _consume(client, headers, app, 4)
+    response = client.get(
+        "/consumables/forecast?method=sma&history_days=7", headers=headers)
+    assert response.status_code == 200
+    item = response.json["forecast"][0]
+    assert item["quantity"] == 8
+    assert item["daily_burn_rate"] > 0
+    assert item["predicted_stockout_date"] is not None
+    assert item["suggested_reorder_quantity"] > 0
+
+
+def test_forecast_window_follows_database_date(user_client, app):
+    """Test that today's rollup bucket, keyed by the database's date, is
+    the one a one-day window reads"""
+    client, headers = user_client
+    _consume(client, headers, app, 4)
+    with app.app_context():
+        db_today = db.session.scalar(select(func.current_date()))
+    response = client.get(
+        "/consumables/forecast?method=sma&history_days=1", headers=headers)
+    assert response.status_code == 200
+    item = response.json["forecast"][0]
+    assert item["daily_burn_rate"] == 4
+    assert item["predicted_stockout_date"] == (db_today + timedelta(
+        days=int(item["days_until_stockout"]))).isoformat()
+
+
+def test_forecast_without_consumption(user_client):
+    """Test that idle consumables never stock out"""
+    client, headers = user_client
+    response = client.get("/consumables/forecast", headers=headers)
+    assert response.status_code == 200
+    item = response.json["forecast"][0]
+    assert item["daily_burn_rate"] == 0
+    assert item["predicted_stockout_date"] is None
+
+
+def test_burn_rates_methods():
+    """Test moving average and exponential smoothing"""
+    history = np.array([[0, 0, 0, 10], [2, 2, 2, 2]], dtype=float)
+    np.testing.assert_allclose(
+        burn_rates(history, method="sma", window=2), [5, 2])
+    ewma = burn_rates(history, method="ewma", alpha=0.5)
+    assert ewma[0] > 2.5
+    assert ewma[1] == 2
+
+
+def test_forecast_stockouts_values():
+    """Test stockout days and suggested reorder quantities"""
+    days, reorder, suggested = forecast_stockouts(
+        np.array([20.0, 5.0]), np.array([10.0, 10.0]),
+        np.array([2.0, 0.0]), lead_time_days=5, coverage_days=5)
+    assert days[0] == 10
+    assert reorder[0] == 5
+    assert suggested[0] == 10
+    assert np.isinf(days[1])
+    assert suggested[1] == 5
+
+
+def test_forecast_scales_to_thousands():
+    """Test that forecasting thousands of consumables stays fast"""
+    rng = np.random.default_rng(0)
+    history = rng.poisson(3, size=(5000, 365)).astype(float)
+    quantities = rng.integers(0, 500, size=5000).astype(float)
+    started = time.perf_counter()
+    rates = burn_rates(history)
+    forecast_stockouts(
+        quantities, np.full(5000, 10.0), rates, 7, 30)
+    assert time.perf_counter() - started < 0.5
+
+
+def test_forecast_invalid_method(user_client):
+    """Test an unsupported smoothing method"""
+    client, headers = user_client
+    response = client.get(
+        "/consumables/forecast?method=arima", headers=headers)
+    assert response.status_code == 400
+
+
+def test_forecast_invalid_history(user_client):
+    """Test an out of range history window"""
+    client, headers = user_client
+    response = client.get(
+        "/consumables/forecast?history_days=0", headers=headers)
+    assert response.status_code == 400
+
+
+def test_forecast_unauthorized(client):
+    """Test forecasting without authentication"""
+    response = client.get("/consumables/forecast")
+    assert response.status_code == 401
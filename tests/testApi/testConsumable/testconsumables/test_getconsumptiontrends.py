@@ -0,0 +1,139 @@
+from datetime import datetime
+from app.models.v1 import (
+    Consumables, Department, ConsumptionRollup, StockTransaction)
+from app.extensions import db
+
+
+def _ids(app):
+    with app.app_context():
+        return Consumables.query.first().id, Department.query.first().id
+
+
+def _post(client, headers, con_id, dept_id, transaction_type, quantity):
+    return client.post("/register/stocktransaction", headers=headers, json={
+        "consumable_id": con_id,
+        "department_id": dept_id,
+        "transaction_type": transaction_type,
+        "quantity": quantity
+    })
+
+
+def test_trends_follow_new_transactions(user_client, app):
+    """Test that the write path keeps the rollups current"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    _post(client, headers, con_id, dept_id, "OUT", 4)
+    _post(client, headers, con_id, dept_id, "IN", 2)
+    response = client.get("/consumption/trends", headers=headers)
+    assert response.status_code == 200
+    trend = response.json["trends"][0]
+    assert trend["period"] == datetime.now().strftime("%Y-%m")
+    assert trend["quantity_out"] == 4
+    assert trend["quantity_in"] == 2
+    assert trend["department"] == "ICT"
+
+
+def test_trends_daily_granularity(user_client, app):
+    """Test daily buckets"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    _post(client, headers, con_id, dept_id, "OUT", 3)
+    response = client.get(
+        "/consumption/trends?granularity=day", headers=headers)
+    assert response.status_code == 200
+    assert response.json["trends"][0]["period"] == \
+        datetime.now().strftime("%Y-%m-%d")
+
+
+def test_trends_after_deleting_transaction(user_client, app):
+    """Test that deleting a transaction takes it out of the rollups"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    response = _post(client, headers, con_id, dept_id, "OUT", 4)
+    transaction_id = response.json["transaction"]["id"]
+    client.delete(f"/stocktransaction/{transaction_id}", headers=headers)
+    with app.app_context():
+        rollup = ConsumptionRollup.query.filter_by(
+            consumable_id=con_id, department_id=dept_id).first()
+        assert rollup.quantity_out == 0
+
+
+def test_backfill_command_rebuilds_rollups(app):
+    """Test that the backfill command summarises the existing ledger"""
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["consumption", "backfill"])
+    assert result.exit_code == 0
+    with app.app_context():
+        totals = db.session.query(
+            db.func.sum(ConsumptionRollup.quantity_in),
+            db.func.sum(ConsumptionRollup.quantity_out)).one()
+        ledger_in = db.session.query(
+            db.func.sum(StockTransaction.quantity)).filter_by(
+                transaction_type="IN").scalar()
+        ledger_out = db.session.query(
+            db.func.sum(StockTransaction.quantity)).filter_by(
+                transaction_type="OUT").scalar()
+        assert totals == (ledger_in, ledger_out)
+    assert runner.invoke(args=["consumption", "backfill"]).exit_code == 0
+    with app.app_context():
+        assert db.session.query(
+            db.func.sum(ConsumptionRollup.quantity_out)).scalar() == ledger_out
+
+
+def test_trends_filtered_by_department(user_client, app):
+    """Test filtering by an unrelated department"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    _post(client, headers, con_id, dept_id, "OUT", 1)
+    response = client.get(
+        f"/consumption/trends?department_id={dept_id + 1}", headers=headers)
+    assert response.status_code == 200
+    assert response.json["trends"] == []
+
+
+def test_trends_invalid_granularity(user_client):
+    """Test an unsupported granularity"""
+    client, headers = user_client
+    response = client.get(
+        "/consumption/trends?granularity=week", headers=headers)
+    assert response.status_code == 400
+
+
+def test_trends_invalid_date(user_client):
+    """Test a malformed start date"""
+    client, headers = user_client
+    response = client.get(
+        "/consumption/trends?start_date=01-01-2025", headers=headers)
+    assert response.status_code == 400
+    assert "YYYY-MM-DD" in response.json["error"]
+
+
+def test_trends_unauthorized(client):
+    """Test trends without authentication"""
+    response = client.get("/consumption/trends")
+    assert response.status_code == 401
+
+
+def test_write_path_matches_backfill(user_client, app):
+    """Test that rollups kept by the write path equal a rebuild from the
+    ledger, day included"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    with app.app_context():
+        StockTransaction.query.delete()
+        ConsumptionRollup.query.delete()
+        db.session.commit()
+    _post(client, headers, con_id, dept_id, "OUT", 4)
+    _post(client, headers, con_id, dept_id, "IN", 2)
+
+    def rollups():
+        with app.app_context():
+            return sorted(
+                (row.consumable_id, row.department_id, row.day,
+                 row.quantity_in, row.quantity_out)
+                for row in ConsumptionRollup.query.all())
+
+    written = rollups()
+    runner = app.test_cli_runner()
+    assert runner.invoke(args=["consumption", "backfill"]).exit_code == 0
+    assert rollups() == written
@@ -0,0 +1,121 @@
+from app.models.v1 import StockTransaction, Consumables, Department, Alert
+from app.extensions import db
+
+
+def _ids(app):
+    with app.app_context():
+        consumable = Consumables.query.first()
+        dept = Department.query.first()
+        return consumable.id, dept.id
+
+
+def test_bulk_stock_transactions_success(user_client, app):
+    """Test aggregating several lines into one net stock change"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    payload = {"transactions": [
+        {"consumable_id": con_id, "department_id": dept_id,
+         "transaction_type": "IN", "quantity": 5},
+        {"consumable_id": con_id, "department_id": dept_id,
+         "transaction_type": "OUT", "quantity": 3},
+        {"consumable_id": con_id, "department_id": dept_id,
+         "transaction_type": "OUT", "quantity": 4},
+    ]}
+    response = client.post(
+        "/stocktransactions/bulk", headers=headers, json=payload)
+    assert response.status_code == 201
+    assert response.json["transactions"] == 3
+    assert response.json["consumables"][0]["quantity"] == 10
+    with app.app_context():
+        assert db.session.get(Consumables, con_id).quantity == 10
+        assert StockTransaction.query.count() == 5
+
+
+def test_bulk_stock_transactions_insufficient_stock(user_client, app):
+    """Test that an oversold batch writes nothing"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    payload = {"transactions": [
+        {"consumable_id": con_id, "department_id": dept_id,
+         "transaction_type": "OUT", "quantity": 10},
+        {"consumable_id": con_id, "department_id": dept_id,
+         "transaction_type": "OUT", "quantity": 10},
+    ]}
+    response = client.post(
+        "/stocktransactions/bulk", headers=headers, json=payload)
+    assert response.status_code == 400
+    assert "Insufficient stock" in response.json["error"]
+    with app.app_context():
+        assert db.session.get(Consumables, con_id).quantity == 12
+        assert StockTransaction.query.count() == 2
+
+
+def test_bulk_stock_transactions_creates_alert(user_client, app):
+    """Test that dropping below the reorder level raises one alert"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    payload = {"transactions": [
+        {"consumable_id": con_id, "department_id": dept_id,
+         "transaction_type": "OUT", "quantity": 2},
+        {"consumable_id": con_id, "department_id": dept_id,
+         "transaction_type": "OUT", "quantity": 3},
+    ]}
+    response = client.post(
+        "/stocktransactions/bulk", headers=headers, json=payload)
+    assert response.status_code == 201
+    with app.app_context():
+        assert Alert.query.filter_by(
+            consumable_id=con_id, status="PENDING").count() == 1
+
+
+def test_bulk_stock_transactions_consumable_not_found(user_client, app):
+    """Test bulk movement referencing an unknown consumable"""
+    client, headers = user_client
+    _, dept_id = _ids(app)
+    payload = {"transactions": [
+        {"consumable_id": 9999, "department_id": dept_id,
+         "transaction_type": "IN", "quantity": 1},
+    ]}
+    response = client.post(
+        "/stocktransactions/bulk", headers=headers, json=payload)
+    assert response.status_code == 404
+    assert "9999" in response.json["error"]
+
+
+def test_bulk_stock_transactions_invalid_lines(user_client, app):
+    """Test validation of line type and quantity"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app)
+    payload = {"transactions": [
+        {"consumable_id": con_id, "department_id": dept_id,
+         "transaction_type": "MOVE", "quantity": 0},
+    ]}
+    response = client.post(
+        "/stocktransactions/bulk", headers=headers, json=payload)
+    assert response.status_code == 400
+
+
+def test_bulk_stock_transactions_empty(user_client):
+    """Test bulk movement with no lines"""
+    client, headers = user_client
+    response = client.post(
+        "/stocktransactions/bulk", headers=headers,
+        json={"transactions": []})
+    assert response.status_code == 400
+
+
+def test_bulk_stock_transactions_unauthorized(client):
+    """Test bulk movement without authentication"""
+    response = client.post(
+        "/stocktransactions/bulk", json={"transactions": []})
+    assert response.status_code == 401
+
+
+def test_bulk_stock_transactions_invalid_content_type(user_client):
+    """Test bulk movement with a non-JSON body"""
+    client, headers = user_client
+    response = client.post(
+        "/stocktransactions/bulk",
+        headers={**headers, "Content-Type": "text/plain"},
+        data="transactions")
+    assert response.status_code == 415
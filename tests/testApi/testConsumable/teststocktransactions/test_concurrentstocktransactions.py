@@ -0,0 +1,95 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import func
+from app.models.v1 import StockTransaction, Consumables, Department
+from app.extensions import db
+
+WORKERS = 8
+REQUESTS_PER_WORKER = 10
+
+
+def _prepare(app, quantity):
+    """Set a known starting stock and return the ids needed for requests."""
+    with app.app_context():
+        consumable = Consumables.query.first()
+        consumable.quantity = quantity
+        db.session.commit()
+        last_id = db.session.query(func.max(StockTransaction.id)).scalar()
+        return consumable.id, Department.query.first().id, last_id
+
+
+def _run_concurrently(app, headers, payload_for):
+    """Fire requests from several threads released at the same moment."""
+    barrier = threading.Barrier(WORKERS)
+
+    def worker(worker_index):
+        client = app.test_client()
+        barrier.wait()
+        return [
+            client.post(
+                "/register/stocktransaction", headers=headers,
+                json=payload_for(worker_index, i)).status_code
+            for i in range(REQUESTS_PER_WORKER)
+        ]
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = pool.map(worker, range(WORKERS))
+    return [code for codes in results for code in codes]
+
+
+def _ledger_delta(app, consumable_id, after_id):
+    """Net quantity recorded in the ledger after the given transaction id."""
+    with app.app_context():
+        rows = db.session.query(
+            StockTransaction.transaction_type,
+            func.sum(StockTransaction.quantity)
+        ).filter(
+            StockTransaction.consumable_id == consumable_id,
+            StockTransaction.id > (after_id or 0)
+        ).group_by(StockTransaction.transaction_type).all()
+        totals = dict(rows)
+        return (totals.get("IN") or 0) - (totals.get("OUT") or 0)
+
+
+def test_concurrent_out_transactions_never_oversell(user_client, app):
+    """Test that racing OUT transactions stop exactly at zero stock"""
+    _, headers = user_client
+    stock = 25
+    con_id, dept_id, last_id = _prepare(app, stock)
+    payload = {
+        "consumable_id": con_id,
+        "department_id": dept_id,
+        "transaction_type": "OUT",
+        "quantity": 1
+    }
+    codes = _run_concurrently(app, headers, lambda w, i: payload)
+
+    assert set(codes) <= {201, 400}
+    assert codes.count(201) == stock
+    with app.app_context():
+        assert db.session.get(Consumables, con_id).quantity == 0
+    assert _ledger_delta(app, con_id, last_id) == -stock
+
+
+def test_concurrent_mixed_transactions_match_ledger(user_client, app):
+    """Test that quantity and ledger agree under mixed IN/OUT contention"""
+    _, headers = user_client
+    stock = 5
+    con_id, dept_id, last_id = _prepare(app, stock)
+
+    def payload_for(worker_index, i):
+        return {
+            "consumable_id": con_id,
+            "department_id": dept_id,
+            "transaction_type": "IN" if (worker_index + i) % 3 == 0
+            else "OUT",
+            "quantity": 2
+        }
+
+    codes = _run_concurrently(app, headers, payload_for)
+
+    assert set(codes) <= {201, 400}
+    with app.app_context():
+        quantity = db.session.get(Consumables, con_id).quantity
+    assert quantity >= 0
+    assert quantity - stock == _ledger_delta(app, con_id, last_id)
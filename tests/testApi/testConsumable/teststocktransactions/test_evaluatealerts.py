@@ -0,0 +1,146 @@
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.exc import IntegrityError
+from app.models.v1 import Alert, Consumables, Department
+from app.extensions import db
+from utils.alert_helpers import PENDING_ALERT_INDEX, dedupe_pending_alerts
+
+
+def _ids(app, quantity=None):
+    with app.app_context():
+        consumable = Consumables.query.first()
+        if quantity is not None:
+            consumable.quantity = quantity
+        Alert.query.filter_by(consumable_id=consumable.id).delete()
+        db.session.commit()
+        return consumable.id, Department.query.first().id
+
+
+def _out(con_id, dept_id, quantity=1):
+    return {
+        "consumable_id": con_id,
+        "department_id": dept_id,
+        "transaction_type": "OUT",
+        "quantity": quantity
+    }
+
+
+def _pending(app, con_id):
+    with app.app_context():
+        return Alert.query.filter_by(
+            consumable_id=con_id, status="PENDING").all()
+
+
+def test_alert_raised_after_commit(user_client, app):
+    """Test that dropping below the reorder level raises one alert"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app, quantity=12)
+    client.post("/register/stocktransaction", headers=headers,
+                json=_out(con_id, dept_id, 5))
+    client.post("/register/stocktransaction", headers=headers,
+                json=_out(con_id, dept_id, 1))
+    pending = _pending(app, con_id)
+    assert len(pending) == 1
+    with app.app_context():
+        assert pending[0].domain_id == \
+            db.session.get(Consumables, con_id).domain_id
+
+
+def test_alert_resolved_on_restock(user_client, app):
+    """Test that restocking resolves the pending alert"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app, quantity=12)
+    client.post("/register/stocktransaction", headers=headers,
+                json=_out(con_id, dept_id, 5))
+    client.post("/register/stocktransaction", headers=headers, json={
+        **_out(con_id, dept_id, 10), "transaction_type": "IN"})
+    assert _pending(app, con_id) == []
+
+
+def test_concurrent_transactions_single_pending_alert(user_client, app):
+    """Test that racing requests never duplicate pending alerts"""
+    _, headers = user_client
+    con_id, dept_id = _ids(app, quantity=40)
+    barrier = threading.Barrier(8)
+
+    def worker(_):
+        client = app.test_client()
+        barrier.wait()
+        for _ in range(4):
+            client.post("/register/stocktransaction", headers=headers,
+                        json=_out(con_id, dept_id))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+    assert len(_pending(app, con_id)) == 1
+
+
+def test_partial_unique_index_on_pending(app):
+    """Test that only one pending alert may exist per consumable"""
+    con_id, _ = _ids(app)
+    with app.app_context():
+        db.session.add_all([
+            Alert(consumable_id=con_id, message="old", status="RESOLVED"),
+            Alert(consumable_id=con_id, message="old", status="RESOLVED"),
+            Alert(consumable_id=con_id, message="low", status="PENDING"),
+        ])
+        db.session.commit()
+        db.session.add(
+            Alert(consumable_id=con_id, message="low", status="PENDING"))
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+
+
+def test_dedupe_pending_alerts_before_index(app):
+    """Test that duplicate pending alerts from before the index are
+    resolved, keeping the newest, and the index is then built"""
+    con_id, _ = _ids(app)
+    with app.app_context():
+        [index] = [index for index in Alert.__table__.indexes
+                   if index.name == PENDING_ALERT_INDEX]
+        with db.engine.begin() as connection:
+            index.drop(connection)
+        db.session.add_all([
+            Alert(consumable_id=con_id, message="low", status="PENDING")
+            for _ in range(3)])
+        db.session.commit()
+        newest = max(alert.id for alert in _pending(app, con_id))
+        with db.engine.begin() as connection:
+            assert dedupe_pending_alerts(connection) == 2
+        assert [alert.id for alert in _pending(app, con_id)] == [newest]
+        db.session.add(
+            Alert(consumable_id=con_id, message="low", status="PENDING"))
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+
+
+def test_evaluate_domain_alerts(user_client, app):
+    """Test batch re-evaluation of the whole domain"""
+    client, headers = user_client
+    con_id, _ = _ids(app, quantity=1)
+    response = client.post("/alerts/evaluate", headers=headers)
+    assert response.status_code == 200
+    assert response.json["created"] == 1
+    response = client.post("/alerts/evaluate", headers=headers)
+    assert response.json["created"] == 0
+    assert len(_pending(app, con_id)) == 1
+
+
+def test_rolled_back_change_not_evaluated(user_client, app):
+    """Test that a rejected bulk movement raises no alert"""
+    client, headers = user_client
+    con_id, dept_id = _ids(app, quantity=12)
+    response = client.post(
+        "/stocktransactions/bulk", headers=headers,
+        json={"transactions": [_out(con_id, dept_id, 50)]})
+    assert response.status_code == 400
+    assert _pending(app, con_id) == []
+
+
+def test_evaluate_domain_alerts_unauthorized(client):
+    """Test batch re-evaluation without authentication"""
+    response = client.post("/alerts/evaluate")
+    assert response.status_code == 401
@@ -0,0 +1,119 @@
+import json
+import pytest
+from app.extensions import db
+from app.models.v1 import Location, Consumables, Department
+from utils.event_bus import event_bus, Change, EventBus
+
+
+@pytest.fixture()
+def received():
+    """Subscribe a recorder to the bus for the duration of a test."""
+    batches = []
+    event_bus.subscribe(
+        "test_recorder", lambda changes, local: batches.append(
+            (sorted(changes, key=repr), local)))
+    yield batches
+    event_bus.unsubscribe("test_recorder")
+
+
+def test_commit_publishes_orm_changes(app, received):
+    """Test that flushed inserts, updates and deletes arrive on commit"""
+    with app.app_context():
+        location = Location(name="Annex", address="Kiambu")
+        db.session.add(location)
+        db.session.flush()
+        assert received == []
+        db.session.commit()
+        location_id = location.id
+
+        location.address = "Limuru"
+        db.session.commit()
+        db.session.delete(location)
+        db.session.commit()
+
+    assert [batch for batch, _ in received] == [
+        [Change(None, "locations", location_id, "insert")],
+        [Change(None, "locations", location_id, "update")],
+        [Change(None, "locations", location_id, "delete")],
+    ]
+    assert all(local for _, local in received)
+
+
+def test_rollback_publishes_nothing(app, received):
+    """Test that rolled back changes are discarded"""
+    with app.app_context():
+        db.session.add(Location(name="Annex", address="Kiambu"))
+        db.session.flush()
+        db.session.rollback()
+        db.session.commit()
+    assert received == []
+
+
+def test_core_stock_update_is_published(user_client, app, received):
+    """Test that adjust_stock records its Core UPDATE on the bus"""
+    client, headers = user_client
+    with app.app_context():
+        consumable_id = Consumables.query.first().id
+        department_id = Department.query.first().id
+    response = client.post("/register/stocktransaction", headers=headers,
+                           json={"consumable_id": consumable_id,
+                                 "department_id": department_id,
+                                 "transaction_type": "IN", "quantity": 1})
+    assert response.status_code == 201
+    changes = [change for batch, _ in received for change in batch]
+    assert Change(None, "consumables", consumable_id, "update") in changes
+
+
+def test_remote_changes_invalidate_cache(user_client, app, capture_queries):
+    """Test that changes from another process empty the local cache"""
+    client, headers = user_client
+    client.get("/locations", headers=headers)
+    with app.app_context():
+        event_bus.dispatch(
+            [Change(None, "locations", 1, "update")], local=False)
+    _, statements = capture_queries(
+        lambda: client.get("/locations", headers=headers))
+    assert statements
+
+
+def test_changes_forwarded_to_redis(app, mocker):
+    """Test that local commits are published on the Redis channel"""
+    client = mocker.Mock()
+    mocker.patch.object(event_bus, "_redis", client)
+    with app.app_context():
+        db.session.add(Location(name="Annex", address="Kiambu"))
+        db.session.commit()
+    channel, payload = client.publish.call_args.args
+    message = json.loads(payload)
+    assert channel == "inventory:changes"
+    assert message["origin"] == event_bus.origin
+    assert message["changes"][0][1:] == ["locations", mocker.ANY, "insert"]
+
+
+def test_listener_survives_disconnects_and_bad_messages(app, mocker):
+    """Test that the listener re-subscribes after a lost connection and
+    skips malformed messages"""
+    mocker.patch("utils.event_bus.LISTEN_RETRY_SECONDS", 0)
+    bus = EventBus()
+    received = []
+    bus.subscribe("test_recorder",
+                  lambda changes, local: received.append(changes))
+    good = json.dumps({"origin": "other",
+                       "changes": [[None, "locations", 1, "update"]]})
+
+    def listen():
+        yield {"data": "not json"}
+        yield {"data": json.dumps({"origin": "other"})}
+        bus.close()
+        yield {"data": good}
+
+    broken, working = mocker.Mock(), mocker.Mock()
+    broken.subscribe.side_effect = ConnectionError("connection lost")
+    working.listen.side_effect = listen
+    client = mocker.Mock()
+    client.pubsub.side_effect = [broken, working]
+
+    bus._listen(app, client, "inventory:changes")
+
+    assert working.subscribe.call_count == 1
+    assert received == [[Change(None, "locations", 1, "update")]]
@@ -0,0 +1,79 @@
+import re
+import pytest
+from app.models.v1 import Asset, Location
+from app.extensions import db
+
+LARGE_TABLES = {
+    "assets", "users", "tickets", "asset_transfers", "asset_lifecycles",
+    "asset_loans", "consumables", "stock_transactions", "alerts",
+    "external_maintenance", "consumption_rollups", "stock_snapshots",
+    "software",
+}
+
+ENDPOINTS = [
+    "/assets",
+    "/count/assets",
+    "/users",
+    "/assettransfers",
+    "/assetloans",
+    "/asset-loans?status=BORROWED",
+    "/asset-loans?overdue=true",
+    "/asset-lifecycles",
+    "/assets/{asset_id}/lifecycles",
+    "/assets/{asset_id}/timeline",
+    "/tickets/{asset_id}",
+    "/alerts",
+    "/alerts/pending",
+    "/maintenance",
+    "/consumables/{location_id}",
+    "/stocktransactions/{location_id}",
+    "/consumption/trends",
+]
+
+SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+def _sequential_scans(connection, statement, parameters):
+    """Large tables the planner would read without an index."""
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET enable_seqscan = off")
+        plan = connection.exec_driver_sql(
+            "EXPLAIN " + statement, parameters).scalars().all()
+        tables = [
+            match for line in plan for match in POSTGRES_SCAN.findall(line)]
+    else:
+        plan = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters).all()
+        tables = [
+            match.group(1) for match in
+            (SQLITE_SCAN.match(row[-1]) for row in plan) if match]
+    return sorted(table for table in tables if table in LARGE_TABLES)
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def test_endpoint_queries_use_indexes(
+        asset_user_client, app, capture_queries, endpoint):
+    """Test that no endpoint query falls back to a full table scan"""
+    client, headers, _, _ = asset_user_client
+    with app.app_context():
+        url = endpoint.format(
+            asset_id=Asset.query.first().id,
+            location_id=Location.query.first().id)
+        engine = db.engine
+    response, statements = capture_queries(
+        lambda: client.get(url, headers=headers))
+    assert response.status_code == 200, (url, response.json)
+    selects = [
+        (statement, parameters) for statement, parameters in statements
+        if statement.lstrip().upper().startswith("SELECT")
+    ]
+    assert selects
+
+    offenders = []
+    with engine.connect() as connection:
+        for statement, parameters in selects:
+            scans = _sequential_scans(connection, statement, parameters)
+            if scans:
+                offenders.append(f"{scans}: {statement}")
+    assert not offenders, "\n\n".join(offenders)
@@ -0,0 +1,72 @@
+import json
+import logging
+import pytest
+from app.instrumentation import register_sql_instrumentation
+
+
+def _instrument(app, threshold_ms):
+    app.config.update(
+        SQL_INSTRUMENTATION=True, SLOW_QUERY_THRESHOLD_MS=threshold_ms)
+    register_sql_instrumentation(app)
+
+
+def _slow_queries(caplog):
+    return [
+        json.loads(record.getMessage()) for record in caplog.records
+        if record.name == "app.instrumentation.slow_queries"
+    ]
+
+
+def test_server_timing_header(user_client, app):
+    """Test that statement count and DB time are reported"""
+    client, headers = user_client
+    _instrument(app, threshold_ms=10_000)
+    response = client.get("/assets", headers=headers)
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    assert "db;dur=" in timing
+    assert "db-slowest;dur=" in timing
+    count = int(timing.split('desc="')[1].split(" ")[0])
+    assert count >= 2
+
+
+def test_slow_queries_logged_with_labels(user_client, app, caplog):
+    """Test that statements over the threshold reach the slow-query log"""
+    client, headers = user_client
+    _instrument(app, threshold_ms=0)
+    with caplog.at_level(logging.WARNING):
+        client.get("/assets", headers=headers)
+    entries = _slow_queries(caplog)
+    assert entries
+    assert entries[0]["event"] == "slow_query"
+    assert entries[0]["route"] == "/assets"
+    assert entries[0]["method"] == "GET"
+    assert entries[0]["status"] == 200
+    assert "domain_id" in entries[0]
+    assert "SELECT" in entries[0]["statement"]
+
+
+def test_fast_queries_not_logged(user_client, app, caplog):
+    """Test that statements under the threshold are not logged"""
+    client, headers = user_client
+    _instrument(app, threshold_ms=10_000)
+    with caplog.at_level(logging.WARNING):
+        client.get("/assets", headers=headers)
+    assert _slow_queries(caplog) == []
+
+
+def test_disabled_by_default(user_client):
+    """Test that no header is added unless instrumentation is enabled"""
+    client, headers = user_client
+    response = client.get("/assets", headers=headers)
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+
+
+@pytest.mark.parametrize("enabled", [False, None])
+def test_disabled_installs_no_hooks(app, enabled):
+    """Test that a disabled feature leaves the app untouched"""
+    app.config["SQL_INSTRUMENTATION"] = enabled
+    before = list(app.after_request_funcs.get(None, []))
+    register_sql_instrumentation(app)
+    assert app.after_request_funcs.get(None, []) == before
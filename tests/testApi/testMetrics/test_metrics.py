@@ -0,0 +1,85 @@
+import json
+import os
+from utils.metrics import MetricsRegistry, instrument_redis
+
+
+def test_metrics_endpoint_reports_requests(user_client):
+    """Test that served requests show up in the exposition"""
+    client, headers = user_client
+    client.get("/assets", headers=headers)
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+    assert "# TYPE http_requests_total counter" in body
+    assert 'endpoint="asset_bp.get_all_asset"' in body
+    assert "http_request_duration_seconds_bucket{" in body
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test the histogram text format"""
+    registry = MetricsRegistry()
+    registry.describe("job_seconds", "histogram", "Job time.")
+    registry.observe("job_seconds", 0.003, {"job": "a"}, buckets=(0.01, 1))
+    registry.observe("job_seconds", 0.5, {"job": "a"}, buckets=(0.01, 1))
+    registry.observe("job_seconds", 7, {"job": "a"}, buckets=(0.01, 1))
+    body = registry.render()
+    assert 'job_seconds_bucket{job="a",le="0.01"} 1' in body
+    assert 'job_seconds_bucket{job="a",le="1"} 2' in body
+    assert 'job_seconds_bucket{job="a",le="+Inf"} 3' in body
+    assert 'job_seconds_count{job="a"} 3' in body
+
+
+def test_counters_and_gauges():
+    """Test counter increments and gauge adjustments"""
+    registry = MetricsRegistry()
+    registry.inc("hits_total", {"status": "200"})
+    registry.inc("hits_total", {"status": "200"}, value=2)
+    registry.inc_gauge("email_queue_depth", 3)
+    registry.inc_gauge("email_queue_depth", -1)
+    body = registry.render()
+    assert 'hits_total{status="200"} 3' in body
+    assert "email_queue_depth 2" in body
+
+
+def test_metrics_merged_across_processes(tmp_path):
+    """Test aggregation of snapshots written by other workers"""
+    registry = MetricsRegistry()
+    registry.configure(directory=str(tmp_path))
+    registry.inc("hits_total", {"status": "200"})
+    other = {
+        "pid": os.getppid(),
+        "counters": [["hits_total", [["status", "200"]], 4]],
+        "gauges": [["email_queue_depth", [], 2]],
+        "histograms": [],
+    }
+    (tmp_path / "metrics-1.json").write_text(json.dumps(other))
+    body = registry.render()
+    assert 'hits_total{status="200"} 5' in body
+    assert "email_queue_depth 2" in body
+
+
+def test_dead_process_gauges_dropped(tmp_path):
+    """Test that gauges from exited workers are ignored"""
+    registry = MetricsRegistry()
+    registry.configure(directory=str(tmp_path))
+    stale = {
+        "pid": 2 ** 22 + 1,
+        "counters": [["hits_total", [], 1]],
+        "gauges": [["db_pool_checked_out", [], 9]],
+        "histograms": [],
+    }
+    (tmp_path / "metrics-stale.json").write_text(json.dumps(stale))
+    body = registry.render()
+    assert "hits_total 1" in body
+    assert "db_pool_checked_out 9" not in body
+
+
+def test_redis_calls_are_timed(mocker):
+    """Test that the Redis proxy records command latency"""
+    client = mocker.Mock()
+    client.exists.return_value = 1
+    registry = mocker.patch("utils.metrics.metrics", MetricsRegistry())
+    assert instrument_redis(client).exists("key") == 1
+    assert 'redis_call_duration_seconds_count{command="exists"} 1' in \
+        registry.render()
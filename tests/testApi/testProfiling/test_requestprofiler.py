@@ -0,0 +1,68 @@
+import os
+from app.models.v1 import Role
+from app.extensions import db
+
+
+def test_profile_request_as_admin(user_client):
+    """Test that an admin receives stats and SQL for the request"""
+    client, headers = user_client
+    response = client.get("/assets?__profile=1", headers=headers)
+    assert response.status_code == 200
+    profile = response.json["profile"]
+    assert profile["endpoint"] == "asset_bp.get_all_asset"
+    assert profile["status"] == 200
+    assert "get_all_asset" in profile["stats"]
+    assert profile["sql_count"] == len(profile["sql"]) > 0
+    assert "SELECT" in profile["sql"][0]["statement"]
+
+
+def test_profile_sort_order(user_client):
+    """Test choosing the stats sort key"""
+    client, headers = user_client
+    response = client.get(
+        "/assets?__profile=1&__profile_sort=tottime", headers=headers)
+    assert response.json["profile"]["sort"] == "tottime"
+
+
+def test_profile_rate_limited(user_client):
+    """Test that an admin cannot profile twice within the interval"""
+    client, headers = user_client
+    assert client.get(
+        "/assets?__profile=1", headers=headers).status_code == 200
+    response = client.get("/assets?__profile=1", headers=headers)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+
+
+def test_profile_stored_in_directory(user_client, app, tmp_path):
+    """Test that reports are stored when PROFILE_DIR is set"""
+    client, headers = user_client
+    app.config["PROFILE_DIR"] = str(tmp_path)
+    response = client.get("/assets?__profile=1", headers=headers)
+    profile_id = response.json["profile"]["profile_id"]
+    assert os.path.exists(tmp_path / f"{profile_id}.prof")
+    assert os.path.exists(tmp_path / f"{profile_id}.json")
+
+
+def test_profile_requires_admin(user_client, app):
+    """Test that non-admin users cannot profile"""
+    client, headers = user_client
+    with app.app_context():
+        Role.query.first().name = "staff"
+        db.session.commit()
+    response = client.get("/assets?__profile=1", headers=headers)
+    assert response.status_code == 403
+
+
+def test_profile_requires_authentication(client):
+    """Test the switch without a token"""
+    response = client.get("/assets?__profile=1")
+    assert response.status_code == 401
+
+
+def test_without_switch_response_unchanged(user_client):
+    """Test that ordinary requests are not profiled"""
+    client, headers = user_client
+    response = client.get("/assets", headers=headers)
+    assert response.status_code == 200
+    assert "profile" not in response.json
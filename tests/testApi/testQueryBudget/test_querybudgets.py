@@ -0,0 +1,111 @@
+from collections import Counter
+from datetime import datetime, timedelta
+import pytest
+from app.models.v1 import (
+    User, Asset, Ticket, AssetLoan, AssetTransfer, AssetLifecycle,
+    Department, Role, Location, Category, Status)
+from app.extensions import db
+
+# Maximum number of SQL statements each route may send per request,
+# including the token blocklist check and the current-user lookup.
+QUERY_BUDGETS = {
+    "/assets": 4,
+    "/users": 4,
+    "/tickets": 3,
+    "/tickets/{asset_id}": 5,
+    "/assetloans": 4,
+    "/asset-loans": 4,
+    "/assettransfers": 4,
+    "/asset-lifecycles": 4,
+    "/alerts": 4,
+    "/consumption/trends": 6,
+}
+
+EXTRA_ROWS = 5
+
+
+def _user(i):
+    return User(
+        fullname=f"Budget User {i}",
+        email=f"budget{i}@example.com",
+        password="s3cur3p@ss??",
+        payroll_no=f"B{i:04d}",
+        department=Department(name=f"Budget Dept {i}"),
+        role=Role(name=f"budget role {i}")
+    )
+
+
+def _asset(i, user):
+    return Asset(
+        asset_tag=f"BUDGET-{i}",
+        fresha_tag=f"FRESHA-BUDGET-{i}",
+        serial_number=f"SN-BUDGET-{i}",
+        name=f"Budget Asset {i}",
+        user=user,
+        category=Category(name=f"Budget:Cat{i}"),
+        location=Location(name=f"Budget Location {i}"),
+        department=user.department,
+        status=Status(name=f"budget status {i}")
+    )
+
+
+def _seed_rows(asset_id):
+    """Add rows that each reference distinct related records."""
+    for i in range(EXTRA_ROWS):
+        user = _user(i)
+        asset = _asset(i, user)
+        db.session.add_all([
+            Ticket(asset=asset, user=user, description="Budget ticket"),
+            Ticket(asset_id=asset_id, user=user, description="Budget ticket"),
+            AssetLoan(
+                asset=asset, borrower=user,
+                expected_return_date=datetime.now() + timedelta(days=7)),
+            AssetTransfer(
+                asset=asset, sender=user, receiver=_user(i + 100),
+                from_location=asset.location,
+                to_location=Location(name=f"Budget Target {i}")),
+            AssetLifecycle(asset=asset, event="Budget event"),
+        ])
+    db.session.commit()
+
+
+def _url(app, route):
+    with app.app_context():
+        return route.format(asset_id=Asset.query.first().id)
+
+
+def _request(client, headers, capture_queries, url):
+    response, statements = capture_queries(
+        lambda: client.get(url, headers=headers))
+    assert response.status_code == 200, (url, response.json)
+    return [statement for statement, _ in statements]
+
+
+@pytest.mark.parametrize("route", sorted(QUERY_BUDGETS))
+def test_route_query_budget(asset_user_client, app, capture_queries, route):
+    """Test that each route stays within its declared query budget"""
+    client, headers, _, _ = asset_user_client
+    url = _url(app, route)
+    statements = _request(client, headers, capture_queries, url)
+    assert len(statements) <= QUERY_BUDGETS[route], (
+        f"{url} sent {len(statements)} queries "
+        f"(budget {QUERY_BUDGETS[route]}):\n\n" + "\n\n".join(statements))
+
+
+@pytest.mark.parametrize("route", sorted(QUERY_BUDGETS))
+def test_route_queries_do_not_grow_with_rows(
+        asset_user_client, app, capture_queries, route):
+    """Test that adding rows does not add queries (no N+1)"""
+    client, headers, _, _ = asset_user_client
+    url = _url(app, route)
+    before = _request(client, headers, capture_queries, url)
+    with app.app_context():
+        _seed_rows(Asset.query.first().id)
+    after = _request(client, headers, capture_queries, url)
+
+    extra = Counter(after) - Counter(before)
+    assert len(after) <= len(before), (
+        f"{url} went from {len(before)} to {len(after)} queries after "
+        f"adding {EXTRA_ROWS} rows. Repeated statements:\n\n" +
+        "\n\n".join(
+            f"x{count}: {statement}" for statement, count in extra.items()))
@@ -0,0 +1,74 @@
+from datetime import datetime
+from sqlalchemy import select, func
+from app.extensions import db
+from app.models.v1 import Asset, User, Domain, StockTransaction, Role
+from utils.synthetic_data import generate_synthetic_data
+
+
+def _snapshot():
+    return (
+        list(db.session.execute(
+            select(Asset.name, Asset.model_number)
+            .where(Asset.asset_tag.like("SYN%")).order_by(Asset.id))),
+        list(db.session.execute(
+            select(StockTransaction.quantity,
+                   StockTransaction.transaction_type,
+                   StockTransaction.created_at)
+            .order_by(StockTransaction.id))),
+    )
+
+
+def test_synthetic_data_is_proportional(app):
+    """Test the generated volumes and per-domain admin users"""
+    with app.app_context():
+        counts = generate_synthetic_data(
+            domains=2, assets=200, transactions=500, seed=7, chunk_size=64)
+        assert counts["domains"] == 2
+        assert counts["assets"] == 200
+        assert counts["stock_transactions"] == 500
+        assert counts["asset_loans"] == 20
+        assert counts["asset_transfers"] == 40
+        assert counts["external_maintenance"] == 10
+
+        for domain in Domain.query.filter(Domain.id.in_(
+                select(Asset.domain_id).where(
+                    Asset.asset_tag.like("SYN%")))):
+            admin = User.query.filter_by(domain_id=domain.id).order_by(
+                User.id).first()
+            assert db.session.get(Role, admin.role_id).name == "admin"
+            assert admin.is_active
+
+
+def test_synthetic_data_is_deterministic(app):
+    """Test that the same seed reproduces the same rows"""
+    with app.app_context():
+        generate_synthetic_data(
+            domains=2, assets=50, transactions=100, seed=11)
+        first = _snapshot()
+        db.drop_all()
+        db.create_all()
+        generate_synthetic_data(
+            domains=2, assets=50, transactions=100, seed=11)
+        assert _snapshot() == first
+
+
+def test_seed_synthetic_command(app):
+    """Test the flask seed synthetic command"""
+    result = app.test_cli_runner().invoke(args=[
+        "seed", "synthetic", "--domains", "1", "--assets", "20",
+        "--transactions", "30", "--seed", "3"])
+    assert result.exit_code == 0
+    assert "assets: 20" in result.output
+
+
+def test_seed_synthetic_anchor_date(app):
+    """Test that --anchor-date places the history before that date"""
+    result = app.test_cli_runner().invoke(args=[
+        "seed", "synthetic", "--domains", "1", "--assets", "20",
+        "--transactions", "30", "--seed", "3", "--anchor-date", "2024-06-30"])
+    assert result.exit_code == 0
+    with app.app_context():
+        newest = db.session.execute(
+            select(func.max(StockTransaction.created_at))
+            .where(StockTransaction.domain_id.is_not(None))).scalar()
+        assert newest <= datetime(2024, 6, 30)
@@ -168,3 +168,17 @@ def test_bulk_register_software_internal_server_error(user_client, mocker):
         "/software/bulk-register", headers=headers, json=payload)
     assert response.status_code == 500
     assert "An unexpected error occurred" in response.json["error"]
+
+
+def test_bulk_register_software_updates_counter(user_client):
+    """Test that bulk-registered software reaches the domain counter"""
+    client, headers = user_client
+    before = client.get(
+        "/count/assets", headers=headers).json["totalSoftware"]
+    payload = [{"name": name, "version": "1.0"}
+               for name in ("Notion", "Figma", "Postman")]
+    response = client.post(
+        "/software/bulk-register", headers=headers, json=payload)
+    assert response.status_code == 201
+    assert client.get(
+        "/count/assets", headers=headers).json["totalSoftware"] == before + 3
@@ -0,0 +1,123 @@
+import logging
+from sqlalchemy import update, select, func, literal, text
+from app.extensions import db
+from app.models.v1 import Consumables, Alert
+from utils.db_helpers import upsert
+from utils.event_bus import event_bus
+
+logger = logging.getLogger(__name__)
+
+PENDING_PREDICATE = "status = 'PENDING'"
+PENDING_ALERT_INDEX = "uq_alerts_pending_consumable"
+
+
+def evaluate_alerts(connection, consumable_ids=None, domain_id=None):
+    """
+    Bring low-stock alerts in line with current stock, set-based.
+
+    Pending alerts for consumables back at or above their reorder level
+    are resolved, and consumables below it get a pending alert. Inserts
+    use ON CONFLICT DO NOTHING against the partial unique index on
+    pending alerts, so concurrent evaluations never create duplicates.
+
+    Args:
+        connection (Connection): Connection to run the statements on.
+        consumable_ids (Iterable[int], optional): Consumables to evaluate.
+        domain_id (int, optional): Evaluate every consumable in the domain
+            when no consumable ids are given.
+
+    Returns:
+        tuple: (created, resolved) alert counts.
+    """
+    consumables = Consumables.__table__
+    alerts = Alert.__table__
+    if consumable_ids is not None:
+        scope = consumables.c.id.in_(list(consumable_ids))
+    else:
+        scope = consumables.c.domain_id == domain_id
+    low = func.coalesce(consumables.c.quantity, 0) < \
+        func.coalesce(consumables.c.reorder_level, 0)
+
+    resolved = connection.execute(
+        update(alerts)
+        .where(
+            alerts.c.status == "PENDING",
+            alerts.c.consumable_id.in_(
+                select(consumables.c.id).where(scope, ~low))
+        )
+        .values(status="RESOLVED", updated_at=func.now())
+    ).rowcount
+
+    stmt = upsert(alerts, bind=connection).from_select(
+        ["consumable_id", "message", "status", "domain_id"],
+        select(
+            consumables.c.id,
+            literal("Stock for ") + consumables.c.name +
+            literal(" is below reorder level."),
+            literal("PENDING", type_=alerts.c.status.type),
+            consumables.c.domain_id
+        ).where(scope, low)
+    ).on_conflict_do_nothing(
+        index_elements=["consumable_id"],
+        index_where=text(PENDING_PREDICATE)
+    )
+    created = connection.execute(stmt).rowcount
+    return created, resolved
+
+
+def dedupe_pending_alerts(connection):
+    """
+    Resolve all but the newest pending alert of each consumable, then
+    build the partial unique index on pending alerts if it is missing.
+
+    Databases created before the index existed can hold duplicate pending
+    alerts, on which building the index fails; run this once on them
+    before deploying the evaluator.
+
+    Returns:
+        int: Number of duplicate alerts resolved.
+    """
+    alerts = Alert.__table__
+    newest = (
+        select(func.max(alerts.c.id))
+        .where(alerts.c.status == "PENDING")
+        .group_by(alerts.c.consumable_id)
+    )
+    resolved = connection.execute(
+        update(alerts)
+        .where(alerts.c.status == "PENDING", alerts.c.id.not_in(newest))
+        .values(status="RESOLVED", updated_at=func.now())
+    ).rowcount
+    for index in alerts.indexes:
+        if index.name == PENDING_ALERT_INDEX:
+            index.create(connection, checkfirst=True)
+    return resolved
+
+
+def _evaluate_changed_consumables(changes, local):
+    """
+    Evaluate the consumables changed by a transaction this process just
+    committed. Other processes evaluate their own commits.
+
+    The committed session can no longer emit SQL, so evaluation runs in
+    its own short transaction on a fresh connection.
+    """
+    consumable_ids = {
+        change.id for change in changes
+        if local and change.model == Consumables.__tablename__
+        and change.operation != "delete"
+    }
+    if not consumable_ids:
+        return
+    try:
+        with db.engine.begin() as connection:
+            evaluate_alerts(connection, consumable_ids=consumable_ids)
+    except Exception:
+        logger.exception(
+            "Low-stock evaluation failed for consumables %s",
+            sorted(consumable_ids))
+
+
+def register_alert_evaluator():
+    """Run the alert evaluator for every committed change to stock."""
+    event_bus.subscribe("low_stock_alerts", _evaluate_changed_consumables)
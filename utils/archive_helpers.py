@@ -0,0 +1,132 @@
+import logging
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import select, insert, delete, func, union_all
+from sqlalchemy.orm import aliased
+from app.extensions import db
+from app.models.v1 import (
+    Domain, AssetLifecycle, AssetLifecycleArchive, StockTransaction,
+    StockTransactionArchive)
+from utils.db_helpers import try_advisory_xact_lock
+
+logger = logging.getLogger(__name__)
+
+# Key of the PostgreSQL advisory lock held while a chunk is archived.
+ARCHIVE_LOCK = 7_310_047
+
+ARCHIVES = {
+    AssetLifecycle: AssetLifecycleArchive,
+    StockTransaction: StockTransactionArchive,
+}
+
+
+def archive_boundary(model):
+    """
+    Creation time of the newest archived row of `model`, or None while
+    nothing has been archived. Read from the archive's created_at index.
+    """
+    archive = ARCHIVES[model]
+    return db.session.execute(
+        select(func.max(archive.created_at))).scalar()
+
+
+def with_archive(model, since=None):
+    """
+    The entity to query for history of `model` reaching back to `since`.
+
+    Returns `model` itself when no archived row can be that recent, so
+    queries over the last months keep using the live table and its
+    indexes. Otherwise returns an alias of `model` over the live and
+    archived rows combined with UNION ALL; it exposes the same attributes
+    and loads the same class, so callers filter and serialise it as usual.
+
+    Args:
+        model: AssetLifecycle or StockTransaction.
+        since (datetime, optional): Oldest creation time the query needs.
+            None reads the whole history.
+    """
+    boundary = archive_boundary(model)
+    if boundary is None or (since is not None and since > boundary):
+        return model
+    live = model.__table__
+    archived = ARCHIVES[model].__table__
+    combined = union_all(
+        select(*live.c),
+        select(*(archived.c[column.name] for column in live.c)),
+    ).subquery(f"{live.name}_history")
+    return aliased(model, combined)
+
+
+def _archive_chunk(model, domain_id, cutoff, chunk_size):
+    """
+    Move one chunk of a domain's old rows; returns the rows moved, or
+    None when another worker holds the archive lock.
+    """
+    if not try_advisory_xact_lock(ARCHIVE_LOCK):
+        db.session.rollback()
+        return None
+    live = model.__table__
+    archived = ARCHIVES[model].__table__
+    ids = db.session.execute(
+        select(live.c.id)
+        .where(
+            live.c.domain_id.is_(None) if domain_id is None
+            else live.c.domain_id == domain_id,
+            live.c.created_at < cutoff
+        )
+        .order_by(live.c.created_at)
+        .limit(chunk_size)
+    ).scalars().all()
+    if not ids:
+        db.session.commit()
+        return 0
+    columns = [column.name for column in live.c]
+    db.session.execute(
+        insert(archived).from_select(
+            columns, select(*live.c).where(live.c.id.in_(ids))))
+    db.session.execute(delete(live).where(live.c.id.in_(ids)))
+    db.session.commit()
+    return len(ids)
+
+
+def archive_old_rows(horizon_days=None, chunk_size=None):
+    """
+    Move lifecycle events and stock transactions older than the archive
+    horizon into their archive tables.
+
+    Rows are copied and deleted in chunks of ARCHIVE_CHUNK_SIZE, each in
+    its own short transaction, and selected per domain through the
+    (domain_id, created_at) indexes so the job never scans the live
+    tables. Every chunk runs under an advisory lock; when another worker
+    holds it this run stops and leaves the rest of the work to that one,
+    so overlapping runs never copy the same rows.
+
+    Args:
+        horizon_days (int, optional): Age in days beyond which rows are
+            archived. Defaults to ARCHIVE_HORIZON_DAYS (365).
+        chunk_size (int, optional): Rows per transaction.
+
+    Returns:
+        dict: Rows "moved" per table and whether the run "ran" to the
+        end or stopped because another worker held the lock.
+    """
+    config = current_app.config
+    horizon_days = horizon_days or config.get("ARCHIVE_HORIZON_DAYS", 365)
+    chunk_size = chunk_size or config.get("ARCHIVE_CHUNK_SIZE", 5000)
+    cutoff = datetime.now() - timedelta(days=horizon_days)
+    domain_ids = [None] + db.session.execute(
+        select(Domain.id)).scalars().all()
+
+    moved = {model.__tablename__: 0 for model in ARCHIVES}
+    for model in ARCHIVES:
+        for domain_id in domain_ids:
+            while True:
+                rows = _archive_chunk(model, domain_id, cutoff, chunk_size)
+                if rows is None:
+                    logger.info(
+                        "Archiving stopped: another worker holds the lock")
+                    return {"ran": False, "moved": moved}
+                moved[model.__tablename__] += rows
+                if rows < chunk_size:
+                    break
+    return {"ran": True, "moved": moved}
@@ -0,0 +1,181 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from sqlalchemy import or_, and_, select, literal, cast, null, union_all
+from app.extensions import db
+from app.models.v1 import (
+    Asset, AssetLifecycle, AssetLifecycleArchive, AssetLoan, AssetTransfer,
+    ExternalMaintenance, Ticket)
+from utils.db_helpers import sortable_timestamp, sortable_timestamp_value
+
+
+def asset_name_base(location, department, category):
+    """
+    Build the LOCA-DEPA-CAT prefix used for generated asset names.
+
+    Args:
+        location (Location): The asset's location.
+        department (Department): The asset's department.
+        category (Category): The asset's category (PREFIX:SUFFIX format).
+
+    Returns:
+        str | None: The name prefix, or None if the category name does not
+        follow the PREFIX:SUFFIX format.
+    """
+    category_parts = category.name.split(":")
+    if len(category_parts) < 2:
+        return None
+    location_code = location.name[:4].upper()
+    department_code = department.name[:4].upper()
+    category_suffix = category_parts[1][:3].upper()
+    return f"{location_code}-{department_code}-{category_suffix}"
+
+
+def allocate_asset_names(base_names, domain_id):
+    """
+    Allocate sequential asset names for many prefixes at once.
+
+    The highest existing two-digit suffix of every prefix is read in a
+    single query, then numbers are handed out in memory, so naming N assets
+    costs one lookup instead of N.
+
+    Args:
+        base_names (list[str]): One prefix per asset to name. Repeated
+            prefixes receive consecutive numbers.
+        domain_id (int): Domain the names are unique within.
+
+    Returns:
+        list[str]: Allocated names, in the same order as base_names.
+    """
+    prefixes = set(base_names)
+    if not prefixes:
+        return []
+
+    existing = db.session.query(Asset.name).filter(
+        Asset.domain_id == domain_id,
+        or_(*[Asset.name.like(f"{prefix}%") for prefix in prefixes])
+    )
+    next_number = dict.fromkeys(prefixes, 1)
+    for (name,) in existing:
+        prefix, suffix = name[:-2], name[-2:]
+        if prefix in next_number and suffix.isdigit():
+            next_number[prefix] = max(next_number[prefix], int(suffix) + 1)
+
+    names = []
+    for prefix in base_names:
+        names.append(f"{prefix}{str(next_number[prefix]).zfill(2)}")
+        next_number[prefix] += 1
+    return names
+
+
+TIMELINE_KINDS = (
+    "lifecycle", "loan", "maintenance", "ticket", "transfer")
+
+
+def encode_timeline_cursor(event):
+    """Opaque cursor pointing just after a timeline event."""
+    payload = [event["occurred_at"], event["kind"], event["id"]]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_timeline_cursor(cursor):
+    """
+    Inverse of encode_timeline_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        occurred_at, kind, event_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(occurred_at), kind, int(event_id)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def asset_timeline(asset_id, limit=20, cursor=None):
+    """
+    One page of an asset's lifecycle, transfer, loan, maintenance and
+    ticket events, newest first.
+
+    Each source contributes a branch that filters on (asset_id,
+    created_at), applies the keyset condition for its own kind and stops
+    after `limit + 1` rows, so every branch is a short index range scan.
+    The branches are merged with a single UNION ALL ordered by
+    (occurred_at, kind, id) descending. Archived lifecycle events keep
+    their ids and get a branch of their own, so history reads through the
+    archive without a separate request.
+
+    Args:
+        asset_id (int): Asset whose history is read.
+        limit (int): Page size.
+        cursor (tuple, optional): (occurred_at, kind, id) of the last
+            event of the previous page.
+
+    Returns:
+        tuple: (events, has_more), events being dicts with kind, id,
+        occurred_at, title, detail and status.
+    """
+    text_type = db.String
+    sources = [
+        ("lifecycle", AssetLifecycle, AssetLifecycle.event,
+         AssetLifecycle.notes, None),
+        ("lifecycle", AssetLifecycleArchive, AssetLifecycleArchive.event,
+         AssetLifecycleArchive.notes, None),
+        ("loan", AssetLoan, literal("Loan"), AssetLoan.remarks,
+         AssetLoan.status),
+        ("maintenance", ExternalMaintenance,
+         ExternalMaintenance.maintenance_type,
+         ExternalMaintenance.description, ExternalMaintenance.status),
+        ("ticket", Ticket, literal("Ticket"), Ticket.description,
+         Ticket.status),
+        ("transfer", AssetTransfer, literal("Transfer"), AssetTransfer.notes,
+         None),
+    ]
+
+    branches = []
+    for kind, model, title, detail, status in sources:
+        occurred = sortable_timestamp(model.created_at)
+        branch = select(
+            literal(kind, text_type).label("kind"),
+            model.id.label("id"),
+            occurred.label("occurred_at"),
+            cast(title, text_type).label("title"),
+            cast(detail, db.Text).label("detail"),
+            (cast(status, text_type) if status is not None
+             else null().cast(text_type)).label("status"),
+        ).where(model.asset_id == asset_id)
+        if cursor is not None:
+            cursor_at, cursor_kind, cursor_id = cursor
+            cursor_at = sortable_timestamp_value(cursor_at)
+            if kind < cursor_kind:
+                branch = branch.where(occurred <= cursor_at)
+            elif kind > cursor_kind:
+                branch = branch.where(occurred < cursor_at)
+            else:
+                branch = branch.where(or_(
+                    occurred < cursor_at,
+                    and_(occurred == cursor_at, model.id < cursor_id)))
+        branches.append(
+            branch.order_by(occurred.desc(), model.id.desc())
+            .limit(limit + 1).subquery().select())
+
+    timeline = union_all(*branches).subquery()
+    rows = db.session.execute(
+        select(timeline).order_by(
+            timeline.c.occurred_at.desc(), timeline.c.kind.desc(),
+            timeline.c.id.desc())
+        .limit(limit + 1)
+    ).mappings().all()
+    events = []
+    for row in rows[:limit]:
+        occurred_at = row["occurred_at"]
+        if isinstance(occurred_at, str):
+            occurred_at = datetime.fromisoformat(occurred_at)
+        events.append({
+            **row,
+            "occurred_at":
+                occurred_at.isoformat() if occurred_at else None,
+        })
+    return events, len(rows) > limit
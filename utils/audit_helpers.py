@@ -0,0 +1,283 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import uuid
+from datetime import datetime
+from flask import current_app, has_app_context, has_request_context
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import get_history
+from app.extensions import db
+from app.models.v1 import Asset, AuditLog, Software
+
+logger = logging.getLogger(__name__)
+
+PENDING_AUDIT = "pending_audit"
+
+# Audited model -> fields whose changes are logged.
+AUDITED = {
+    Asset: ("assigned_to", "status_id"),
+    Software: ("license_key",),
+}
+MASKED = {"license_key"}
+
+
+def mask(value):
+    """
+    Hide a secret, keeping its last four characters when it is long
+    enough for them not to give it away.
+    """
+    if value is None:
+        return None
+    value = str(value)
+    visible = value[-4:] if len(value) >= 8 else ""
+    return "*" * (len(value) - len(visible)) + visible
+
+
+def _render(field, value):
+    if value is None:
+        return None
+    return mask(value) if field in MASKED else str(value)
+
+
+def _current_user_id():
+    """Authenticated user of the current request, if any."""
+    if not has_request_context():
+        return None
+    try:
+        identity = get_jwt_identity()
+    except RuntimeError:
+        return None
+    return int(identity) if identity is not None else None
+
+
+class AuditWriter:
+    """
+    Writes audit entries in batches from a daemon thread, so requests
+    only pay for putting their entries on a bounded queue.
+
+    Entries that cannot be queued or written (queue full, database
+    unavailable, process exiting with a backlog it cannot store) are
+    appended to an NDJSON fallback file, which `flask audit replay`
+    loads back into the table.
+    """
+
+    def __init__(self, app):
+        config = app.config
+        self.app = app
+        self.batch_size = config.get("AUDIT_BATCH_SIZE", 500)
+        self.flush_seconds = config.get("AUDIT_FLUSH_SECONDS", 1.0)
+        self.fallback_path = config.get(
+            "AUDIT_FALLBACK_PATH",
+            os.path.join(app.instance_path, "audit-fallback.ndjson"))
+        self._queue = queue.Queue(maxsize=config.get("AUDIT_QUEUE_SIZE",
+                                                     10000))
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def submit(self, entries):
+        """Queue entries for the writer thread, or write them now when
+        AUDIT_ASYNC is off (the default under testing)."""
+        if not self.app.config.get("AUDIT_ASYNC", not self.app.testing):
+            self._write(entries)
+            return
+        self._ensure_started()
+        for position, entry in enumerate(entries):
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                logger.warning("Audit queue full, spilling %d entries",
+                               len(entries) - position)
+                self._spill(entries[position:])
+                return
+
+    def flush(self):
+        """Block until every queued entry has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        else:
+            self._write(self._drain())
+
+    def close(self):
+        """Stop the writer thread and write whatever is still queued."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(self.flush_seconds * 2)
+        self._write(self._drain())
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._thread is None:
+                atexit.register(self.close)
+            self._thread = threading.Thread(
+                target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def _drain(self, limit=None):
+        entries = []
+        while limit is None or len(entries) < limit:
+            try:
+                entries.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            self._queue.task_done()
+        return entries
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                first = self._queue.get(timeout=self.flush_seconds)
+            except queue.Empty:
+                continue
+            batch = [first] + self._drain(self.batch_size - 1)
+            try:
+                self._write(batch)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, entries):
+        if not entries:
+            return
+        try:
+            with self.app.app_context():
+                with db.engine.begin() as connection:
+                    connection.execute(
+                        insert(AuditLog.__table__), entries)
+        except Exception:
+            logger.exception("Writing %d audit entries failed", len(entries))
+            self._spill(entries)
+
+    def _spill(self, entries):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.fallback_path), exist_ok=True)
+            with open(self.fallback_path, "a", encoding="utf-8") as file:
+                for entry in entries:
+                    file.write(json.dumps(entry, default=str) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+
+    def replay(self):
+        """
+        Insert the entries of the fallback file and remove it.
+
+        The file is first renamed to a name unique to this replay, so
+        entries spilled meanwhile go to a fresh file and two replays never
+        load the same entries. When the insert fails the renamed file is
+        kept for inspection and the error is raised.
+
+        Returns:
+            int: Number of entries restored.
+        """
+        claimed = f"{self.fallback_path}.replay-{uuid.uuid4().hex}"
+        with self._lock:
+            try:
+                os.replace(self.fallback_path, claimed)
+            except FileNotFoundError:
+                return 0
+        with open(claimed, encoding="utf-8") as file:
+            entries = [json.loads(line) for line in file if line.strip()]
+        for entry in entries:
+            entry["changed_at"] = datetime.fromisoformat(entry["changed_at"])
+        if entries:
+            try:
+                with db.engine.begin() as connection:
+                    connection.execute(insert(AuditLog.__table__), entries)
+            except Exception:
+                logger.exception("Replaying audit entries failed, kept %s",
+                                 claimed)
+                raise
+        os.remove(claimed)
+        return len(entries)
+
+
+def audit_entries(model, entity_id, domain_id, changes):
+    """
+    Audit entries for the audited fields of `model` that changed, for
+    writers that update rows with Core statements and so bypass the
+    mapper hook. Submit them with audit_writer() once the transaction
+    commits.
+
+    Args:
+        model: An audited model class.
+        entity_id (int): The changed row.
+        domain_id (int | None): Domain of the row.
+        changes (dict): Field -> (old, new); unchanged values and fields
+            that are not audited are ignored.
+    """
+    user_id = _current_user_id()
+    entries = []
+    for field in AUDITED[model]:
+        if field not in changes:
+            continue
+        old, new = changes[field]
+        if old == new:
+            continue
+        entries.append({
+            "entity": model.__tablename__,
+            "entity_id": entity_id,
+            "field": field,
+            "old_value": _render(field, old),
+            "new_value": _render(field, new),
+            "user_id": user_id,
+            "domain_id": domain_id,
+            "changed_at": datetime.now(),
+        })
+    return entries
+
+
+def _collect_changes(mapper, connection, target):
+    """Remember the audited fields this flush changed."""
+    session = object_session(target)
+    if session is None:
+        return
+    changes = {}
+    for field in AUDITED[type(target)]:
+        history = get_history(target, field)
+        if history.has_changes():
+            old = history.deleted[0] if history.deleted else None
+            changes[field] = (old, getattr(target, field))
+    session.info.setdefault(PENDING_AUDIT, []).extend(audit_entries(
+        type(target), target.id, target.domain_id, changes))
+
+
+def _submit_after_commit(session):
+    entries = session.info.pop(PENDING_AUDIT, None)
+    if entries and has_app_context():
+        writer = current_app.extensions.get("audit_writer")
+        if writer is not None:
+            writer.submit(entries)
+
+
+def _discard_after_rollback(session, *args):
+    session.info.pop(PENDING_AUDIT, None)
+
+
+def audit_writer():
+    return current_app.extensions["audit_writer"]
+
+
+def register_audit_log(app):
+    """
+    Log committed changes of the audited fields.
+
+    A mapper hook records field-level diffs during the flush and the
+    session hands them to the application's AuditWriter once the
+    transaction commits, so rolled back changes are never logged and
+    requests never wait for the audit insert. Bulk handlers build their
+    entries with audit_entries and submit them after their commit.
+    """
+    app.extensions["audit_writer"] = AuditWriter(app)
+    for model in AUDITED:
+        if not event.contains(model, "after_update", _collect_changes):
+            event.listen(model, "after_update", _collect_changes)
+    for name, listener in (("after_commit", _submit_after_commit),
+                           ("after_rollback", _discard_after_rollback)):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
@@ -0,0 +1,172 @@
+import hashlib
+import threading
+import time
+from functools import wraps
+from flask import current_app, has_app_context, request
+from flask_jwt_extended import get_jwt_identity
+from app.extensions import db
+from app.models.v1 import User
+from utils.event_bus import event_bus
+
+MISSING = object()
+# Cache namespaces are named after the table each endpoint lists.
+CACHED_TABLES = {
+    "categories", "locations", "statuses", "departments", "roles",
+    "providers",
+}
+
+
+class ResponseCache:
+    """
+    Process-local store of rendered JSON bodies keyed by
+    (namespace, domain), along with the verified domain of each user that
+    read them. Entries expire after a TTL as a backstop for writes this
+    process never sees.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._domains = {}
+        self.generation = 0
+        self.user_generation = 0
+
+    def get(self, namespace, domain_id, ttl):
+        with self._lock:
+            entry = self._entries.get((namespace, domain_id))
+        if entry is None or time.monotonic() - entry[2] > ttl:
+            return None
+        return entry
+
+    def set(self, namespace, domain_id, body, etag, generation):
+        """
+        Store a body rendered while `generation` was current; a body
+        rendered before an invalidation that raced it is discarded.
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[(namespace, domain_id)] = (
+                body, etag, time.monotonic())
+
+    def invalidate(self, namespace, domain_id=MISSING):
+        """Drop one domain's entry, or every domain's when none is given."""
+        with self._lock:
+            self.generation += 1
+            if domain_id is not MISSING:
+                self._entries.pop((namespace, domain_id), None)
+                return
+            for key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[key]
+
+    def user_domain(self, user_id, ttl):
+        """Domain `user_id` was last verified in, or MISSING."""
+        with self._lock:
+            entry = self._domains.get(user_id)
+        if entry is None or time.monotonic() - entry[1] > ttl:
+            return MISSING
+        return entry[0]
+
+    def set_user_domain(self, user_id, domain_id, generation):
+        """
+        Remember a user's domain read while `generation` was current; a
+        read that raced a change to the users table is discarded.
+        """
+        with self._lock:
+            if generation == self.user_generation:
+                self._domains[user_id] = (domain_id, time.monotonic())
+
+    def invalidate_users(self):
+        with self._lock:
+            self.user_generation += 1
+            self._domains.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._domains.clear()
+
+
+def _invalidate_changed(changes, local):
+    """Drop cached lists whose tables changed, in any process."""
+    if not has_app_context():
+        return
+    cache = current_app.extensions.get("reference_cache")
+    if cache is None:
+        return
+    models = {change.model for change in changes}
+    if User.__tablename__ in models:
+        cache.invalidate_users()
+    for namespace in models & CACHED_TABLES:
+        cache.invalidate(namespace)
+
+
+def register_reference_cache(app):
+    """
+    Give the application its own reference-data response cache, emptied
+    by committed changes to the cached tables (and, for the verified user
+    domains, to users) from the event bus.
+    """
+    app.extensions["reference_cache"] = ResponseCache()
+    event_bus.subscribe("reference_cache", _invalidate_changed)
+
+
+def reference_cache():
+    return current_app.extensions["reference_cache"]
+
+
+def current_domain_id():
+    """
+    Domain of the authenticated user as stored in the database, not as
+    claimed by the token, which keeps its claim after the user moves to
+    another domain. Verified domains are remembered until the users table
+    changes, so cached reads usually need no query.
+    """
+    cache = reference_cache()
+    user_id = get_jwt_identity()
+    domain_id = cache.user_domain(
+        user_id, current_app.config.get("REFERENCE_CACHE_TTL", 300))
+    if domain_id is MISSING:
+        generation = cache.user_generation
+        user = db.session.get(User, user_id)
+        domain_id = user.domain_id if user else None
+        cache.set_user_domain(user_id, domain_id, generation)
+    return domain_id
+
+
+def cached_reference(namespace):
+    """
+    Serve a read-mostly list endpoint from the per-domain cache.
+
+    Successful responses are stored as rendered bytes with an ETag and
+    returned with `Cache-Control: private, max-age=...`, honouring
+    If-None-Match. Must be applied below `jwt_required`.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            config = current_app.config
+            domain_id = current_domain_id()
+            cache = reference_cache()
+            entry = cache.get(
+                namespace, domain_id,
+                config.get("REFERENCE_CACHE_TTL", 300))
+            if entry is None:
+                generation = cache.generation
+                response = current_app.make_response(fn(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                body = response.get_data()
+                etag = hashlib.sha1(body).hexdigest()
+                cache.set(namespace, domain_id, body, etag, generation)
+            else:
+                body, etag, _ = entry
+            response = current_app.response_class(
+                body, status=200, mimetype="application/json")
+            response.set_etag(etag)
+            response.cache_control.private = True
+            response.cache_control.max_age = config.get(
+                "REFERENCE_CACHE_MAX_AGE", 60)
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
@@ -0,0 +1,205 @@
+import logging
+from collections import Counter
+from sqlalchemy import event, select, update, func
+from sqlalchemy.orm.attributes import get_history
+from app.extensions import db
+from app.models.v1 import (
+    Asset, Software, Consumables, Domain, DomainCounter)
+from utils.db_helpers import upsert
+
+logger = logging.getLogger(__name__)
+
+ASSETS = "assets"
+SOFTWARE = "software"
+CONSUMABLE_UNITS = "consumable_units"
+
+# Counted model -> (counter name, column summed, or None to count rows).
+COUNTED = {
+    Asset: (ASSETS, None),
+    Software: (SOFTWARE, None),
+    Consumables: (CONSUMABLE_UNITS, "quantity"),
+}
+
+
+def domain_key(domain_id):
+    """Counter key for a domain; rows without a domain share key 0."""
+    return domain_id or 0
+
+
+def adjust_counters(connection, domain_id, deltas):
+    """
+    Add signed deltas to a domain's counters with a single upsert.
+
+    Args:
+        connection (Connection): Connection of the transaction making the
+            change, so counters commit or roll back together with it.
+        domain_id (int | None): Domain whose counters change.
+        deltas (dict): Counter name -> signed amount.
+    """
+    rows = [
+        {"domain_key": domain_key(domain_id), "name": name, "value": delta}
+        for name, delta in deltas.items() if delta
+    ]
+    if not rows:
+        return
+    counters = DomainCounter.__table__
+    stmt = upsert(counters, bind=connection)
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["domain_key", "name"],
+            set_={
+                "value": counters.c.value + stmt.excluded.value,
+                "updated_at": func.now(),
+            }
+        ),
+        rows
+    )
+
+
+def read_counters(domain_id):
+    """
+    Current counters of a domain, read by primary key.
+
+    Returns:
+        dict: Counter name -> value; missing counters are 0.
+    """
+    values = {ASSETS: 0, SOFTWARE: 0, CONSUMABLE_UNITS: 0}
+    values.update(db.session.execute(
+        select(DomainCounter.name, DomainCounter.value)
+        .where(DomainCounter.domain_key == domain_key(domain_id))
+    ).all())
+    return values
+
+
+def _contribution(target, previous=False):
+    """What a row adds to its domain's counter, before or after a flush."""
+    name, column = COUNTED[type(target)]
+    if column is None:
+        return name, 1
+    history = get_history(target, column)
+    value = history.deleted[0] if previous and history.deleted \
+        else getattr(target, column)
+    return name, value or 0
+
+
+def _previous_domain(target):
+    history = get_history(target, "domain_id")
+    return history.deleted[0] if history.deleted else target.domain_id
+
+
+def _after_insert(mapper, connection, target):
+    name, value = _contribution(target)
+    adjust_counters(connection, target.domain_id, {name: value})
+
+
+def _after_delete(mapper, connection, target):
+    name, value = _contribution(target, previous=True)
+    adjust_counters(connection, _previous_domain(target), {name: -value})
+
+
+def _after_update(mapper, connection, target):
+    name, column = COUNTED[type(target)]
+    changed = get_history(target, "domain_id").has_changes() or (
+        column is not None and get_history(target, column).has_changes())
+    if not changed:
+        return
+    old_domain = _previous_domain(target)
+    _, old_value = _contribution(target, previous=True)
+    _, new_value = _contribution(target)
+    if domain_key(old_domain) == domain_key(target.domain_id):
+        adjust_counters(
+            connection, target.domain_id, {name: new_value - old_value})
+        return
+    adjust_counters(connection, old_domain, {name: -old_value})
+    adjust_counters(connection, target.domain_id, {name: new_value})
+
+
+def register_counter_listeners():
+    """
+    Keep the domain counters in step with ORM inserts, deletes and
+    updates of the counted models.
+
+    Core statements and Session.bulk_save_objects bypass these events, so
+    handlers add counted rows with add_all; adjust_stock updates the
+    counters itself and the reconciliation job corrects anything else.
+    """
+    for model in COUNTED:
+        for name, listener in (("after_insert", _after_insert),
+                               ("after_delete", _after_delete),
+                               ("after_update", _after_update)):
+            if not event.contains(model, name, listener):
+                event.listen(model, name, listener)
+
+
+def _in_domain(column, key):
+    return column.is_(None) if key == 0 else column == key
+
+
+def _reconcile_domain(key):
+    """
+    Correct one domain's counters in a single transaction; returns the
+    names corrected.
+
+    The counter rows are created if missing and locked before the source
+    tables are aggregated. A writer that already adjusted a counter holds
+    its row until it commits, so the aggregates include its change. A
+    writer that has not yet adjusted waits for this transaction and then
+    adds its delta on top of the corrected value. No delta is lost.
+    """
+    counters = DomainCounter.__table__
+    db.session.execute(
+        upsert(counters).on_conflict_do_nothing(
+            index_elements=["domain_key", "name"]),
+        [{"domain_key": key, "name": name, "value": 0}
+         for name, _ in COUNTED.values()]
+    )
+    current = dict(db.session.execute(
+        select(counters.c.name, counters.c.value)
+        .where(counters.c.domain_key == key)
+        .order_by(counters.c.name)
+        .with_for_update()
+    ).all())
+    corrected = []
+    for model, (name, column) in COUNTED.items():
+        table = model.__table__
+        amount = func.count() if column is None else \
+            func.coalesce(func.sum(table.c[column]), 0)
+        actual = db.session.execute(
+            select(amount).select_from(table)
+            .where(_in_domain(table.c.domain_id, key))
+        ).scalar()
+        if actual != current.get(name):
+            db.session.execute(
+                update(counters)
+                .where(counters.c.domain_key == key, counters.c.name == name)
+                .values(value=actual, updated_at=func.now())
+            )
+            corrected.append(name)
+    db.session.commit()
+    return corrected
+
+
+def reconcile_domain_counters():
+    """
+    Recompute every counter from the source tables and fix any drift.
+
+    Domains are reconciled one at a time, each in its own short
+    transaction that locks the domain's counter rows before counting, so
+    concurrent stock and asset writes are never overwritten. Counters of
+    domains that no longer have any rows are reset to zero.
+
+    Returns:
+        int: Number of counters corrected.
+    """
+    keys = {0}
+    keys.update(db.session.execute(select(Domain.id)).scalars())
+    keys.update(db.session.execute(
+        select(DomainCounter.domain_key).distinct()).scalars())
+    db.session.commit()
+
+    corrected = Counter()
+    for key in sorted(keys):
+        corrected.update(_reconcile_domain(key))
+    if corrected:
+        logger.warning("Corrected domain counter drift: %s", dict(corrected))
+    return sum(corrected.values())
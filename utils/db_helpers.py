@@ -0,0 +1,57 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+
+
+def dialect_name(bind=None):
+    """Name of the SQL dialect of `bind`, or of the session's bind."""
+    return (bind or db.session.get_bind()).dialect.name
+
+
+def upsert(table, bind=None):
+    """
+    Build an INSERT that supports ON CONFLICT for the active dialect.
+
+    PostgreSQL and SQLite share the on_conflict_do_update and
+    on_conflict_do_nothing API, so callers can stay dialect agnostic.
+    """
+    if dialect_name(bind) == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def try_advisory_xact_lock(key):
+    """
+    Take a transaction-scoped single-runner lock; False when another
+    worker holds it. SQLite serialises writers itself.
+    """
+    if dialect_name() != "postgresql":
+        return True
+    return db.session.execute(
+        db.select(db.func.pg_try_advisory_xact_lock(key))).scalar()
+
+
+def month_bucket(column):
+    """Format a date column as a YYYY-MM string for the active dialect."""
+    if dialect_name() == "postgresql":
+        return db.func.to_char(column, "YYYY-MM")
+    return db.func.strftime("%Y-%m", column)
+
+
+def sortable_timestamp(column):
+    """
+    A timestamp expression that orders and compares consistently.
+
+    SQLite stores server-generated and bound datetimes as text in
+    different formats, so it is normalised to millisecond precision there;
+    PostgreSQL uses the column itself and keeps its indexes usable.
+    """
+    if dialect_name() == "postgresql":
+        return column
+    return db.func.strftime("%Y-%m-%d %H:%M:%f", column)
+
+
+def sortable_timestamp_value(value):
+    """Bind value comparable with sortable_timestamp()."""
+    if dialect_name() == "postgresql":
+        return value
+    return f"{value:%Y-%m-%d %H:%M:%S}.{value.microsecond // 1000:03d}"
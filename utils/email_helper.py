@@ -2,12 +2,16 @@ from flask import current_app
 import threading
 from flask_mail import Message
 from app.extensions import mail
+from utils.metrics import metrics
 
 
 def _send_async_email(app, msg):
     """Send email safely in a background thread with app context."""
-    with app.app_context():
-        mail.send(msg)
+    try:
+        with app.app_context():
+            mail.send(msg)
+    finally:
+        metrics.inc_gauge("email_queue_depth", -1)
 
 
 def send_email(subject, recipients, html_body):
@@ -15,13 +19,14 @@ def send_email(subject, recipients, html_body):
     msg = Message(subject=subject, recipients=recipients)
     msg.html = html_body
     app = current_app._get_current_object()
+    metrics.inc_gauge("email_queue_depth", 1)
     thread = threading.Thread(target=_send_async_email, args=(app, msg))
     thread.start()
 
 
-def send_welcome_email(user_fullname, user_email, raw_password, app_name="Fresha Inventory System"):
-    """Send welcome email for newly created users."""
-    html_body = f"""
+def _welcome_email_body(user_fullname, user_email, raw_password, app_name):
+    """Render the welcome email HTML for a newly created user."""
+    return f"""
     <div style="font-family: Arial, sans-serif; line-height: 1.5; color: #333;">
         <h2 style="color:#004080;">Welcome to <span style="color:#0080ff;">{app_name}</span></h2>
         <p>Dear <strong>{user_fullname}</strong>,</p>
@@ -37,9 +42,55 @@ def send_welcome_email(user_fullname, user_email, raw_password, app_name="Fresha
         <small style="color:#888;">This is an automated message. Please do not reply.</small>
     </div>
     """
+
+
+def send_welcome_email(user_fullname, user_email, raw_password, app_name="Fresha Inventory System"):
+    """Send welcome email for newly created users."""
+    html_body = _welcome_email_body(
+        user_fullname, user_email, raw_password, app_name)
     send_email(f"Welcome to {app_name}", [user_email], html_body)
 
 
+def _send_bulk_async_email(app, messages):
+    """Send queued emails over one SMTP connection in a background thread."""
+    with app.app_context():
+        with mail.connect() as connection:
+            for msg in messages:
+                try:
+                    connection.send(msg)
+                except Exception:
+                    app.logger.exception(
+                        "Failed to send email to %s", msg.recipients)
+                finally:
+                    metrics.inc_gauge("email_queue_depth", -1)
+
+
+def send_bulk_welcome_emails(users, app_name="Fresha Inventory System"):
+    """
+    Queue welcome emails for many new users.
+
+    All messages are sent by a single background thread that reuses one
+    SMTP connection, instead of one thread and connection per user.
+
+    Args:
+        users (list[tuple]): (fullname, email, raw_password) per user.
+    """
+    messages = []
+    for user_fullname, user_email, raw_password in users:
+        msg = Message(
+            subject=f"Welcome to {app_name}", recipients=[user_email])
+        msg.html = _welcome_email_body(
+            user_fullname, user_email, raw_password, app_name)
+        messages.append(msg)
+    if not messages:
+        return
+    app = current_app._get_current_object()
+    metrics.inc_gauge("email_queue_depth", len(messages))
+    thread = threading.Thread(
+        target=_send_bulk_async_email, args=(app, messages))
+    thread.start()
+
+
 def send_password_changed_email(user_fullname, user_email, new_password, app_name="Fresha Inventory System"):
     """Send email notifying user that their password has been changed."""
     html_body = f"""
@@ -0,0 +1,196 @@
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import namedtuple
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from utils.metrics import instrument_redis
+
+logger = logging.getLogger(__name__)
+
+PENDING_CHANGES = "pending_changes"
+DEFAULT_CHANNEL = "inventory:changes"
+LISTEN_RETRY_SECONDS = 1.0
+LISTEN_RETRY_MAX_SECONDS = 60.0
+
+Change = namedtuple("Change", "domain_id model id operation")
+
+
+class EventBus:
+    """
+    Fan-out of committed row changes to in-process subscribers and,
+    when Redis is configured, to every other worker process.
+
+    Subscribers are called as callback(changes, local) with a list of
+    Change tuples; `local` is False for changes committed elsewhere, so
+    subscribers that write (rather than invalidate) can skip them.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+        self._redis = None
+        self._channel = DEFAULT_CHANNEL
+        self._listener = None
+        self._stopping = threading.Event()
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex}"
+
+    def subscribe(self, name, callback):
+        """Register `callback` under `name`, replacing any previous one."""
+        self._subscribers[name] = callback
+
+    def unsubscribe(self, name):
+        self._subscribers.pop(name, None)
+
+    def dispatch(self, changes, local=True):
+        """Hand changes to every subscriber; one failing does not stop
+        the others."""
+        for name, callback in list(self._subscribers.items()):
+            try:
+                callback(changes, local)
+            except Exception:
+                logger.exception("Change subscriber %s failed", name)
+
+    def publish(self, changes):
+        """Dispatch locally committed changes and forward them to Redis."""
+        self.dispatch(changes, local=True)
+        if self._redis is None:
+            return
+        try:
+            self._redis.publish(self._channel, json.dumps({
+                "origin": self.origin,
+                "changes": [list(change) for change in changes],
+            }))
+        except Exception:
+            logger.exception("Publishing %d changes failed", len(changes))
+
+    def connect_redis(self, app, client, channel=DEFAULT_CHANNEL):
+        """
+        Forward changes through Redis pub/sub and start a daemon thread
+        that dispatches changes from other processes inside `app`'s
+        context.
+        """
+        self._redis = client
+        self._channel = channel
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._listener = threading.Thread(
+            target=self._listen, args=(app, client, channel),
+            name="event-bus-listener", daemon=True)
+        self._listener.start()
+
+    def close(self):
+        """Stop the Redis listener after its current wait or message."""
+        self._stopping.set()
+
+    def _listen(self, app, client, channel):
+        """
+        Dispatch changes from other processes until closed.
+
+        A lost connection is logged and the channel re-subscribed after a
+        backoff that doubles up to LISTEN_RETRY_MAX_SECONDS. Changes
+        published while disconnected are not delivered.
+        """
+        delay = LISTEN_RETRY_SECONDS
+        while not self._stopping.is_set():
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(channel)
+                delay = LISTEN_RETRY_SECONDS
+                for message in pubsub.listen():
+                    self._receive(app, message)
+                    if self._stopping.is_set():
+                        return
+            except Exception:
+                logger.exception(
+                    "Event bus listener failed, re-subscribing in %.1fs",
+                    delay)
+            finally:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+            self._stopping.wait(delay)
+            delay = min(delay * 2, LISTEN_RETRY_MAX_SECONDS)
+
+    def _receive(self, app, message):
+        """Dispatch one pub/sub message; a bad message is only logged."""
+        try:
+            payload = json.loads(message["data"])
+            if payload.get("origin") == self.origin:
+                return
+            changes = [Change(*change) for change in payload["changes"]]
+        except Exception:
+            logger.exception("Ignoring malformed event bus message")
+            return
+        with app.app_context():
+            self.dispatch(changes, local=False)
+
+
+event_bus = EventBus()
+
+
+def record_changes(session, model, ids, domain_id=None, operation="update"):
+    """
+    Queue changes made outside the ORM (Core statements) for publication
+    when `session` commits.
+
+    Args:
+        session (Session): Session whose transaction made the change.
+        model (str): Table name of the changed rows.
+        ids (Iterable[int]): Primary keys of the changed rows.
+        domain_id (int, optional): Domain the rows belong to.
+        operation (str): "insert", "update" or "delete".
+    """
+    session.info.setdefault(PENDING_CHANGES, set()).update(
+        Change(domain_id, model, row_id, operation) for row_id in ids)
+
+
+def _collect_flushed(session, flush_context):
+    """Remember which ORM rows the flush wrote."""
+    changes = session.info.setdefault(PENDING_CHANGES, set())
+    for operation, objects in (("insert", session.new),
+                               ("update", session.dirty),
+                               ("delete", session.deleted)):
+        for obj in objects:
+            table = getattr(obj, "__tablename__", None)
+            if table is None or (
+                    operation == "update" and not session.is_modified(obj)):
+                continue
+            changes.add(Change(
+                getattr(obj, "domain_id", None), table,
+                getattr(obj, "id", None), operation))
+
+
+def _publish_after_commit(session):
+    changes = session.info.pop(PENDING_CHANGES, None)
+    if changes:
+        event_bus.publish(list(changes))
+
+
+def _discard_after_rollback(session, *args):
+    session.info.pop(PENDING_CHANGES, None)
+
+
+def register_event_bus(app):
+    """
+    Publish every committed change on the event bus.
+
+    Session hooks collect (domain, table, id) for each flushed row and
+    publish them once the transaction commits; rolled back changes are
+    dropped. With EVENT_BUS_REDIS_URL set, changes also travel over Redis
+    pub/sub (channel EVENT_BUS_CHANNEL) to the other worker processes.
+    """
+    for name, listener in (("after_flush", _collect_flushed),
+                           ("after_commit", _publish_after_commit),
+                           ("after_rollback", _discard_after_rollback)):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+    url = app.config.get("EVENT_BUS_REDIS_URL")
+    if url:
+        event_bus.connect_redis(
+            app, instrument_redis(redis.Redis.from_url(url)),
+            app.config.get("EVENT_BUS_CHANNEL", DEFAULT_CHANNEL))
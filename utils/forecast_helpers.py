@@ -0,0 +1,123 @@
+from datetime import timedelta
+import numpy as np
+from sqlalchemy import select, func
+from app.extensions import db
+from app.models.v1 import ConsumptionRollup, Consumables
+
+
+def load_out_history(domain_id, start, days):
+    """
+    Load a domain's daily OUT totals into a consumables x days matrix.
+
+    The whole history comes from the consumption rollups in one query and
+    is scattered into the matrix with NumPy, so the cost does not depend
+    on the number of consumables in Python.
+
+    Args:
+        domain_id (int | None): Domain to load.
+        start (date): First day of the history window.
+        days (int): Number of days in the window.
+
+    Returns:
+        tuple: (consumables, history) where consumables is a list of rows
+        with id, name, quantity and reorder_level ordered by id, and
+        history is a float array of shape (len(consumables), days) with
+        the oldest day first.
+    """
+    consumables = db.session.execute(
+        select(
+            Consumables.id,
+            Consumables.name,
+            func.coalesce(Consumables.quantity, 0).label("quantity"),
+            func.coalesce(Consumables.reorder_level, 0).label("reorder_level")
+        )
+        .where(Consumables.domain_id == domain_id)
+        .order_by(Consumables.id)
+    ).all()
+    history = np.zeros((len(consumables), days))
+    if not consumables:
+        return consumables, history
+
+    rows = db.session.execute(
+        select(
+            ConsumptionRollup.consumable_id,
+            ConsumptionRollup.day,
+            func.sum(ConsumptionRollup.quantity_out)
+        )
+        .where(
+            ConsumptionRollup.domain_id == domain_id,
+            ConsumptionRollup.day >= start,
+            ConsumptionRollup.day < start + timedelta(days=days)
+        )
+        .group_by(ConsumptionRollup.consumable_id, ConsumptionRollup.day)
+    ).all()
+    if not rows:
+        return consumables, history
+
+    ids, row_days, quantities = zip(*rows)
+    consumable_ids = np.fromiter(
+        (row.id for row in consumables), dtype=np.int64,
+        count=len(consumables))
+    positions = np.searchsorted(consumable_ids, np.array(ids))
+    positions = np.minimum(positions, len(consumable_ids) - 1)
+    known = consumable_ids[positions] == np.array(ids)
+    offsets = (
+        np.array(row_days, dtype="datetime64[D]") - np.datetime64(start, "D")
+    ).astype(np.int64)
+    np.add.at(
+        history,
+        (positions[known], offsets[known]),
+        np.array(quantities, dtype=float)[known]
+    )
+    return consumables, history
+
+
+def burn_rates(history, method="ewma", alpha=0.3, window=28):
+    """
+    Estimate the daily burn rate of every consumable at once.
+
+    Args:
+        history (ndarray): Daily OUT quantities, oldest day first.
+        method (str): "ewma" for exponential smoothing or "sma" for a
+            simple moving average over the last `window` days.
+        alpha (float): Smoothing factor for "ewma".
+        window (int): Number of days averaged by "sma".
+
+    Returns:
+        ndarray: Units consumed per day, one value per consumable.
+    """
+    if history.shape[1] == 0:
+        return np.zeros(history.shape[0])
+    if method == "sma":
+        return history[:, -window:].mean(axis=1)
+    weights = alpha * (1 - alpha) ** np.arange(history.shape[1] - 1, -1, -1)
+    return history @ weights / weights.sum()
+
+
+def forecast_stockouts(quantities, reorder_levels, rates,
+                       lead_time_days, coverage_days):
+    """
+    Project stockout and reorder points from burn rates.
+
+    Args:
+        quantities (ndarray): Current stock per consumable.
+        reorder_levels (ndarray): Reorder level per consumable.
+        rates (ndarray): Daily burn rate per consumable.
+        lead_time_days (int): Days a replenishment takes to arrive.
+        coverage_days (int): Days of consumption an order should cover.
+
+    Returns:
+        tuple: (days_to_stockout, days_to_reorder, suggested) arrays.
+        Days are `inf` for consumables that are not being consumed.
+    """
+    consuming = rates > 0
+    safe_rates = np.where(consuming, rates, 1)
+    days_to_stockout = np.where(
+        consuming, quantities / safe_rates, np.inf)
+    days_to_reorder = np.where(
+        consuming,
+        np.maximum(quantities - reorder_levels, 0) / safe_rates,
+        np.inf)
+    target = reorder_levels + np.ceil(rates * (lead_time_days + coverage_days))
+    suggested = np.maximum(target - quantities, 0)
+    return days_to_stockout, days_to_reorder, suggested
@@ -0,0 +1,161 @@
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import get_history
+from app.models.v1 import (
+    Asset, AssetLifecycle, AssetLoan, AssetTransfer, ExternalMaintenance)
+
+PENDING_LIFECYCLES = "pending_lifecycles"
+
+ASSET_TRANSFER = "Asset transfer"
+
+# Asset attribute -> (event, label used in the notes).
+ASSET_CHANGES = {
+    "status_id": ("Status change", "status"),
+    "assigned_to": ("Reassignment", "user"),
+    "location_id": ("Relocation", "location"),
+    "department_id": ("Department change", "department"),
+}
+
+# A transfer already records these changes for the assets it moves.
+COVERED_BY_TRANSFER = {"Reassignment", "Relocation", "Department change"}
+
+
+def asset_change_events(asset_id, domain_id, changes):
+    """
+    Lifecycle rows for changed asset attributes, for writers that update
+    assets with Core statements and so bypass the mapper events.
+
+    Args:
+        asset_id (int): The changed asset.
+        domain_id (int | None): Domain of the asset.
+        changes (dict): Attribute -> (old, new); unchanged values and
+            attributes without an event are ignored.
+    """
+    rows = []
+    for attribute, (event_name, label) in ASSET_CHANGES.items():
+        if attribute not in changes:
+            continue
+        old, new = changes[attribute]
+        if old != new:
+            rows.append({
+                "asset_id": asset_id,
+                "event": event_name,
+                "notes": f"{label} {old} -> {new}",
+                "domain_id": domain_id,
+            })
+    return rows
+
+
+def _pending(target):
+    session = object_session(target)
+    if session is None:
+        return []
+    return session.info.setdefault(PENDING_LIFECYCLES, [])
+
+
+def _queue(target, asset_id, event_name, notes):
+    _pending(target).append({
+        "asset_id": asset_id,
+        "event": event_name,
+        "notes": notes,
+        "domain_id": target.domain_id,
+    })
+
+
+def _changed(target, attribute):
+    """(old, new) when `attribute` changed in this flush, else None."""
+    history = get_history(target, attribute)
+    if not history.has_changes():
+        return None
+    old = history.deleted[0] if history.deleted else None
+    return old, getattr(target, attribute)
+
+
+def _asset_inserted(mapper, connection, target):
+    _queue(target, target.id, "Asset registered", target.asset_tag)
+
+
+def _asset_updated(mapper, connection, target):
+    changes = {
+        attribute: _changed(target, attribute) for attribute in ASSET_CHANGES
+    }
+    _pending(target).extend(asset_change_events(
+        target.id, target.domain_id,
+        {attribute: change for attribute, change in changes.items()
+         if change}))
+
+
+def _transfer_inserted(mapper, connection, target):
+    _queue(target, target.asset_id, ASSET_TRANSFER, target.notes)
+
+
+def _loan_inserted(mapper, connection, target):
+    _queue(target, target.asset_id, "Asset loan", target.condition_before)
+
+
+def _loan_updated(mapper, connection, target):
+    change = _changed(target, "status")
+    if change and change[1] == "RETURNED":
+        _queue(target, target.asset_id, "Loan returned",
+               target.condition_after)
+
+
+def _maintenance_inserted(mapper, connection, target):
+    _queue(target, target.asset_id, "External Maintenance",
+           target.description)
+
+
+def _maintenance_updated(mapper, connection, target):
+    change = _changed(target, "status")
+    if change and change[1] == "RETURNED":
+        _queue(target, target.asset_id, "Returned from maintenance",
+               target.Condition_After_Maintenance)
+
+
+def _insert_pending(session, flush_context):
+    """Write the events derived during the flush as one executemany."""
+    rows = session.info.pop(PENDING_LIFECYCLES, None)
+    if not rows:
+        return
+    transferred = {
+        row["asset_id"] for row in rows if row["event"] == ASSET_TRANSFER}
+    rows = [
+        row for row in rows
+        if not (row["asset_id"] in transferred
+                and row["event"] in COVERED_BY_TRANSFER)
+    ]
+    session.connection().execute(insert(AssetLifecycle.__table__), rows)
+
+
+def _discard_pending(session, *args):
+    session.info.pop(PENDING_LIFECYCLES, None)
+
+
+LISTENERS = (
+    (Asset, "after_insert", _asset_inserted),
+    (Asset, "after_update", _asset_updated),
+    (AssetTransfer, "after_insert", _transfer_inserted),
+    (AssetLoan, "after_insert", _loan_inserted),
+    (AssetLoan, "after_update", _loan_updated),
+    (ExternalMaintenance, "after_insert", _maintenance_inserted),
+    (ExternalMaintenance, "after_update", _maintenance_updated),
+    (Session, "after_flush", _insert_pending),
+    (Session, "after_rollback", _discard_pending),
+)
+
+
+def register_lifecycle_listeners():
+    """
+    Record asset lifecycle events for every ORM change that affects an
+    asset's history.
+
+    Mapper events derive the events from attribute changes while a flush
+    runs and the session inserts them with a single executemany once the
+    flush completes, in the same transaction. Core statements bypass these
+    events; bulk handlers write their lifecycle rows themselves, using
+    asset_change_events for attribute changes. Deleted assets are not
+    recorded, as their lifecycle rows are removed with them.
+    """
+    for target, name, listener in LISTENERS:
+        if not event.contains(target, name, listener):
+            event.listen(target, name, listener)
@@ -0,0 +1,63 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import update, func
+from app.extensions import db
+from app.models.v1 import AssetLoan
+from utils.db_helpers import try_advisory_xact_lock
+from utils.event_bus import record_changes
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Statuses of loans whose asset has not come back yet.
+ACTIVE_LOAN_STATUSES = ("BORROWED", "OVERDUE")
+
+# Key of the PostgreSQL advisory lock held by the overdue sweep.
+OVERDUE_SWEEP_LOCK = 7_310_045
+
+
+def mark_overdue_loans(now=None):
+    """
+    Flag borrowed loans past their expected return date as OVERDUE.
+
+    One set-based UPDATE driven by the (status, expected_return_date)
+    index flips every such loan, so re-running it is harmless and only
+    loans that became overdue since the last run are touched. Workers
+    race for an advisory lock and only its holder sweeps.
+
+    Args:
+        now (datetime, optional): Reference time. Defaults to now.
+
+    Returns:
+        dict: "marked" loans flipped to OVERDUE and whether the sweep
+        "ran" or was skipped because another worker held the lock.
+    """
+    now = now or datetime.now()
+    if not try_advisory_xact_lock(OVERDUE_SWEEP_LOCK):
+        db.session.rollback()
+        logger.info("Overdue sweep skipped: another worker holds the lock")
+        return {"ran": False, "marked": 0}
+
+    loans = AssetLoan.__table__
+    flipped = db.session.execute(
+        update(loans)
+        .where(
+            loans.c.status == "BORROWED",
+            loans.c.expected_return_date < now,
+            loans.c.actual_return_date.is_(None)
+        )
+        .values(status="OVERDUE", updated_at=func.now())
+        .returning(loans.c.id, loans.c.domain_id)
+    ).all()
+    by_domain = defaultdict(list)
+    for loan_id, domain_id in flipped:
+        by_domain[domain_id].append(loan_id)
+    for domain_id, loan_ids in by_domain.items():
+        record_changes(db.session, loans.name, loan_ids, domain_id=domain_id)
+    db.session.commit()
+
+    metrics.inc("overdue_loans_marked_total", value=len(flipped))
+    if flipped:
+        logger.info("Marked %d loans overdue", len(flipped))
+    return {"ran": True, "marked": len(flipped)}
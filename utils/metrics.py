@@ -0,0 +1,277 @@
+import bisect
+import glob
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _key(name, labels):
+    return name, tuple(sorted((labels or {}).items()))
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace(
+        '"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(
+        f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class MetricsRegistry:
+    """
+    Process-local counters, gauges and histograms.
+
+    Every update is a single short lock acquisition on plain dicts. When a
+    shared directory is configured, each process periodically writes its
+    own snapshot there and readers merge the snapshots of all processes,
+    so any worker can answer a scrape for the whole deployment.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._help = {}
+        self._gauge_callbacks = {}
+        self._last_flush = 0.0
+        self.directory = None
+        self.flush_interval = 1.0
+
+    def configure(self, directory=None, flush_interval=1.0):
+        """Set the shared directory used to aggregate across processes."""
+        self.directory = directory
+        self.flush_interval = flush_interval
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def describe(self, name, kind, text):
+        """Declare the Prometheus type and help text of a metric."""
+        self._help[name] = (kind, text)
+
+    def inc(self, name, labels=None, value=1):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, labels=None):
+        key = _key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def inc_gauge(self, name, value=1, labels=None):
+        key = _key(name, labels)
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0) + value
+
+    def observe(self, name, value, labels=None, buckets=DEFAULT_BUCKETS):
+        key = _key(name, labels)
+        index = bisect.bisect_left(buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {
+                    "buckets": list(buckets),
+                    "counts": [0] * (len(buckets) + 1),
+                    "sum": 0.0,
+                }
+            histogram["counts"][index] += 1
+            histogram["sum"] += value
+
+    def set_gauge_callback(self, source, callback):
+        """
+        Register a callable sampled at snapshot time, replacing any
+        previous callable for the same source.
+
+        The callable returns (name, labels, value) tuples, for gauges that
+        are cheaper to read on demand than to keep up to date.
+        """
+        self._gauge_callbacks[source] = callback
+
+    @contextmanager
+    def timed(self, name, **labels):
+        """Observe the duration of the block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, labels)
+
+    def snapshot(self):
+        """Copy of this process's metrics in a JSON-serialisable form."""
+        with self._lock:
+            counters = list(self._counters.items())
+            gauges = dict(self._gauges)
+            histograms = [
+                (key, {**value, "counts": list(value["counts"])})
+                for key, value in self._histograms.items()
+            ]
+        for callback in list(self._gauge_callbacks.values()):
+            try:
+                for name, labels, value in callback():
+                    gauges[_key(name, labels)] = value
+            except Exception:
+                continue
+        return {
+            "pid": os.getpid(),
+            "counters": [[n, list(l), v] for (n, l), v in counters],
+            "gauges": [[n, list(l), v] for (n, l), v in gauges.items()],
+            "histograms": [[n, list(l), v] for (n, l), v in histograms],
+        }
+
+    def flush(self, force=False):
+        """Write this process's snapshot to the shared directory."""
+        if not self.directory:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.flush_interval:
+            return
+        self._last_flush = now
+        path = os.path.join(self.directory, f"metrics-{os.getpid()}.json")
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        with open(temporary, "w") as handle:
+            json.dump(self.snapshot(), handle)
+        os.replace(temporary, path)
+
+    def _snapshots(self):
+        if not self.directory:
+            return [self.snapshot()]
+        self.flush(force=True)
+        snapshots = []
+        for path in glob.glob(os.path.join(self.directory, "metrics-*.json")):
+            try:
+                with open(path) as handle:
+                    snapshots.append(json.load(handle))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def collect(self):
+        """
+        Merge the snapshots of every process.
+
+        Counters and histograms are summed. Gauges are summed over live
+        processes only, so a restarted worker does not leave stale values.
+        """
+        counters, gauges, histograms = {}, {}, {}
+        for snapshot in self._snapshots():
+            for name, labels, value in snapshot["counters"]:
+                key = (name, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+            if _pid_alive(snapshot["pid"]):
+                for name, labels, value in snapshot["gauges"]:
+                    key = (name, tuple(map(tuple, labels)))
+                    gauges[key] = gauges.get(key, 0) + value
+            for name, labels, value in snapshot["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                merged = histograms.setdefault(key, {
+                    "buckets": value["buckets"],
+                    "counts": [0] * len(value["counts"]),
+                    "sum": 0.0,
+                })
+                merged["counts"] = [
+                    a + b for a, b in zip(merged["counts"], value["counts"])]
+                merged["sum"] += value["sum"]
+        return counters, gauges, histograms
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        counters, gauges, histograms = self.collect()
+        families = {}
+        for kind, values in (("counter", counters), ("gauge", gauges),
+                             ("histogram", histograms)):
+            for (name, labels), value in values.items():
+                families.setdefault(name, (kind, []))[1].append(
+                    (labels, value))
+
+        lines = []
+        for name in sorted(families):
+            kind, samples = families[name]
+            help_text = self._help.get(name, (kind, name))[1]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(samples, key=lambda s: s[0]):
+                if kind != "histogram":
+                    lines.append(
+                        f"{name}{_format_labels(labels)} "
+                        f"{_format_value(value)}")
+                    continue
+                cumulative = 0
+                bounds = [str(b) for b in value["buckets"]] + ["+Inf"]
+                for bound, count in zip(bounds, value["counts"]):
+                    cumulative += count
+                    lines.append(
+                        f"{name}_bucket"
+                        f"{_format_labels(labels + (('le', bound),))} "
+                        f"{cumulative}")
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} "
+                    f"{_format_value(value['sum'])}")
+                lines.append(
+                    f"{name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+class _TimedRedis:
+    """Proxy that records the latency of every Redis command."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            with metrics.timed("redis_call_duration_seconds", command=name):
+                return attribute(*args, **kwargs)
+        return call
+
+
+def instrument_redis(client):
+    """Wrap a Redis client so command latencies reach the registry."""
+    return _TimedRedis(client)
+
+
+metrics = MetricsRegistry()
+metrics.describe(
+    "http_requests_total", "counter", "HTTP requests by endpoint and status.")
+metrics.describe(
+    "http_request_duration_seconds", "histogram",
+    "HTTP request latency by endpoint and status.")
+metrics.describe(
+    "db_pool_checked_out", "gauge", "Database connections checked out.")
+metrics.describe(
+    "db_pool_overflow", "gauge", "Database connections above pool size.")
+metrics.describe(
+    "redis_call_duration_seconds", "histogram",
+    "Redis command latency by command.")
+metrics.describe(
+    "scheduler_job_duration_seconds", "histogram",
+    "Scheduled job duration by job.")
+metrics.describe(
+    "email_queue_depth", "gauge", "Emails queued but not yet sent.")
@@ -0,0 +1,289 @@
+from sqlalchemy import (
+    update, insert, select, delete, func, case, literal, and_, or_)
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from app.extensions import db
+from app.models.v1 import (
+    Consumables, StockSnapshot, StockTransaction, StockTransactionArchive,
+    ConsumptionRollup)
+from utils.db_helpers import upsert
+from utils.event_bus import record_changes
+from utils.counter_helpers import adjust_counters, CONSUMABLE_UNITS
+from utils.archive_helpers import with_archive
+
+
+def adjust_stock(consumable_id, delta):
+    """
+    Apply a signed quantity delta to a consumable in a single UPDATE.
+
+    The statement only matches while the resulting quantity stays
+    non-negative, so the stock check and the write happen atomically
+    in the database instead of in Python. Successful adjustments also
+    move the domain's consumable counter and publish the change on the
+    event bus when the transaction commits.
+
+    Args:
+        consumable_id (int): ID of the consumable to adjust.
+        delta (int): Positive for stock IN, negative for stock OUT.
+
+    Returns:
+        int | None: The new quantity, or None if the consumable does not
+        exist or holds too little stock for the delta.
+    """
+    consumables = Consumables.__table__
+    stmt = (
+        update(consumables)
+        .where(
+            consumables.c.id == consumable_id,
+            consumables.c.quantity + delta >= 0
+        )
+        .values(quantity=consumables.c.quantity + delta)
+        .returning(consumables.c.quantity, consumables.c.domain_id)
+    )
+    row = db.session.execute(stmt).first()
+    quantity = row.quantity if row is not None else None
+    if quantity is not None:
+        adjust_counters(
+            db.session.connection(), row.domain_id, {CONSUMABLE_UNITS: delta})
+        loaded = db.session.identity_map.get(
+            identity_key(Consumables, consumable_id))
+        if loaded is not None:
+            set_committed_value(loaded, "quantity", quantity)
+        record_changes(
+            db.session, Consumables.__tablename__, [consumable_id],
+            domain_id=row.domain_id)
+    return quantity
+
+
+def take_stock_snapshots():
+    """
+    Record the current quantity of every consumable.
+
+    Copies all quantities with a single INSERT ... SELECT so the job cost
+    does not depend on the size of the ledger. Each snapshot stores the
+    ledger high-water mark it reflects, and replay starts after that id
+    rather than after `taken_at`. A movement that commits while the
+    snapshot runs can carry an earlier created_at than the snapshot, so a
+    timestamp boundary would skip it for good.
+
+    The consumables are share-locked first. Stock writers adjust the
+    quantity before they insert their ledger row, so once the locks are
+    held no transaction has a ledger row pending, and the highest ledger
+    id read afterwards matches the quantities exactly.
+
+    Returns:
+        int: Number of snapshots written.
+    """
+    consumables = Consumables.__table__
+    db.session.execute(
+        select(consumables.c.id).with_for_update(read=True)).all()
+    high_water = db.session.execute(
+        select(func.max(StockTransaction.id))).scalar()
+    if high_water is None:
+        # Everything may have been archived; ids are never reused.
+        high_water = db.session.execute(
+            select(func.max(StockTransactionArchive.id))).scalar()
+    result = db.session.execute(
+        insert(StockSnapshot.__table__).from_select(
+            ["consumable_id", "quantity", "domain_id", "taken_at",
+             "ledger_high_water"],
+            select(
+                consumables.c.id,
+                func.coalesce(consumables.c.quantity, 0),
+                consumables.c.domain_id,
+                func.now(),
+                literal(high_water or 0)
+            )
+        )
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def _signed_quantity(ledger=StockTransaction):
+    """Ledger quantity signed by direction: IN adds, OUT removes."""
+    return case(
+        (ledger.transaction_type == "IN", ledger.quantity),
+        else_=-ledger.quantity
+    )
+
+
+def stock_as_of(as_of, consumable_ids):
+    """
+    Compute the quantity of consumables at a point in time.
+
+    Each consumable starts from its latest snapshot taken at or before
+    `as_of` and only the ledger rows after its high-water mark are
+    applied. Consumables with no earlier snapshot are rewound from their
+    current quantity instead. Both paths read a bounded slice of the
+    ledger through the (consumable_id, created_at) index, including the
+    archived rows when that slice reaches past the archive horizon.
+
+    Args:
+        as_of (datetime): The point in time to report.
+        consumable_ids (list[int]): Consumables to report on.
+
+    Returns:
+        dict: Quantity keyed by consumable id.
+    """
+    if not consumable_ids:
+        return {}
+
+    latest = (
+        select(
+            StockSnapshot.consumable_id,
+            func.max(StockSnapshot.taken_at).label("taken_at")
+        )
+        .where(
+            StockSnapshot.consumable_id.in_(consumable_ids),
+            StockSnapshot.taken_at <= as_of
+        )
+        .group_by(StockSnapshot.consumable_id)
+        .subquery()
+    )
+    chosen = (
+        select(
+            StockSnapshot.consumable_id,
+            StockSnapshot.quantity,
+            StockSnapshot.taken_at,
+            StockSnapshot.ledger_high_water
+        ).join(latest, and_(
+            latest.c.consumable_id == StockSnapshot.consumable_id,
+            latest.c.taken_at == StockSnapshot.taken_at
+        ))
+        .subquery()
+    )
+    snapshots = db.session.execute(select(chosen)).all()
+    quantities = {row.consumable_id: row.quantity for row in snapshots}
+    ledger = with_archive(
+        StockTransaction, min([as_of] + [row.taken_at for row in snapshots]))
+
+    forward = db.session.execute(
+        select(ledger.consumable_id, func.sum(_signed_quantity(ledger)))
+        .join(chosen, and_(
+            chosen.c.consumable_id == ledger.consumable_id,
+            or_(
+                ledger.id > chosen.c.ledger_high_water,
+                and_(chosen.c.ledger_high_water.is_(None),
+                     ledger.created_at > chosen.c.taken_at)
+            )
+        ))
+        .where(ledger.created_at <= as_of)
+        .group_by(ledger.consumable_id)
+    ).all()
+    for consumable_id, delta in forward:
+        quantities[consumable_id] += delta or 0
+
+    unsnapshotted = [
+        consumable_id for consumable_id in consumable_ids
+        if consumable_id not in quantities
+    ]
+    if unsnapshotted:
+        current = dict(db.session.execute(
+            select(Consumables.id, func.coalesce(Consumables.quantity, 0))
+            .where(Consumables.id.in_(unsnapshotted))
+        ).all())
+        backward = dict(db.session.execute(
+            select(
+                ledger.consumable_id,
+                func.sum(_signed_quantity(ledger))
+            )
+            .where(
+                ledger.consumable_id.in_(unsnapshotted),
+                ledger.created_at > as_of
+            )
+            .group_by(ledger.consumable_id)
+        ).all())
+        for consumable_id, quantity in current.items():
+            quantities[consumable_id] = \
+                quantity - (backward.get(consumable_id) or 0)
+
+    return quantities
+
+
+def record_consumption(movements, day=None):
+    """
+    Add ledger movements to the daily consumption rollups.
+
+    Runs inside the caller's transaction as one INSERT ... ON CONFLICT
+    statement, so the rollups commit or roll back together with the
+    ledger rows they summarise. Pass negative quantities to take a
+    movement back out, e.g. when a transaction is deleted.
+
+    Args:
+        movements (list[dict]): Items with consumable_id, department_id,
+            domain_id, quantity_in and quantity_out.
+        day (date, optional): Rollup day, i.e. the date of the ledger
+            row's created_at. Defaults to the database's current date,
+            the date new ledger rows get, so the write path and the
+            backfill bucket a movement on the same day whatever the
+            application server's timezone.
+    """
+    if not movements:
+        return
+    rollups = ConsumptionRollup.__table__
+    stmt = upsert(rollups).values(
+        day=func.current_date() if day is None else day)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["consumable_id", "department_id", "day"],
+        set_={
+            "quantity_in":
+                rollups.c.quantity_in + stmt.excluded.quantity_in,
+            "quantity_out":
+                rollups.c.quantity_out + stmt.excluded.quantity_out,
+            "updated_at": func.now(),
+        }
+    )
+    db.session.execute(stmt, [
+        {
+            "consumable_id": movement["consumable_id"],
+            "department_id": movement["department_id"],
+            "domain_id": movement.get("domain_id"),
+            "quantity_in": movement.get("quantity_in", 0),
+            "quantity_out": movement.get("quantity_out", 0),
+        }
+        for movement in movements
+    ])
+
+
+def backfill_consumption_rollups():
+    """
+    Rebuild every consumption rollup from the stock transaction ledger,
+    archived transactions included.
+
+    Existing rollups are replaced in the same transaction, so the command
+    is safe to re-run and readers never observe a half-built table. Rows
+    are bucketed by the database date of their created_at, which is the
+    day record_consumption uses as well.
+
+    Returns:
+        int: Number of rollup rows written.
+    """
+    ledger = with_archive(StockTransaction)
+    day = func.date(ledger.created_at)
+    db.session.execute(delete(ConsumptionRollup.__table__))
+    result = db.session.execute(
+        insert(ConsumptionRollup.__table__).from_select(
+            ["consumable_id", "department_id", "day", "domain_id",
+             "quantity_in", "quantity_out"],
+            select(
+                ledger.consumable_id,
+                ledger.department_id,
+                day,
+                func.max(ledger.domain_id),
+                func.sum(case(
+                    (ledger.transaction_type == "IN",
+                     ledger.quantity), else_=0)),
+                func.sum(case(
+                    (ledger.transaction_type == "OUT",
+                     ledger.quantity), else_=0)),
+            )
+            .group_by(
+                ledger.consumable_id,
+                ledger.department_id,
+                day
+            )
+        )
+    )
+    db.session.commit()
+    return result.rowcount
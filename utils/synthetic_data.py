@@ -0,0 +1,295 @@
+import random
+from datetime import datetime, timedelta
+from faker import Faker
+from sqlalchemy import insert, select, func
+from app.extensions import db, bcrypt
+from app.models.v1 import (
+    Domain, Role, Department, Location, Category, Status, User, Asset,
+    Software, software_asset_association, Consumables, StockTransaction,
+    AssetLoan, AssetTransfer, Provider, ExternalMaintenance)
+from utils.stock_helpers import backfill_consumption_rollups
+from utils.counter_helpers import reconcile_domain_counters
+
+SYNTHETIC_PASSWORD = "Synthetic123!"
+# Default point in time seeded datasets are generated back from, so a seed
+# reproduces the timestamps as well as the rows.
+SEEDED_ANCHOR = datetime(2026, 1, 1)
+
+CATEGORY_NAMES = (
+    "Computers:Laptop", "Computers:Desktop", "Computers:Server",
+    "Network:Switch", "Network:Router", "Network:Access Point",
+    "Peripherals:Printer", "Peripherals:Monitor", "Mobile:Phone",
+    "Mobile:Tablet",
+)
+STATUS_NAMES = ("new", "deployed", "in repair", "retired")
+ROLE_NAMES = ("admin", "staff", "technician")
+MAINTENANCE_TYPES = ("REPAIR", "REFURBISH", "CALIBRATION", "UPGRADE", "OTHER")
+MAINTENANCE_STATUSES = ("SENT", "IN_PROGRESS", "RETURNED", "CANCELLED")
+
+
+def _insert_rows(table, rows, chunk_size):
+    """
+    Insert an iterable of row dicts with chunked executemany.
+
+    Rows bypass the ORM unit of work and are committed chunk by chunk, so
+    memory stays flat however many rows the generator yields.
+
+    Returns:
+        int: Number of rows inserted.
+    """
+    total, chunk = 0, []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            db.session.execute(insert(table), chunk)
+            db.session.commit()
+            total += len(chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(insert(table), chunk)
+        db.session.commit()
+        total += len(chunk)
+    return total
+
+
+def _ids_by_domain(model, *columns):
+    """Map domain_id to the ids (or id tuples) of a seeded model."""
+    selected = [model.id, *columns] if columns else [model.id]
+    ids = {}
+    for row in db.session.execute(
+            select(model.domain_id, *selected).order_by(model.id)):
+        ids.setdefault(row[0], []).append(row[1:] if columns else row[1])
+    return ids
+
+
+def generate_synthetic_data(domains=5, assets=10000, transactions=100000,
+                            seed=None, chunk_size=10000, anchor=None):
+    """
+    Populate the database with a realistic, proportional synthetic tenant
+    population for load and performance testing.
+
+    Departments, locations, categories, statuses and roles are fixed per
+    domain; users, software, consumables, providers, loans, transfers and
+    maintenance records scale with the number of assets. Every user gets
+    the SYNTHETIC_PASSWORD and the first user of each domain is an admin.
+    Timestamps and dates lie around `anchor`, and the same seed and
+    anchor always yield the same data.
+
+    Args:
+        domains (int): Number of domains to create.
+        assets (int): Total assets, spread evenly over the domains.
+        transactions (int): Total stock transactions.
+        seed (int | None): Seed for Faker and the random generator.
+        chunk_size (int): Rows per executemany batch.
+        anchor (datetime | None): The generated "now". Defaults to
+            SEEDED_ANCHOR when seeded and to the current time otherwise.
+
+    Returns:
+        dict: Number of rows inserted per table.
+    """
+    fake = Faker()
+    rng = random.Random(seed)
+    if seed is not None:
+        fake.seed_instance(seed)
+    per_domain = max(1, assets // max(domains, 1))
+    if anchor is None:
+        anchor = SEEDED_ANCHOR if seed is not None else datetime.now()
+    now = anchor.replace(microsecond=0)
+    password = bcrypt.generate_password_hash(
+        SYNTHETIC_PASSWORD).decode("utf-8")
+    counts = {}
+
+    def seed_table(model, rows):
+        table = getattr(model, "__table__", model)
+        counts[table.name] = _insert_rows(table, rows, chunk_size)
+
+    start_id = (db.session.execute(
+        select(func.max(Domain.id))).scalar() or 0) + 1
+    seed_table(Domain, (
+        {"name": f"{fake.company()} {n}",
+         "description": fake.catch_phrase()}
+        for n in range(start_id, start_id + domains)))
+    domain_ids = list(db.session.execute(
+        select(Domain.id).where(Domain.id >= start_id).order_by(Domain.id)
+    ).scalars())
+
+    seed_table(Role, (
+        {"name": name, "permissions": "create,read,update,delete",
+         "domain_id": d} for d in domain_ids for name in ROLE_NAMES))
+    seed_table(Department, (
+        {"name": fake.job()[:100], "domain_id": d}
+        for d in domain_ids for _ in range(6)))
+    seed_table(Location, (
+        {"name": fake.city(), "address": fake.street_address(),
+         "domain_id": d} for d in domain_ids for _ in range(8)))
+    seed_table(Category, (
+        {"name": name, "description": fake.sentence(), "domain_id": d}
+        for d in domain_ids for name in CATEGORY_NAMES))
+    seed_table(Status, (
+        {"name": name, "description": fake.sentence(), "domain_id": d}
+        for d in domain_ids for name in STATUS_NAMES))
+    roles = _ids_by_domain(Role)
+    departments = _ids_by_domain(Department)
+    locations = _ids_by_domain(Location)
+    categories = _ids_by_domain(Category)
+    statuses = _ids_by_domain(Status)
+
+    users_per_domain = max(5, per_domain // 10)
+    seed_table(User, (
+        {"fullname": fake.name(),
+         "email": f"user{n}.{d}@{fake.domain_name()}",
+         "password": password,
+         "payroll_no": f"P{d:03d}{n:06d}",
+         "is_active": n == 0 or rng.random() > 0.05,
+         "role_id": roles[d][0] if n == 0 else rng.choice(roles[d]),
+         "department_id": rng.choice(departments[d]),
+         "domain_id": d}
+        for d in domain_ids for n in range(users_per_domain)))
+    users = _ids_by_domain(User)
+
+    def asset_rows():
+        for d in domain_ids:
+            for n in range(per_domain):
+                purchased = now - timedelta(days=rng.randint(0, 2000))
+                yield {
+                    "asset_tag": f"SYN{d:04d}{n:07d}",
+                    "fresha_tag": f"SYNF{d:04d}{n:07d}",
+                    "serial_number": f"SYNS{d:04d}{n:07d}",
+                    "name": f"{fake.word().title()} {fake.word().title()}",
+                    "model_number": fake.bothify("??-####").upper(),
+                    "category_id": rng.choice(categories[d]),
+                    "assigned_to": rng.choice(users[d]),
+                    "location_id": rng.choice(locations[d]),
+                    "status_id": rng.choice(statuses[d]),
+                    "department_id": rng.choice(departments[d]),
+                    "purchase_date": purchased.date(),
+                    "warranty_expiry": (
+                        purchased + timedelta(days=1095)).date(),
+                    "configuration": fake.sentence(nb_words=8),
+                    "domain_id": d,
+                }
+    seed_table(Asset, asset_rows())
+    asset_ids = _ids_by_domain(Asset, Asset.location_id, Asset.assigned_to)
+
+    seed_table(Software, (
+        {"name": fake.word().title(),
+         "version": f"{rng.randint(1, 30)}.{rng.randint(0, 9)}",
+         "license_key": fake.bothify("????-####-????-####").upper(),
+         "expiry_date": (now + timedelta(days=rng.randint(-365, 730))).date(),
+         "domain_id": d}
+        for d in domain_ids for _ in range(max(5, per_domain // 20))))
+    software = _ids_by_domain(Software)
+    seed_table(software_asset_association, (
+        {"software_id": rng.choice(software[d]), "asset_id": asset_id}
+        for d in domain_ids for asset_id, _, _ in asset_ids.get(d, [])
+        if rng.random() < 0.5))
+
+    seed_table(Consumables, (
+        {"name": f"{fake.word().title()} {fake.bothify('###-??').upper()} "
+                 f"{d}-{n}",
+         "category": rng.choice(("Storage", "Cables", "Toner", "Batteries")),
+         "brand": fake.company()[:100],
+         "model": fake.bothify("??###").upper(),
+         "unit_of_measure": "Piece",
+         "reorder_level": rng.randint(5, 30),
+         "quantity": rng.randint(0, 500),
+         "location_id": rng.choice(locations[d]),
+         "domain_id": d}
+        for d in domain_ids for n in range(max(10, per_domain // 40))))
+    consumables = _ids_by_domain(Consumables)
+
+    def transaction_rows():
+        for n in range(transactions):
+            d = domain_ids[n % len(domain_ids)]
+            yield {
+                "consumable_id": rng.choice(consumables[d]),
+                "department_id": rng.choice(departments[d]),
+                "transaction_type": "OUT" if rng.random() < 0.7 else "IN",
+                "quantity": rng.randint(1, 20),
+                "user_id": rng.choice(users[d]),
+                "created_at": now - timedelta(
+                    minutes=rng.randint(0, 525600)),
+                "domain_id": d,
+            }
+    seed_table(StockTransaction, transaction_rows())
+
+    def loan_rows():
+        for d in domain_ids:
+            for asset_id, _, _ in rng.sample(
+                    asset_ids[d], len(asset_ids[d]) // 10):
+                loaned = now - timedelta(days=rng.randint(0, 365))
+                expected = loaned + timedelta(days=rng.randint(1, 30))
+                returned = expected < now and rng.random() < 0.8
+                yield {
+                    "asset_id": asset_id,
+                    "borrower_id": rng.choice(users[d]),
+                    "loan_date": loaned,
+                    "expected_return_date": expected,
+                    "actual_return_date": expected if returned else None,
+                    "status": "RETURNED" if returned else
+                        "OVERDUE" if expected < now else "BORROWED",
+                    "condition_before": "Good",
+                    "remarks": fake.sentence(),
+                    "domain_id": d,
+                }
+    seed_table(AssetLoan, loan_rows())
+
+    def transfer_rows():
+        for d in domain_ids:
+            for asset_id, location_id, assigned_to in rng.sample(
+                    asset_ids[d], len(asset_ids[d]) // 5):
+                yield {
+                    "asset_id": asset_id,
+                    "from_location_id": location_id,
+                    "to_location_id": rng.choice(locations[d]),
+                    "transferred_from": assigned_to,
+                    "transferred_to": rng.choice(users[d]),
+                    "notes": fake.sentence(),
+                    "created_at": now - timedelta(days=rng.randint(0, 720)),
+                    "domain_id": d,
+                }
+    seed_table(AssetTransfer, transfer_rows())
+
+    seed_table(Provider, (
+        {"name": f"{fake.company()} {d}-{n}",
+         "contact_person": fake.name(),
+         "email": fake.company_email(),
+         "phone": fake.phone_number(),
+         "address": fake.address().replace("\n", ", "),
+         "provider_type": rng.choice(("COMPANY", "INDIVIDUAL")),
+         "domain_id": d}
+        for d in domain_ids for n in range(max(2, per_domain // 200))))
+    providers = _ids_by_domain(Provider)
+
+    def maintenance_rows():
+        for d in domain_ids:
+            for n, (asset_id, _, _) in enumerate(rng.sample(
+                    asset_ids[d], len(asset_ids[d]) // 20)):
+                sent = now - timedelta(days=rng.randint(0, 365))
+                status = rng.choice(MAINTENANCE_STATUSES)
+                estimate = round(rng.uniform(20, 2000), 2)
+                yield {
+                    "asset_id": asset_id,
+                    "provider_id": rng.choice(providers[d]),
+                    "maintenance_type": rng.choice(MAINTENANCE_TYPES),
+                    "description": fake.sentence(),
+                    "sent_date": sent,
+                    "expected_return_date": sent + timedelta(
+                        days=rng.randint(3, 30)),
+                    "actual_return_date": (
+                        sent + timedelta(days=rng.randint(3, 40))
+                        if status == "RETURNED" else None),
+                    "cost_estimate": estimate,
+                    "actual_cost": (
+                        round(estimate * rng.uniform(0.8, 1.3), 2)
+                        if status == "RETURNED" else None),
+                    "status": status,
+                    "receipt_number": f"SYN-{d:04d}-{n:07d}",
+                    "collected_by": fake.name(),
+                    "domain_id": d,
+                }
+    seed_table(ExternalMaintenance, maintenance_rows())
+
+    backfill_consumption_rollups()
+    reconcile_domain_counters()
+    return counts
@@ -7,6 +7,11 @@ from flask_jwt_extended import get_jwt, get_jwt_identity
 from datetime import datetime, timezone
 from app.extensions import db, scheduler
 from app.models.v1 import RevokedToken, User, ExternalMaintenance
+from utils.stock_helpers import take_stock_snapshots
+from utils.counter_helpers import reconcile_domain_counters
+from utils.archive_helpers import archive_old_rows
+from utils.loan_helpers import mark_overdue_loans
+from utils.metrics import metrics
 
 
 def is_token_revoked(decoded_token):
@@ -58,7 +63,21 @@ def clear_expired_tokens_with_context(app):
     Run cleanup inside the Flask app context.
     """
     with app.app_context():
-        clear_expired_tokens()
+        with metrics.timed(
+                "scheduler_job_duration_seconds", job="clear_revoked_tokens"):
+            clear_expired_tokens()
+        metrics.flush()
+
+
+def run_job_with_context(app, job):
+    """
+    Run a scheduled job inside the Flask app context.
+    """
+    with app.app_context():
+        with metrics.timed(
+                "scheduler_job_duration_seconds", job=job.__name__):
+            job()
+        metrics.flush()
 
 
 def init_scheduler(app):
@@ -71,6 +90,39 @@ def init_scheduler(app):
             replace_existing=True,
             max_instances=1,
         )
+        scheduler.add_job(
+            func=lambda: run_job_with_context(app, take_stock_snapshots),
+            trigger="cron",
+            hour=app.config.get("STOCK_SNAPSHOT_HOUR", 0),
+            id="take_stock_snapshots",
+            replace_existing=True,
+            max_instances=1,
+        )
+        scheduler.add_job(
+            func=lambda: run_job_with_context(
+                app, reconcile_domain_counters),
+            trigger="interval",
+            minutes=app.config.get("COUNTER_RECONCILE_MINUTES", 60),
+            id="reconcile_domain_counters",
+            replace_existing=True,
+            max_instances=1,
+        )
+        scheduler.add_job(
+            func=lambda: run_job_with_context(app, archive_old_rows),
+            trigger="cron",
+            hour=app.config.get("ARCHIVE_HOUR", 2),
+            id="archive_old_rows",
+            replace_existing=True,
+            max_instances=1,
+        )
+        scheduler.add_job(
+            func=lambda: run_job_with_context(app, mark_overdue_loans),
+            trigger="interval",
+            minutes=app.config.get("OVERDUE_SWEEP_MINUTES", 15),
+            id="mark_overdue_loans",
+            replace_existing=True,
+            max_instances=1,
+        )
         app.logger.info("Scheduler job scheduled successfully.")
     except Exception as e:
         app.logger.warning(f"Scheduler job not started: {e}")
@@ -1,4 +1,5 @@
-from marshmallow import Schema, fields, validate, validates, ValidationError
+from marshmallow import (
+    Schema, fields, validate, validates, validates_schema, ValidationError)
 from datetime import datetime, timezone
 import re
 from app.extensions import db
@@ -219,3 +220,67 @@ class UpdateAssetSchema(Schema):
                 raise ValidationError(
                     f"Asset with serial number '{value}' already exists."
                 )
+
+
+ASSET_FILTER_KEYS = (
+    "name", "asset_tag", "serial_number", "model_number",
+    "category", "assigned_to", "location", "department"
+)
+
+
+class BulkAssetChangesSchema(Schema):
+    """
+    Marshmallow schema for the field changes of a bulk asset update.
+    """
+
+    status_id = fields.Int(required=False, allow_none=True)
+    location_id = fields.Int(required=False, allow_none=True)
+    department_id = fields.Int(required=False, allow_none=True)
+    assigned_to = fields.Int(required=False, allow_none=True)
+
+    @validates("status_id")
+    def validate_status_id(self, value):
+        if value and not db.session.get(Status, value):
+            raise ValidationError(f"Status with id {value} does not exist.")
+
+    @validates("location_id")
+    def validate_location_id(self, value):
+        if value and not db.session.get(Location, value):
+            raise ValidationError(f"Location with id {value} does not exist.")
+
+    @validates("department_id")
+    def validate_department_id(self, value):
+        if value and not db.session.get(Department, value):
+            raise ValidationError(
+                f"Department with id {value} does not exist.")
+
+    @validates("assigned_to")
+    def validate_assigned_to(self, value):
+        if value and not db.session.get(User, value):
+            raise ValidationError(f"User with id {value} does not exist.")
+
+    @validates_schema
+    def validate_not_empty(self, data, **kwargs):
+        if not data:
+            raise ValidationError("Provide at least one field to change.")
+
+
+class BulkUpdateAssetSchema(Schema):
+    """
+    Marshmallow schema for validating bulk asset updates. Assets are
+    selected either by asset_ids or by the same filters as asset search.
+    """
+
+    asset_ids = fields.List(fields.Int(), validate=validate.Length(min=1))
+    filters = fields.Dict(
+        keys=fields.Str(validate=validate.OneOf(ASSET_FILTER_KEYS)),
+        values=fields.Str(validate=validate.Length(min=1)),
+        validate=validate.Length(min=1)
+    )
+    changes = fields.Nested(BulkAssetChangesSchema, required=True)
+
+    @validates_schema
+    def validate_selector(self, data, **kwargs):
+        if ("asset_ids" in data) == ("filters" in data):
+            raise ValidationError(
+                "Provide exactly one selector: asset_ids or filters.")
@@ -1,4 +1,5 @@
-from marshmallow import fields, validates, ValidationError, validates_schema 
+from marshmallow import (
+    fields, validate, validates, ValidationError, validates_schema)
 from app.extensions import ma, db
 from app.models.v1 import Asset, Location, User
 
@@ -109,3 +110,44 @@ class UpdateATSchema(ma.Schema):
         """
         self.context["asset_id"] = data.get("asset_id")
         super().validate(data, **kwargs)
+
+
+class BulkATSchema(ma.Schema):
+    """
+    Marshmallow schema for validating bulk AssetTransfer requests.
+    Exactly one selector (asset_ids, location_id or assigned_to) picks
+    the assets; to_location_id and the optional transferred_to describe
+    the destination.
+    """
+
+    asset_ids = fields.List(
+        fields.Integer(), validate=validate.Length(min=1))
+    location_id = fields.Integer()
+    assigned_to = fields.Integer()
+    to_location_id = fields.Integer(required=True)
+    transferred_to = fields.Integer()
+    notes = fields.String(required=True)
+
+    @validates("to_location_id")
+    def validate_to_location_id(self, value):
+        """Validate that the to_location exists."""
+        if not db.session.get(Location, value):
+            raise ValidationError(f"Location with id {value} does not exist.")
+
+    @validates("transferred_to")
+    def validate_transferred_to(self, value):
+        """Validate that the receiving user exists."""
+        if not db.session.get(User, value):
+            raise ValidationError(f"User with id {value} does not exist.")
+
+    @validates_schema
+    def validate_selector(self, data, **kwargs):
+        """Ensure exactly one asset selector is provided."""
+        selectors = [
+            key for key in ("asset_ids", "location_id", "assigned_to")
+            if data.get(key) is not None
+        ]
+        if len(selectors) != 1:
+            raise ValidationError(
+                "Provide exactly one selector: asset_ids, location_id " +
+                "or assigned_to.")
@@ -107,4 +107,25 @@ class UpdatePasswordSchema(ma.Schema):
     @validates_schema
     def validate_passwords(self, data, **kwargs):
         if data.get("new_password") != data.get("confirm_password"):
-            raise ValidationError("Passwords must match.", field_name="confirm_password")
\ No newline at end of file
+            raise ValidationError("Passwords must match.", field_name="confirm_password")
+
+class BulkUserSchema(ma.Schema):
+    """
+    Validates one row of a bulk user import. Uniqueness and foreign keys
+    are checked for the whole batch at once by the caller, so this schema
+    does not query the database per row.
+    """
+    fullname = fields.Str(
+        required=True, validate=validate.Length(min=1, max=120))
+    email = fields.Email(required=True, validate=validate.Length(max=120))
+    role_id = fields.Integer(required=True)
+    department_id = fields.Integer(required=True)
+    payroll_no = fields.Str(required=True, validate=validate.Length(min=1))
+    is_active = fields.Integer(required=False)
+
+    @post_load
+    def process_fields(self, data, **kwargs):
+        """normalize fullname and email."""
+        data['fullname'] = data['fullname'].title()
+        data['email'] = data['email'].lower()
+        return data
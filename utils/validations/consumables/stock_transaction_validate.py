@@ -19,3 +19,30 @@ class StockTransactionSchema(ma.Schema):
         if value is not None and value < 0:
             raise ValidationError(
                 "Quantity level must be a non-negative integer.")
+
+
+class StockLineSchema(StockTransactionSchema):
+    """
+    A single line of a bulk stock movement. Unlike a standalone
+    transaction, every line must state its type and a positive quantity.
+    """
+    quantity = fields.Integer(
+        required=True,
+        validate=validate.Range(
+            min=1, error="Quantity must be a positive integer."))
+    transaction_type = fields.String(
+        required=True,
+        validate=validate.OneOf(
+            ["IN", "OUT"],
+            error=(
+                "The 'transaction_type' must be one of: 'IN' or 'OUT' "
+            )))
+
+
+class BulkStockTransactionSchema(ma.Schema):
+    transactions = fields.List(
+        fields.Nested(StockLineSchema),
+        required=True,
+        validate=validate.Length(
+            min=1, max=1000,
+            error="Provide between 1 and 1000 transactions."))